@@ -10,7 +10,7 @@ AtomSpace. However, it is a bit hard to use; the Atomese-style
 python is easier. See `create_atoms.py` for a simpler variant.
 """
 
-from opencog.atomspace import AtomSpace, Atom
+from opencog.atomspace import AtomSpace, Atom, Builder
 from opencog.type_constructors import FloatValue, StringValue
 from opencog.atomspace import types
 
@@ -48,6 +48,15 @@ a.add_link(inh_type, [A, B])
 a.add_link(inh_type, [B, C])
 a.add_link(inh_type, [A, C])
 
+# A Builder offers the same Atom type names as the type constructors,
+# but always works on the one AtomSpace it was made for. In deferred
+# mode, it queues the Atoms, and then inserts them all in one batch.
+b = Builder(a)
+with b.defer():
+    for i in range(1000):
+        b.Member(b.Number(i), b.Concept("numbers"))
+print("After bulk insert, the atomspace size is", a.size())
+
 # A verbose way of writing M = MeetLink(VariableNode('x"))
 V = a.add_node(types.VariableNode, "x")
 M = a.add_link(types.MeetLink, [V])
@@ -0,0 +1,45 @@
+#! /usr/bin/env python3
+
+"""
+Checks the time taken to import the python bindings
+
+Each import is done in a fresh interpreter, REPEATS times, and the
+best time is displayed. Also displayed is the time taken by the first
+use of an Atom type constructor, which is when that constructor gets
+created.
+"""
+
+import subprocess
+import sys
+
+REPEATS = 10
+
+IMPORT = """
+import time
+start = time.perf_counter()
+import {0}
+print(time.perf_counter() - start)
+"""
+
+FIRST_USE = """
+import time
+import opencog.type_constructors as tc
+start = time.perf_counter()
+tc.ConceptNode
+print(time.perf_counter() - start)
+"""
+
+def best_of(code):
+    times = []
+    for _ in range(REPEATS):
+        out = subprocess.run([sys.executable, "-c", code], check=True,
+                             stdout=subprocess.PIPE).stdout
+        times.append(float(out))
+    return min(times)
+
+for module in ["opencog.atomspace", "opencog.type_constructors"]:
+    print("{0:>28}: {1:.2f} ms".format("import " + module,
+          1000 * best_of(IMPORT.format(module))))
+
+print("{0:>28}: {1:.2f} ms".format("first ConceptNode lookup",
+      1000 * best_of(FIRST_USE)))
@@ -35,9 +35,8 @@ myatom = ConceptNode('foo')
 print(get_type_name(myatom.type) + '\n')
 
 # Print a list of the currently loaded type names and numbers
-for key, value in sorted(types.__dict__.items()):
-    if '__' not in key:
-        print(key, value)
+for key, value in sorted(typedict.items()):
+    print(key, value)
 
 
 # THE END. That's All, Folks!
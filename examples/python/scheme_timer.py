@@ -3,31 +3,58 @@
 """
 Checks the execution time of repeated calls to the Scheme API from Python
 
-Runs an empty Scheme command NUMBER_OF_ITERATIONS times and displays the
-total execution time
+Runs the same Scheme command NUMBER_OF_ITERATIONS times, in each of the
+available modes, and displays the calls per second of each:
+
+  eval_h     -- scheme_eval_h(), one string parse per call
+  compiled   -- a scheme_compile()'d expression, called repeatedly
+  compiled+1 -- the same, with one Atom passed in as a parameter
+  many       -- scheme_eval_many(), one evaluator setup for all calls
 """
 
 __author__ = 'Cosmo Harrigan'
 
-from opencog.atomspace import AtomSpace, TruthValue
-from opencog.scheme_wrapper import scheme_eval, scheme_eval_h
+import timeit
+
+from opencog.atomspace import AtomSpace
+from opencog.type_constructors import ConceptNode
+from opencog.utilities import initialize_opencog
+from opencog.scheme import (scheme_eval, scheme_eval_h, scheme_eval_many,
+                            scheme_compile)
+
 atomspace = AtomSpace()
+initialize_opencog(atomspace)
+scheme_eval(atomspace, "(use-modules (opencog))")
 
 NUMBER_OF_ITERATIONS = 50000
+EXPR = '(Concept "foo")'
+
+compiled = scheme_compile(EXPR)
+compiled_1 = scheme_compile('(Inheritance x (Concept "foo"))', ["x"])
+bar = ConceptNode("bar")
 
-def test_operation():
+def eval_h():
     for _ in range(NUMBER_OF_ITERATIONS):
-        # scheme_eval(atomspace, '(+ 2 2)')
-        scheme_eval_h(atomspace, '(Concept "foo")')
-        # scheme_eval_h(atomspace, '(Number ' + str(i) + ')')
+        scheme_eval_h(atomspace, EXPR)
 
-import timeit
-elapsed = timeit.timeit("test_operation()",
-                        setup="from __main__ import test_operation",
-                        number=1)
+def call_compiled():
+    for _ in range(NUMBER_OF_ITERATIONS):
+        compiled(atomspace)
+
+def call_compiled_1():
+    for _ in range(NUMBER_OF_ITERATIONS):
+        compiled_1(atomspace, bar)
+
+def eval_many():
+    scheme_eval_many(atomspace, [EXPR] * NUMBER_OF_ITERATIONS)
 
-def report():
-    print ("{0} seconds elapsed performing {1} repeated calls = {2} calls / sec".\
-        format(elapsed, NUMBER_OF_ITERATIONS, NUMBER_OF_ITERATIONS / elapsed))
+def report(mode, elapsed):
+    print("{0:>11}: {1:.3f} seconds elapsed performing {2} repeated calls"
+          " = {3:.0f} calls / sec".format(mode, elapsed,
+              NUMBER_OF_ITERATIONS, NUMBER_OF_ITERATIONS / elapsed))
 
-report()
+for mode, func in [("eval_h", eval_h),
+                   ("compiled", call_compiled),
+                   ("compiled+1", call_compiled_1),
+                   ("many", eval_many)]:
+    report(mode, timeit.timeit(func, number=1))
@@ -114,6 +114,13 @@ void GroundedPredicateNode::init()
 		return;
 	}
 
+	// A batch gives a LinkValue of results, not a TruthValue, so it
+	// cannot be evaluated. Use a GroundedSchemaNode instead.
+	if (0 == schema.compare(0, 9, "py-batch:", 9))
+		throw InvalidParamException(TRACE_INFO,
+			"A GroundedPredicateNode cannot use py-batch:, "
+			"use a GroundedSchemaNode instead: %s", schema.c_str());
+
 	if (0 == schema.compare(0, 4, "lib:", 4))
 	{
 		_runner = new LibraryRunner(schema);
@@ -106,6 +106,21 @@ void GroundedSchemaNode::init()
 		return;
 	}
 
+	// Call python just once, for a whole batch of arguments.
+	if (0 == schema.compare(0, 9, "py-batch:", 9))
+	{
+#ifdef HAVE_CYTHON
+		size_t pos = 9;
+		while (' ' == schema[pos]) pos++;
+		_runner = new PythonRunner(schema.substr(pos), true);
+#else
+		throw RuntimeException(TRACE_INFO,
+		       "This binary does not have python support in it; "
+		       "Cannot evaluate python GroundedSchemaNode!");
+#endif /* HAVE_CYTHON */
+		return;
+	}
+
 	if (0 == schema.compare(0, 4, "lib:", 4))
 	{
 		_runner = new LibraryRunner(schema);
@@ -21,6 +21,7 @@
  * 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
  */
 
+#include <opencog/atoms/value/LinkValue.h>
 #include <opencog/atoms/value/Value.h>
 #include <opencog/atomspace/AtomSpace.h>
 #include <opencog/cython/PythonEval.h>
@@ -35,13 +36,63 @@
 
 using namespace opencog;
 
-PythonRunner::PythonRunner(std::string s)
-	: _fname(s)
+PythonRunner::PythonRunner(std::string s, bool batch)
+	: _fname(s), _batch(batch)
 {
 }
 
 // ----------------------------------------------------------
 
+/// Unpack the arguments for a batch call. The batch can be any Link,
+/// or any LinkValue, such as the QueueValue returned by a MeetLink;
+/// each element is one set of arguments. If the argument is itself
+/// executable (e.g. a GetLink or MeetLink), it is executed first,
+/// and its results become the batch.
+HandleSeq PythonRunner::get_batch(AtomSpace* as,
+                                  const ValuePtr& vargs,
+                                  bool silent)
+{
+	ValuePtr vbatch(vargs);
+	if (vargs->is_atom() and HandleCast(vargs)->is_executable())
+		vbatch = HandleCast(vargs)->execute(as, silent);
+
+	HandleSeq batch;
+	if (vbatch->is_link())
+		batch = HandleCast(vbatch)->getOutgoingSet();
+	else if (nameserver().isA(vbatch->get_type(), LINK_VALUE))
+	{
+		for (const ValuePtr& v : LinkValueCast(vbatch)->value())
+		{
+			if (not v->is_atom())
+				throw SyntaxException(TRACE_INFO,
+					"PythonRunner: Expecting batch of Atoms; got %s",
+					v->to_string().c_str());
+			batch.emplace_back(HandleCast(v));
+		}
+	}
+	else
+		throw SyntaxException(TRACE_INFO,
+			"PythonRunner: Expecting a batch of arguments; got %s",
+			vbatch->to_string().c_str());
+
+	// As below, the callee expects the arguments to be in the
+	// atomspace.
+	for (Handle& h : batch)
+		h = as->add_atom(h);
+	return batch;
+}
+
+ValuePtr PythonRunner::apply_batch(AtomSpace* as,
+                                   const ValuePtr& vargs,
+                                   bool silent)
+{
+	HandleSeq batch(get_batch(as, vargs, silent));
+	PythonEval* applier = get_evaluator_for_python(as);
+	return createLinkValue(applier->apply_batch(as, _fname, batch));
+}
+
+// ----------------------------------------------------------
+
 /// `execute()` -- evaluate a PythonRunner with arguments.
 ///
 /// Expects "args" to be a ListLink. These arguments will be
@@ -51,6 +102,8 @@ ValuePtr PythonRunner::execute(AtomSpace* as,
                                const ValuePtr& vargs,
                                bool silent)
 {
+	if (_batch) return apply_batch(as, vargs, silent);
+
 	if (not vargs->is_atom())
 		throw SyntaxException(TRACE_INFO,
 			"PythonRunner: Expecting Handle; got %s",
@@ -73,6 +126,8 @@ ValuePtr PythonRunner::evaluate(AtomSpace* as,
                                 const ValuePtr& vargs,
                                 bool silent)
 {
+	// Batches are only run by GroundedSchemaNodes; see
+	// GroundedPredicateNode::init().
 	if (not vargs->is_atom())
 		throw SyntaxException(TRACE_INFO,
 			"PythonRunner: Expecting Handle; got %s",
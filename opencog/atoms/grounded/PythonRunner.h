@@ -34,12 +34,20 @@ namespace opencog
  */
 
 /// Base class for executing Python code.
+///
+/// In batch mode (the "py-batch:" prefix), the python function is
+/// called just once, for a whole collection of arguments, and a
+/// LinkValue holding one result per argument is returned.
 class PythonRunner : public Runner
 {
 	std::string _fname;
+	bool _batch;
+
+	HandleSeq get_batch(AtomSpace*, const ValuePtr&, bool);
+	ValuePtr apply_batch(AtomSpace*, const ValuePtr&, bool);
 
 public:
-	PythonRunner(const std::string);
+	PythonRunner(const std::string, bool batch=false);
 	PythonRunner(const PythonRunner&) = delete;
 	PythonRunner& operator=(const PythonRunner&) = delete;
 
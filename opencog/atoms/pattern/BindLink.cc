@@ -63,7 +63,7 @@ BindLink::BindLink(const HandleSeq&& hseq, Type t)
 /* ================================================================= */
 
 /** Wrap query results in a SetLink, place them in the AtomSpace. */
-ValuePtr BindLink::execute(AtomSpace* as, bool silent)
+Handle BindLink::rewrite_set(AtomSpace* as, bool silent)
 {
 	ContainerValuePtr cv(do_execute(as, silent));
 	OC_ASSERT(cv->is_closed(), "Unexpected queue state!");
@@ -84,6 +84,12 @@ ValuePtr BindLink::execute(AtomSpace* as, bool silent)
 	return rewr;
 }
 
+ValuePtr BindLink::execute(AtomSpace* as, bool silent)
+{
+	return cached_execute(as ? as : _atom_space,
+		[&] { return rewrite_set(as, silent); });
+}
+
 DEFINE_LINK_FACTORY(BindLink, BIND_LINK)
 
 /* ===================== END OF FILE ===================== */
@@ -33,6 +33,7 @@ class BindLink : public QueryLink
 {
 protected:
 	void init(void);
+	Handle rewrite_set(AtomSpace*, bool silent);
 
 public:
 	BindLink(const HandleSeq&&, Type=BIND_LINK);
@@ -48,7 +48,7 @@ GetLink::GetLink(const HandleSeq&& hseq, Type t)
 
 /* ================================================================= */
 
-ValuePtr GetLink::execute(AtomSpace* as, bool silent)
+Handle GetLink::satisfying_set(AtomSpace* as, bool silent)
 {
 	ContainerValuePtr cv(MeetLink::do_execute(as, silent));
 	OC_ASSERT(cv->is_closed(), "Unexpected queue state!");
@@ -68,6 +68,12 @@ ValuePtr GetLink::execute(AtomSpace* as, bool silent)
 	return satset;
 }
 
+ValuePtr GetLink::execute(AtomSpace* as, bool silent)
+{
+	return cached_execute(as ? as : _atom_space,
+		[&] { return satisfying_set(as, silent); });
+}
+
 DEFINE_LINK_FACTORY(GetLink, GET_LINK)
 
 /* ===================== END OF FILE ===================== */
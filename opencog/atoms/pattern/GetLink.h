@@ -33,6 +33,7 @@ class GetLink : public MeetLink
 {
 protected:
 	void init(void);
+	Handle satisfying_set(AtomSpace*, bool silent);
 
 public:
 	GetLink(const HandleSeq&&, Type=GET_LINK);
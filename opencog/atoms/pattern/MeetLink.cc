@@ -82,7 +82,8 @@ ContainerValuePtr MeetLink::do_execute(AtomSpace* as, bool silent)
 
 ValuePtr MeetLink::execute(AtomSpace* as, bool silent)
 {
-	return do_execute(as, silent);
+	return cached_execute(as ? as : _atom_space,
+		[&] { return do_execute(as, silent); });
 }
 
 DEFINE_LINK_FACTORY(MeetLink, MEET_LINK)
@@ -29,8 +29,10 @@
 #include <opencog/atoms/core/FindUtils.h>
 #include <opencog/atoms/core/FreeLink.h>
 #include <opencog/atoms/core/NumberNode.h>
+#include <opencog/atoms/value/QueueValue.h>
 #include <opencog/atoms/value/UnisetValue.h>
 #include <opencog/atomspace/AtomSpace.h>
+#include <opencog/query/QueryProfile.h>
 
 #include "BindLink.h"
 #include "DualLink.h"
@@ -1387,6 +1389,123 @@ void PatternLink::check_connectivity(const HandleSeqSeq& components)
 	throw InvalidParamException(TRACE_INFO, "%s", ss.str().c_str());
 }
 
+/* ================================================================= */
+/**
+ * Collect the types of the atoms that the results of this query
+ * depend on, for the query result cache (see QueryCache). These are
+ * the types of all of the atoms in the pattern: a new grounding can
+ * only appear, or an old one go away, if a link of the type of some
+ * clause is added or removed (removing an atom also removes the links
+ * holding it). The rewrite only depends on the groundings; the types
+ * of the atoms it creates are not watched, as running the query adds
+ * them all over again. Instead, a cache hit adds them back, in case
+ * they were removed since (see `cached_execute()`).
+ *
+ * Returns false if the results depend on anything else, and so
+ * must not be cached: on evaluatable terms (these can look at
+ * anything at all), on Values, on random numbers, or on a clause
+ * that is a variable all by itself (which can be grounded by an
+ * atom of any type).
+ */
+static bool cache_types_recursive(const Handle& h, TypeSet& types)
+{
+	static const std::vector<Type> impure = {
+		GROUNDED_PROCEDURE_NODE, DEFINED_PROCEDURE_NODE,
+		DEFINED_PREDICATE_NODE, VALUE_OF_LINK, SET_VALUE_LINK,
+		RANDOM_NUMBER_LINK, RANDOM_CHOICE_LINK };
+
+	Type t = h->get_type();
+	for (Type it : impure)
+		if (nameserver().isA(t, it)) return false;
+
+	types.insert(t);
+	if (not h->is_link()) return true;
+	for (const Handle& ho : h->getOutgoingSet())
+		if (not cache_types_recursive(ho, types)) return false;
+	return true;
+}
+
+bool PatternLink::cache_types(TypeSet& types)
+{
+	if (nullptr == _pat.body or _pat.have_evaluatables
+	    or not _pat.defined_terms.empty())
+		return false;
+
+	for (const PatternTermPtr& ptm : _pat.pmandatory)
+		if (_variables.varset.end() != _variables.varset.find(ptm->getHandle()))
+			return false;
+
+	if (not cache_types_recursive(_pat.body, types)) return false;
+
+	// The rewrite may not be impure, either.
+	TypeSet rewrite_types;
+	for (const Handle& himp : get_implicand())
+		if (not cache_types_recursive(himp, rewrite_types)) return false;
+
+	return true;
+}
+
+/**
+ * Copy a container of query results. The container that a query
+ * returns is its own result slot, which the next run of the query
+ * clears and fills again, and which consumers drain; so the cache
+ * keeps a copy, and hands out copies of that.
+ *
+ * If `as` is given, the atoms in the results are added to it; they
+ * may have been removed since they were cached.
+ */
+static ValuePtr copy_results(const ValuePtr& vp, AtomSpace* as = nullptr)
+{
+	if (nullptr == vp) return vp;
+	if (vp->is_atom())
+		return as ? as->add_atom(HandleCast(vp)) : vp;
+	if (not nameserver().isA(vp->get_type(), CONTAINER_VALUE))
+		return vp;
+
+	ValueSeq vals(std::dynamic_pointer_cast<LinkValue>(vp)->value());
+	if (as)
+	{
+		for (ValuePtr& v : vals)
+			if (v->is_atom()) v = as->add_atom(HandleCast(v));
+	}
+	if (nameserver().isA(vp->get_type(), QUEUE_VALUE))
+		return createQueueValue(vals);
+	return createUnisetValue(vals);
+}
+
+/**
+ * Run the query with `run`, going through the query cache of the
+ * AtomSpace, if it has one, and if the results can be cached.
+ */
+ValuePtr PatternLink::cached_execute(AtomSpace* as,
+                                     const std::function<ValuePtr(void)>& run)
+{
+	// A query being profiled has to actually run.
+	if (QueryProfile::current()) return run();
+
+	QueryCachePtr qc;
+	if (as) qc = as->get_query_cache();
+	if (nullptr == qc) return run();
+
+	std::call_once(_cache_once,
+		[&] { _cacheable = cache_types(_cache_types); });
+	if (not _cacheable) return run();
+
+	const Handle& self(get_handle());
+	ValuePtr vp(qc->get(self, as));
+
+	// The atoms in the results may have been removed since; their
+	// types are not watched.
+	if (vp) return copy_results(vp, as);
+
+	// Take the change counts first; anything added while the
+	// query runs makes the entry stale.
+	QueryCache::Versions vers(QueryCache::versions(as, _cache_types));
+	vp = copy_results(run());
+	qc->put(self, std::move(vers), vp);
+	return copy_results(vp);
+}
+
 /* ================================================================= */
 
 void PatternLink::debug_log(std::string msg) const
@@ -23,6 +23,8 @@
 #ifndef _OPENCOG_PATTERN_LINK_H
 #define _OPENCOG_PATTERN_LINK_H
 
+#include <functional>
+#include <mutex>
 #include <unordered_map>
 
 #include <opencog/atoms/core/Quotation.h>
@@ -154,6 +156,12 @@ protected:
 
 	virtual void setAtomSpace(AtomSpace *);
 
+	// For the query result cache; worked out on first use.
+	std::once_flag _cache_once;
+	bool _cacheable = false;
+	TypeSet _cache_types;
+	ValuePtr cached_execute(AtomSpace*, const std::function<ValuePtr(void)>&);
+
 protected:
 	// utility debug print
 	static void prt(const Handle& h)
@@ -195,6 +203,11 @@ public:
 	// Return the list virtual clauses we are holding.
 	const HandleSeq& get_virtual(void) const { return _virtual; }
 
+	// Collect the atom types that the results depend on, for the
+	// query result cache. Returns false if the results must not be
+	// cached.
+	bool cache_types(TypeSet&);
+
 	void debug_log(std::string) const;
 
 	static Handle factory(const Handle&);
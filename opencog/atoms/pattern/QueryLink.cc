@@ -183,7 +183,8 @@ ContainerValuePtr QueryLink::do_execute(AtomSpace* as, bool silent)
 
 ValuePtr QueryLink::execute(AtomSpace* as, bool silent)
 {
-	return do_execute(as, silent);
+	return cached_execute(as ? as : _atom_space,
+		[&] { return do_execute(as, silent); });
 }
 
 DEFINE_LINK_FACTORY(QueryLink, QUERY_LINK)
@@ -36,6 +36,8 @@
 #include <opencog/atoms/truthvalue/TruthValue.h>
 
 #include <opencog/atomspace/Frame.h>
+#include <opencog/atomspace/IncomingStats.h>
+#include <opencog/atomspace/QueryCache.h>
 #include <opencog/atomspace/TypeIndex.h>
 
 class AtomTableUTest;
@@ -89,6 +91,12 @@ class AtomSpace : public Frame
     // between the two different pointer types (its significant).
     std::vector<AtomSpacePtr> _environ;
 
+    /** Results of queries run in this space; null when disabled. */
+    QueryCachePtr _query_cache;
+
+    /** Incoming-set statistics, for query planning; made on first use. */
+    mutable IncomingStatsPtr _incoming_stats;
+
     /** Find out about atom type additions in the NameServer. */
     NameServer& _nameserver;
     int addedTypeConnection;
@@ -238,6 +246,32 @@ public:
     size_t get_size() const;
     size_t get_num_atoms_of_type(Type type, bool subclass=false) const;
 
+    /**
+     * Return the number of times that atoms of exactly type t were
+     * added to or removed from this AtomSpace, or the AtomSpaces it
+     * is layered on. It never goes down. Results computed from the
+     * atoms of some types are still good as long as these counts
+     * stay the same.
+     */
+    uint64_t get_type_changes(Type t) const;
+
+    /**
+     * Cache the results of up to `capacity` queries run in this
+     * AtomSpace; see `QueryCache` for what is cached, and when cached
+     * results are dropped. Zero turns the cache off (the default)
+     * and drops its contents. Changing the capacity of an enabled
+     * cache keeps the most recently used results.
+     */
+    void set_query_cache(size_t capacity);
+    QueryCachePtr get_query_cache(void) const
+        { return std::atomic_load(&_query_cache); }
+
+    /**
+     * Sampled statistics of the incoming sets of the atoms in this
+     * AtomSpace, per atom type; see `IncomingStats`.
+     */
+    IncomingStatsPtr get_incoming_stats(void) const;
+
     //! Clear the atomspace, extract all atoms.
     void clear();
 
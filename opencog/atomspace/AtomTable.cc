@@ -420,6 +420,41 @@ size_t AtomSpace::get_size() const
     return get_num_atoms_of_type(ATOM, true);
 }
 
+uint64_t AtomSpace::get_type_changes(Type t) const
+{
+    uint64_t result = typeIndex.changes(t);
+    for (const AtomSpacePtr& base : _environ)
+        result += base->get_type_changes(t);
+    return result;
+}
+
+void AtomSpace::set_query_cache(size_t capacity)
+{
+    if (0 == capacity) {
+        std::atomic_store(&_query_cache, QueryCachePtr());
+        return;
+    }
+
+    QueryCachePtr qc(get_query_cache());
+    if (qc)
+        qc->set_capacity(capacity);
+    else
+        std::atomic_store(&_query_cache,
+                          std::make_shared<QueryCache>(capacity));
+}
+
+IncomingStatsPtr AtomSpace::get_incoming_stats(void) const
+{
+    IncomingStatsPtr stats(std::atomic_load(&_incoming_stats));
+    if (stats) return stats;
+
+    // If another thread got here first, use the one it made.
+    IncomingStatsPtr fresh(std::make_shared<IncomingStats>());
+    if (std::atomic_compare_exchange_strong(&_incoming_stats, &stats, fresh))
+        return fresh;
+    return stats;
+}
+
 size_t AtomSpace::get_num_atoms_of_type(Type type, bool subclass) const
 {
     // If the flag is set, we need to deduplicate the atoms,
@@ -0,0 +1,140 @@
+/*
+ * opencog/atomspace/IncomingStats.cc
+ *
+ * Copyright (C) 2026 by The OpenCog Foundation
+ * All Rights Reserved
+ *
+ * This program is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU Affero General Public License v3 as
+ * published by the Free Software Foundation and including the exceptions
+ * at http://opencog.org/wiki/Licenses
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Affero General Public License
+ * along with this program; if not, write to:
+ * Free Software Foundation, Inc.,
+ * 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+ */
+
+#include <algorithm>
+
+#include <opencog/atoms/atom_types/NameServer.h>
+
+#include "AtomSpace.h"
+#include "IncomingStats.h"
+
+using namespace opencog;
+
+double IncomingStats::Degrees::degree(Type link_type) const
+{
+	auto it = mean_by_type.find(link_type);
+	if (mean_by_type.end() == it) return 0.0;
+	return it->second;
+}
+
+double IncomingStats::Degrees::skew(void) const
+{
+	double n = 0.0;
+	double sum = 0.0;
+	double sumsq = 0.0;
+	for (size_t i = 0; i < histogram.size(); i++)
+	{
+		if (0 == histogram[i]) continue;
+
+		// Take the middle of the bucket, 2^i - 1 to 2^(i+1) - 2.
+		double d = 1.5 * ((1UL << i) - 1);
+		n += histogram[i];
+		sum += histogram[i] * d;
+		sumsq += histogram[i] * d * d;
+	}
+	if (0.0 == sum) return 1.0;
+	return std::max(1.0, n * sumsq / (sum * sum));
+}
+
+IncomingStats::IncomingStats(size_t max_samples) :
+	_max_samples(0 < max_samples ? max_samples : 1)
+{
+}
+
+uint64_t IncomingStats::all_changes(const AtomSpace* as)
+{
+	uint64_t changes = 0;
+	Type ntypes = nameserver().getNumberOfClasses();
+	for (Type t = ATOM; t < ntypes; t++)
+		changes += as->get_type_changes(t);
+	return changes;
+}
+
+IncomingStats::Degrees IncomingStats::sample(const AtomSpace* as,
+                                             Type t) const
+{
+	Degrees deg;
+	deg.histogram.resize(NUM_BUCKETS, 0);
+
+	HandleSeq atoms;
+	as->get_handles_by_type(atoms, t);
+	deg.atoms = atoms.size();
+	if (0 == deg.atoms) return deg;
+
+	// Take evenly spaced atoms, rather than the first few, as the
+	// order of the type index is not random: atoms added together
+	// tend to be alike.
+	size_t step = (deg.atoms + _max_samples - 1) / _max_samples;
+	size_t total = 0;
+	std::map<Type, size_t> by_type;
+	for (size_t i = 0; i < deg.atoms; i += step)
+	{
+		IncomingSet iset(atoms[i]->getIncomingSet(as));
+		size_t d = iset.size();
+
+		size_t bucket = 0;
+		while (bucket + 1 < NUM_BUCKETS and (2UL << bucket) <= d + 1)
+			bucket++;
+		deg.histogram[bucket]++;
+
+		total += d;
+		for (const Handle& h : iset)
+			by_type[h->get_type()]++;
+		deg.sampled++;
+	}
+
+	deg.mean = ((double) total) / deg.sampled;
+	for (const auto& pr : by_type)
+		deg.mean_by_type[pr.first] = ((double) pr.second) / deg.sampled;
+	return deg;
+}
+
+IncomingStats::Degrees IncomingStats::get(const AtomSpace* as, Type t,
+                                          uint64_t changes)
+{
+	{
+		std::lock_guard<std::mutex> lck(_mtx);
+		auto it = _entries.find(t);
+		if (_entries.end() != it and changes <= it->second.stale_at)
+			return it->second.degrees;
+	}
+
+	// Sample without holding the lock; if two threads race here,
+	// both results are equally good.
+	Degrees deg(sample(as, t));
+
+	// Good until a tenth of the AtomSpace has changed.
+	uint64_t slack = as->get_size() / 10;
+	if (slack < 16) slack = 16;
+
+	std::lock_guard<std::mutex> lck(_mtx);
+	Entry& ent = _entries[t];
+	ent.degrees = deg;
+	ent.stale_at = changes + slack;
+	return deg;
+}
+
+void IncomingStats::clear(void)
+{
+	std::lock_guard<std::mutex> lck(_mtx);
+	_entries.clear();
+}
@@ -0,0 +1,118 @@
+/*
+ * opencog/atomspace/IncomingStats.h
+ *
+ * Copyright (C) 2026 by The OpenCog Foundation
+ * All Rights Reserved
+ *
+ * This program is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU Affero General Public License v3 as
+ * published by the Free Software Foundation and including the exceptions
+ * at http://opencog.org/wiki/Licenses
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Affero General Public License
+ * along with this program; if not, write to:
+ * Free Software Foundation, Inc.,
+ * 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+ */
+
+#ifndef _OPENCOG_INCOMING_STATS_H
+#define _OPENCOG_INCOMING_STATS_H
+
+#include <map>
+#include <memory>
+#include <mutex>
+#include <vector>
+
+#include <opencog/atoms/atom_types/types.h>
+
+namespace opencog
+{
+/** \addtogroup grp_atomspace
+ *  @{
+ */
+
+class AtomSpace;
+
+/**
+ * Sampled statistics of the incoming sets of the atoms of each type,
+ * for one AtomSpace. The query planner uses these to estimate how
+ * many groundings a clause has (see `InitiateSearchMixin::set_planner()`).
+ *
+ * The statistics of a type are gathered from a sample of its atoms
+ * the first time that they are asked for. They are gathered again
+ * once the AtomSpace has changed by more than a tenth of its size
+ * since then (as counted by `AtomSpace::get_type_changes()`); so
+ * they are approximate, and may lag behind recent changes.
+ *
+ * All methods are thread-safe.
+ */
+class IncomingStats
+{
+public:
+	/// Bucket i of the histogram holds the atoms whose incoming set
+	/// has between 2^i - 1 and 2^(i+1) - 2 links; that is, degree d
+	/// goes into bucket floor(log2(d+1)).
+	static const size_t NUM_BUCKETS = 24;
+
+	/// The incoming-set statistics of the atoms of one type.
+	struct Degrees
+	{
+		size_t atoms = 0;     ///< Atoms of the type, when sampled.
+		size_t sampled = 0;   ///< Atoms that the statistics are from.
+		std::vector<size_t> histogram;
+		double mean = 0.0;    ///< Mean incoming-set size.
+
+		/// Per link type, the mean number of links of that type
+		/// that an atom of this type appears in.
+		std::map<Type, double> mean_by_type;
+
+		double degree(Type link_type) const;
+
+		/// How skewed the degrees are: E[d^2] / E[d]^2, estimated
+		/// from the histogram. It is one when all the atoms have
+		/// about the same degree, and large when a few hubs hold
+		/// most of the links.
+		double skew(void) const;
+	};
+
+protected:
+	struct Entry
+	{
+		Degrees degrees;
+		uint64_t stale_at;    ///< Resample once all changes pass this.
+	};
+
+	mutable std::mutex _mtx;
+	size_t _max_samples;
+	std::map<Type, Entry> _entries;
+
+	Degrees sample(const AtomSpace*, Type) const;
+
+public:
+	/// Sample up to max_samples atoms of each type (at least one).
+	IncomingStats(size_t max_samples = 100);
+
+	/// The total of the change counts of all atom types in the
+	/// AtomSpace. This walks every type through every AtomSpace the
+	/// given one is layered on, so callers that look up several
+	/// types should compute it once, and pass it to get().
+	static uint64_t all_changes(const AtomSpace*);
+
+	/// The statistics of the atoms of exactly type t; changes is
+	/// `all_changes()` for the AtomSpace, at about this time.
+	Degrees get(const AtomSpace*, Type t, uint64_t changes);
+
+	void clear(void);
+};
+
+typedef std::shared_ptr<IncomingStats> IncomingStatsPtr;
+
+/** @}*/
+} //namespace opencog
+
+#endif // _OPENCOG_INCOMING_STATS_H
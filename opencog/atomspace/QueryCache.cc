@@ -0,0 +1,121 @@
+/*
+ * opencog/atomspace/QueryCache.cc
+ *
+ * Copyright (C) 2026 by The OpenCog Foundation
+ * All Rights Reserved
+ *
+ * This program is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU Affero General Public License v3 as
+ * published by the Free Software Foundation and including the exceptions
+ * at http://opencog.org/wiki/Licenses
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Affero General Public License
+ * along with this program; if not, write to:
+ * Free Software Foundation, Inc.,
+ * 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+ */
+
+#include "AtomSpace.h"
+#include "QueryCache.h"
+
+using namespace opencog;
+
+QueryCache::QueryCache(size_t capacity) :
+	_capacity(0 < capacity ? capacity : 1),
+	_hits(0),
+	_misses(0),
+	_stale(0),
+	_evictions(0)
+{
+}
+
+QueryCache::Versions QueryCache::versions(const AtomSpace* as,
+                                          const TypeSet& types)
+{
+	Versions vers;
+	vers.reserve(types.size());
+	for (Type t : types)
+		vers.emplace_back(t, as->get_type_changes(t));
+	return vers;
+}
+
+ValuePtr QueryCache::get(const Handle& query, const AtomSpace* as)
+{
+	std::lock_guard<std::mutex> lck(_mtx);
+	auto it = _entries.find(query);
+	if (_entries.end() == it)
+	{
+		_misses++;
+		return nullptr;
+	}
+
+	for (const auto& tv : it->second.versions)
+	{
+		if (as->get_type_changes(tv.first) != tv.second)
+		{
+			drop(it);
+			_misses++;
+			_stale++;
+			return nullptr;
+		}
+	}
+
+	_lru.splice(_lru.begin(), _lru, it->second.lru);
+	_hits++;
+	return it->second.result;
+}
+
+void QueryCache::put(const Handle& query, Versions&& vers,
+                     const ValuePtr& result)
+{
+	std::lock_guard<std::mutex> lck(_mtx);
+	auto it = _entries.find(query);
+	if (_entries.end() != it) drop(it);
+
+	_lru.push_front(query);
+	_entries.insert({query, {result, std::move(vers), _lru.begin()}});
+	shrink();
+}
+
+void QueryCache::drop(std::unordered_map<Handle, Entry,
+                      std::hash<Handle>, ContentEqual>::iterator it)
+{
+	_lru.erase(it->second.lru);
+	_entries.erase(it);
+}
+
+void QueryCache::shrink(void)
+{
+	while (_capacity < _entries.size())
+	{
+		drop(_entries.find(_lru.back()));
+		_evictions++;
+	}
+}
+
+void QueryCache::set_capacity(size_t capacity)
+{
+	std::lock_guard<std::mutex> lck(_mtx);
+	_capacity = 0 < capacity ? capacity : 1;
+	shrink();
+}
+
+void QueryCache::clear(void)
+{
+	std::lock_guard<std::mutex> lck(_mtx);
+	_entries.clear();
+	_lru.clear();
+}
+
+QueryCache::Stats QueryCache::get_stats(void) const
+{
+	std::lock_guard<std::mutex> lck(_mtx);
+	return {_hits, _misses, _stale, _evictions, _entries.size(), _capacity};
+}
+
+/* ===================== END OF FILE ===================== */
@@ -0,0 +1,130 @@
+/*
+ * opencog/atomspace/QueryCache.h
+ *
+ * Copyright (C) 2026 by The OpenCog Foundation
+ * All Rights Reserved
+ *
+ * This program is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU Affero General Public License v3 as
+ * published by the Free Software Foundation and including the exceptions
+ * at http://opencog.org/wiki/Licenses
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Affero General Public License
+ * along with this program; if not, write to:
+ * Free Software Foundation, Inc.,
+ * 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+ */
+
+#ifndef _OPENCOG_QUERY_CACHE_H
+#define _OPENCOG_QUERY_CACHE_H
+
+#include <list>
+#include <memory>
+#include <mutex>
+#include <unordered_map>
+#include <vector>
+
+#include <opencog/atoms/atom_types/types.h>
+#include <opencog/atoms/base/Handle.h>
+#include <opencog/atoms/value/Value.h>
+
+namespace opencog
+{
+/** \addtogroup grp_atomspace
+ *  @{
+ */
+
+class AtomSpace;
+
+/**
+ * Least-recently-used cache of query results, for one AtomSpace.
+ * Enable it with `AtomSpace::set_query_cache()`; it is off by default.
+ *
+ * Entries are keyed by the content of the query atom. Each entry
+ * remembers the change counts (`AtomSpace::get_type_changes()`) of the
+ * atom types that the result depends on, as they were just before the
+ * query ran. The entry is stale as soon as one of those counts moves,
+ * that is, once an atom of one of those types is added to or removed
+ * from the AtomSpace, or from the AtomSpaces it is layered on. Changes
+ * to Values are not tracked; the queries that look at Values are not
+ * cached (see `PatternLink::cache_types()`).
+ *
+ * All methods are thread-safe.
+ */
+class QueryCache
+{
+public:
+	/// The change counts of a set of atom types.
+	typedef std::vector<std::pair<Type, uint64_t>> Versions;
+
+	struct Stats
+	{
+		size_t hits;
+		size_t misses;
+		size_t stale;      ///< Misses due to a stale entry.
+		size_t evictions;  ///< Entries dropped to make room.
+		size_t size;
+		size_t capacity;
+	};
+
+protected:
+	struct ContentEqual
+	{
+		bool operator()(const Handle& a, const Handle& b) const
+		{ return content_eq(a, b); }
+	};
+
+	struct Entry
+	{
+		ValuePtr result;
+		Versions versions;
+		std::list<Handle>::iterator lru;
+	};
+
+	mutable std::mutex _mtx;
+	size_t _capacity;
+
+	// Most recently used first.
+	std::list<Handle> _lru;
+	std::unordered_map<Handle, Entry, std::hash<Handle>, ContentEqual> _entries;
+
+	size_t _hits;
+	size_t _misses;
+	size_t _stale;
+	size_t _evictions;
+
+	void drop(std::unordered_map<Handle, Entry,
+	          std::hash<Handle>, ContentEqual>::iterator);
+	void shrink(void);
+
+public:
+	/// Hold up to capacity results (at least one).
+	QueryCache(size_t capacity);
+
+	/// The current change counts of the types, in the AtomSpace.
+	static Versions versions(const AtomSpace*, const TypeSet&);
+
+	/// Return the result stored for the query, or nullptr if there is
+	/// none, or if it is stale for the AtomSpace.
+	ValuePtr get(const Handle& query, const AtomSpace*);
+
+	/// Store the result of the query, computed when the change counts
+	/// were as given.
+	void put(const Handle& query, Versions&&, const ValuePtr& result);
+
+	void set_capacity(size_t);
+	void clear(void);
+	Stats get_stats(void) const;
+};
+
+typedef std::shared_ptr<QueryCache> QueryCachePtr;
+
+/** @}*/
+} //namespace opencog
+
+#endif // _OPENCOG_QUERY_CACHE_H
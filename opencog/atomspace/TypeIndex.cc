@@ -35,6 +35,7 @@ void TypeIndex::resize(void)
 	_num_types = nameserver().getNumberOfClasses();
 	TYPE_INDEX_UNIQUE_LOCK;
 	_idx.resize(_num_types + 1);
+	_changes.resize(_num_types + 1, 0);
 }
 
 void TypeIndex::clear(void)
@@ -45,6 +46,9 @@ void TypeIndex::clear(void)
 		dead.resize(_num_types + 1);
 		dead.swap(_idx);
 
+		// Everything changed.
+		for (uint64_t& c : _changes) c++;
+
 		// Clear the AtomSpace before releasing the lock.
 		for (auto& s : dead)
 			for (auto& h : s)
@@ -79,6 +79,10 @@ class TypeIndex
 	private:
 		std::vector<AtomSet> _idx;
 		size_t _num_types;
+
+		// Count of insertions and removals, per type. These only
+		// ever go up; see `changes()`.
+		std::vector<uint64_t> _changes;
 		NameServer& _nameserver;
 
 		// Single, global mutex for locking the index.
@@ -96,6 +100,7 @@ class TypeIndex
 			auto iter = s.find(h);
 			if (s.end() != iter) return *iter;
 			s.insert(h);
+			_changes[h->get_type()]++;
 			return Handle::UNDEFINED;
 		}
 
@@ -103,7 +108,18 @@ class TypeIndex
 		{
 			AtomSet& s(_idx.at(h->get_type()));
 			TYPE_INDEX_UNIQUE_LOCK;
-			return 1 == s.erase(h);
+			if (0 == s.erase(h)) return false;
+			_changes[h->get_type()]++;
+			return true;
+		}
+
+		// How many times were atoms of type t inserted or removed?
+		// Results computed from the atoms of some set of types are
+		// still good as long as none of these counts changed.
+		uint64_t changes(Type t) const
+		{
+			TYPE_INDEX_SHARED_LOCK;
+			return _changes.at(t);
 		}
 
 		Handle findAtom(const Handle& h) const
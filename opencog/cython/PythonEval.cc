@@ -113,6 +113,8 @@ PythonEval::PythonEval()
 
     _eval_done = true;
     _paren_count = 0;
+    _function_cache_hits = 0;
+    _function_cache_misses = 0;
     // Initialize Python objects and imports.
     //
     // Strange but true: one can use the atomspace, and put atoms
@@ -135,6 +137,7 @@ PythonEval::~PythonEval()
     gstate = PyGILState_Ensure();
 
     // Decrement reference counts for instance Python object references.
+    do_clear_function_cache("");
     Py_DECREF(_pyGlobal);
     Py_DECREF(_pyLocal);
 
@@ -618,6 +621,9 @@ void PythonEval::import_module(const std::filesystem::path &file,
     // Add the module to our modules list. So don't decrement the
     // Python reference in this function.
     _modules[moduleName] = pyModule;
+
+    // Functions looked up in an older copy of this module are stale.
+    do_clear_function_cache(moduleName);
 }
 
 /**
@@ -814,10 +820,198 @@ PyObject* PythonEval::find_object(PyObject* pyModule,
 }
 
 /**
- * Get the Python module and/or object and stripped function name, given
- * the identifier of the form '[module.][object.[attribute.]*]function'.
+ * Lock `mtx`, while holding the GIL. If the lock is busy, the GIL is
+ * released while waiting; otherwise, the thread holding the lock
+ * could end up waiting for the GIL, and never release the lock.
+ */
+static void lock_releasing_gil(std::recursive_mutex& mtx)
+{
+    if (mtx.try_lock()) return;
+    Py_BEGIN_ALLOW_THREADS
+    mtx.lock();
+    Py_END_ALLOW_THREADS
+}
+
+/**
+ * Get the Python function, given the identifier of the form
+ * '[module.][object.[attribute.]*]function'. Returns a new reference.
+ *
+ * Resolving the name is not cheap: the name has to be split, and the
+ * module dict and object attributes searched (and perhaps the module
+ * loaded). Since grounded predicates are called over and over with
+ * the same name, the result is cached. A cached callable is used only
+ * if the first part of the name is still bound, in its module, to the
+ * same object as when it was resolved; so rebinding a function, or
+ * the class or object holding it, is noticed. The GIL must be held.
  */
 PyObject* PythonEval::get_function(const std::string& moduleFunction)
+{
+    CachedFunction hit{nullptr, nullptr, "", nullptr};
+    {
+        std::lock_guard<std::mutex> lck(_cache_mtx);
+        auto cached = _function_cache.find(moduleFunction);
+        if (_function_cache.end() != cached)
+        {
+            hit = cached->second;
+            Py_INCREF(hit.func);
+            Py_INCREF(hit.dict);
+            Py_INCREF(hit.bound);
+        }
+    }
+
+    // Check the binding without holding the cache lock. The references
+    // taken above keep the objects alive, so that a new object cannot
+    // turn up at the same address.
+    if (hit.func)
+    {
+        bool same =
+            (hit.bound == PyDict_GetItemString(hit.dict, hit.head.c_str()));
+
+        CachedFunction stale{nullptr, nullptr, "", nullptr};
+        {
+            std::lock_guard<std::mutex> lck(_cache_mtx);
+            if (same)
+                _function_cache_hits++;
+            else
+            {
+                // Rebound; forget it, unless some other thread already
+                // did, and maybe cached the new binding.
+                _function_cache_misses++;
+                auto cached = _function_cache.find(moduleFunction);
+                if (_function_cache.end() != cached and
+                    hit.func == cached->second.func)
+                {
+                    stale = cached->second;
+                    _function_cache.erase(cached);
+                }
+            }
+        }
+
+        Py_DECREF(hit.dict);
+        Py_DECREF(hit.bound);
+        if (stale.func)
+        {
+            Py_DECREF(stale.func);
+            Py_DECREF(stale.dict);
+            Py_DECREF(stale.bound);
+        }
+        if (same) return hit.func;
+        Py_DECREF(hit.func);
+    }
+    else
+    {
+        std::lock_guard<std::mutex> lck(_cache_mtx);
+        _function_cache_misses++;
+    }
+
+    // Resolving may load modules, and so must not run concurrently.
+    lock_releasing_gil(_mtx);
+    CachedFunction entry{nullptr, nullptr, "", nullptr};
+    try
+    {
+        entry.func = resolve_function(moduleFunction, entry.dict, entry.head);
+    }
+    catch (...)
+    {
+        _mtx.unlock();
+        throw;
+    }
+    entry.bound = PyDict_GetItemString(entry.dict, entry.head.c_str());
+    _mtx.unlock();
+
+    // Found on an object that is not in any module dict (this should
+    // not happen); just don't cache it.
+    if (nullptr == entry.bound) return entry.func;
+
+    // The caller gets the reference returned by resolve_function(); the
+    // cache takes new ones. Some other thread may have resolved the
+    // same name meanwhile; keep theirs.
+    std::lock_guard<std::mutex> lck(_cache_mtx);
+    auto ins = _function_cache.emplace(moduleFunction, entry);
+    if (ins.second)
+    {
+        Py_INCREF(entry.func);
+        Py_INCREF(entry.dict);
+        Py_INCREF(entry.bound);
+    }
+    return entry.func;
+}
+
+void PythonEval::do_clear_function_cache(const std::string& func)
+{
+    // Collect the stale entries, and drop the references only after
+    // unlocking: dropping them may run arbitrary python code.
+    std::vector<CachedFunction> stale;
+    {
+        std::lock_guard<std::mutex> lck(_cache_mtx);
+        if (func.empty())
+        {
+            for (auto& entry : _function_cache)
+                stale.push_back(entry.second);
+            _function_cache.clear();
+        }
+        else
+        {
+            // Erase func itself, and every "func.xxx" name. All names
+            // starting with func sort together, right after func.
+            auto it = _function_cache.lower_bound(func);
+            while (_function_cache.end() != it and
+                   0 == it->first.compare(0, func.size(), func))
+            {
+                if (it->first.size() == func.size() or
+                    '.' == it->first[func.size()])
+                {
+                    stale.push_back(it->second);
+                    it = _function_cache.erase(it);
+                }
+                else
+                    it++;
+            }
+        }
+    }
+    for (const CachedFunction& entry : stale)
+    {
+        Py_DECREF(entry.func);
+        Py_DECREF(entry.dict);
+        Py_DECREF(entry.bound);
+    }
+}
+
+size_t PythonEval::function_cache_hits() const
+{
+    std::lock_guard<std::mutex> lck(_cache_mtx);
+    return _function_cache_hits;
+}
+
+size_t PythonEval::function_cache_misses() const
+{
+    std::lock_guard<std::mutex> lck(_cache_mtx);
+    return _function_cache_misses;
+}
+
+size_t PythonEval::function_cache_size() const
+{
+    std::lock_guard<std::mutex> lck(_cache_mtx);
+    return _function_cache.size();
+}
+
+void PythonEval::clear_function_cache(const std::string& func)
+{
+    PyGILState_STATE gstate = PyGILState_Ensure();
+    SCOPE_EXIT(&gstate) {
+        PyGILState_Release(gstate);
+    } SCOPE_EXIT_END
+
+    do_clear_function_cache(func);
+}
+
+/**
+ * Look up the python function, bypassing the cache. Also sets pyDict
+ * (a borrowed reference) to the dict of the module that the name was
+ * looked up in, and head to the first part of the name in that dict.
+ */
+PyObject* PythonEval::resolve_function(const std::string& moduleFunction,
+                                       PyObject*& pyDict, std::string& head)
 {
     PyObject* pyModule = _pyRootModule;
     PyObject* pyObject = nullptr;
@@ -850,6 +1044,10 @@ PyObject* PythonEval::get_function(const std::string& moduleFunction)
         }
     }
 
+    // The name that the rest is found through, and where.
+    pyDict = PyModule_GetDict(pyModule);
+    head = functionName.substr(0, functionName.find_first_of('.'));
+
     // Iteratively check for objects in the selected (either root
     // or loaded) module.
     index = functionName.find_first_of('.');
@@ -894,7 +1092,6 @@ PyObject* PythonEval::get_function(const std::string& moduleFunction)
             functionName.c_str(), PyModule_GetName(pyModule));
         print_dictionary(pyDict);
 #endif
-        PyObject* pyDict = PyModule_GetDict(pyModule);
         pyUserFunc = PyDict_GetItemString(pyDict, functionName.c_str());
     }
     else
@@ -925,6 +1122,58 @@ PyObject* PythonEval::get_function(const std::string& moduleFunction)
 // Most of these are part of the public API.
 
 std::recursive_mutex PythonEval::_mtx;
+std::atomic<size_t> PythonEval::_max_calls(1);
+size_t PythonEval::_active_calls = 0;
+std::mutex PythonEval::_calls_mtx;
+std::condition_variable PythonEval::_calls_cv;
+
+// Nesting depth of python callbacks in this thread. A callback that
+// calls back into python (through the atomspace) already holds a
+// slot (and perhaps _mtx), and must not wait for a second one.
+static thread_local size_t _call_depth = 0;
+
+PythonEval::CallLock::CallLock()
+{
+    if (0 < _call_depth++) return;
+
+    // Every call in flight, serialized or not, holds a slot; so the
+    // limit, and with it the choice of whether to also take _mtx,
+    // cannot change until all of them are done.
+    {
+        std::unique_lock<std::mutex> lck(_calls_mtx);
+        _calls_cv.wait(lck, [] { return _active_calls < _max_calls; });
+        _active_calls++;
+        _serial = (1 == _max_calls);
+    }
+    if (_serial) _mtx.lock();
+}
+
+PythonEval::CallLock::~CallLock()
+{
+    if (0 < --_call_depth) return;
+
+    if (_serial) _mtx.unlock();
+    {
+        std::lock_guard<std::mutex> lck(_calls_mtx);
+        _active_calls--;
+    }
+    _calls_cv.notify_one();
+}
+
+void PythonEval::set_max_concurrent_calls(size_t n)
+{
+    if (0 == n)
+        throw RuntimeException(TRACE_INFO,
+            "At least one concurrent python call must be allowed!");
+
+    std::lock_guard<std::mutex> lck(_calls_mtx);
+    if (0 < _active_calls)
+        throw RuntimeException(TRACE_INFO,
+            "Cannot change the number of concurrent python calls "
+            "while %zu of them are running!", _active_calls);
+    _max_calls = n;
+    _calls_cv.notify_all();
+}
 
 /**
  * Get the user defined function.
@@ -980,7 +1229,7 @@ PyObject* PythonEval::call_user_function(const std::string& moduleFunction,
         throw RuntimeException(TRACE_INFO,
             "Expecting arguments to be a ListLink!");
 
-    std::lock_guard<std::recursive_mutex> lck(_mtx);
+    CallLock lck;
 
     // Grab the GIL.
     PyGILState_STATE gstate = PyGILState_Ensure();
@@ -1013,7 +1262,7 @@ ValuePtr PythonEval::apply_v(AtomSpace * as,
                              const std::string& func,
                              Handle varargs)
 {
-    std::lock_guard<std::recursive_mutex> lck(_mtx);
+    CallLock lck;
     push_context_atomspace(AtomSpaceCast(as));
     SCOPE_EXIT0 {
         pop_context_atomspace();
@@ -1035,18 +1284,38 @@ ValuePtr PythonEval::apply_v(AtomSpace * as,
         PyGILState_Release(gstate);
     } SCOPE_EXIT_END
 
+    // value_from_python() needs the reference only while it runs.
+    ValuePtr vptr;
+    try
+    {
+        vptr = value_from_python(pyValue, func);
+    }
+    catch (...)
+    {
+        Py_DECREF(pyValue);
+        throw;
+    }
+    Py_DECREF(pyValue);
+    return vptr;
+}
+
+/**
+ * Extract the ValuePtr from a python Value (Atom, TruthValue, ...)
+ * returned by the user function `func`. The GIL must be held. The
+ * reference to pyValue is borrowed, not stolen.
+ */
+ValuePtr PythonEval::value_from_python(PyObject* pyValue,
+                                       const std::string& func)
+{
     // Did we actually get a Value?
     // One way to do this would be to say
     //    PyObject *vtype = find_object("Value");
     //    if (0 == PyObject_IsInstance(pyValue, vtype)) ...
     // but just grabbing the attr is easier, for now.
     if (0 == PyObject_HasAttrString(pyValue, "value_ptr"))
-    {
-        Py_DECREF(pyValue);
         throw RuntimeException(TRACE_INFO,
             "Python function '%s' did not return Atomese!",
             func.c_str());
-    }
 
     // Get the truth value pointer from the object (will be encoded
     // as a long by PyVoidPtr_asLong)
@@ -1056,7 +1325,6 @@ ValuePtr PythonEval::apply_v(AtomSpace * as,
     PyObject *pyError = PyErr_Occurred();
     if (pyError or nullptr == pyValuePtrPtr)
     {
-        Py_DECREF(pyValue);
         if (pyValuePtrPtr) Py_DECREF(pyValuePtrPtr);
         throw RuntimeException(TRACE_INFO,
             "Python function '%s' did not return Atomese!",
@@ -1068,10 +1336,102 @@ ValuePtr PythonEval::apply_v(AtomSpace * as,
             (PyLong_AsVoidPtr(pyValuePtrPtr))));
 
     Py_DECREF(pyValuePtrPtr);
-    Py_DECREF(pyValue);
     return vptr;
 }
 
+/**
+ * Call the user function once, for a whole batch of arguments.
+ *
+ * Each element of `arglists` is one set of arguments: a ListLink is
+ * unpacked into a tuple of its outgoing set, as for apply_v(); any
+ * other Atom becomes a 1-tuple. The python function is passed a
+ * single list of these tuples, and must return a sequence of Values,
+ * one per tuple, in the same order.
+ *
+ * The lock and the GIL are taken just once for the whole batch,
+ * instead of once per call, as repeated apply_v() calls would.
+ */
+ValueSeq PythonEval::apply_batch(AtomSpace * as,
+                                 const std::string& func,
+                                 const HandleSeq& arglists)
+{
+    CallLock lck;
+    push_context_atomspace(AtomSpaceCast(as));
+    SCOPE_EXIT0 {
+        pop_context_atomspace();
+    } SCOPE_EXIT_END
+
+    // Grab the GIL.
+    PyGILState_STATE gstate = PyGILState_Ensure();
+
+    SCOPE_EXIT(&gstate) {
+        PyGILState_Release(gstate);
+    } SCOPE_EXIT_END
+
+    size_t nbatch = arglists.size();
+    PyObject* pyBatch = PyList_New(nbatch);
+    for (size_t j=0; j<nbatch; j++)
+    {
+        const Handle& arguments = arglists[j];
+        PyObject* pyArgs;
+        if (arguments->get_type() == LIST_LINK)
+        {
+            size_t nargs = arguments->get_arity();
+            pyArgs = PyTuple_New(nargs);
+            const HandleSeq& args = arguments->getOutgoingSet();
+            for (size_t i=0; i<nargs; i++)
+                PyTuple_SetItem(pyArgs, i, py_atom(args[i]));
+        }
+        else
+        {
+            pyArgs = PyTuple_New(1);
+            PyTuple_SetItem(pyArgs, 0, py_atom(arguments));
+        }
+        PyList_SetItem(pyBatch, j, pyArgs);
+    }
+
+    PyObject* pyArguments = PyTuple_New(1);
+    PyTuple_SetItem(pyArguments, 0, pyBatch);
+    PyObject* pyResults = do_call_user_function(func, pyArguments);
+
+    PyObject* pySeq = nullptr;
+    if (pyResults)
+        pySeq = PySequence_Fast(pyResults, "not a sequence");
+    if (pyResults) Py_DECREF(pyResults);
+    if (nullptr == pySeq)
+    {
+        PyErr_Clear();
+        throw RuntimeException(TRACE_INFO,
+            "Python function '%s' did not return a list of Atomese!",
+            func.c_str());
+    }
+
+    size_t nresults = PySequence_Fast_GET_SIZE(pySeq);
+    if (nresults != nbatch)
+    {
+        Py_DECREF(pySeq);
+        throw RuntimeException(TRACE_INFO,
+            "Python function '%s' returned %zu results for %zu arguments!",
+            func.c_str(), nresults, nbatch);
+    }
+
+    ValueSeq results;
+    results.reserve(nbatch);
+    try
+    {
+        for (size_t j=0; j<nbatch; j++)
+            results.emplace_back(value_from_python(
+                PySequence_Fast_GET_ITEM(pySeq, j), func));
+    }
+    catch (...)
+    {
+        Py_DECREF(pySeq);
+        throw;
+    }
+    Py_DECREF(pySeq);
+    return results;
+}
+
 /**
  * Call the user defined function with the provide atomspace argument.
  * This is a cut-n-paste of PythonEval::call_user_function but with
@@ -1082,7 +1442,7 @@ ValuePtr PythonEval::apply_v(AtomSpace * as,
 void PythonEval::apply_as(const std::string& moduleFunction,
                           AtomSpace* as_argument)
 {
-    std::lock_guard<std::recursive_mutex> lck(_mtx);
+    CallLock lck;
 
     // Grab the GIL.
     PyGILState_STATE gstate = PyGILState_Ensure();
@@ -1231,6 +1591,9 @@ std::string PythonEval::execute_string(const char* command)
             Py_file_input, pyRootDictionary, pyRootDictionary,
             nullptr);
 
+    // The command may have (re-)defined functions, or reloaded modules.
+    do_clear_function_cache("");
+
     // Check for error before collecting the result.
     check_for_error();
 
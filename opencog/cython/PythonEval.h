@@ -40,6 +40,7 @@
 
 #include "PyIncludeWrapper.h"
 
+#include <atomic>
 #include <condition_variable>
 #include <filesystem>
 #include <map>
@@ -89,6 +90,7 @@ class PythonEval : public GenericEval
         // Call functions; execute scripts.
         PyObject* call_user_function(const std::string& func,
                                      Handle varargs);
+        ValuePtr value_from_python(PyObject*, const std::string& func);
         std::string build_python_error_message(const std::string&);
 
         std::string execute_string(const char*);
@@ -111,6 +113,23 @@ class PythonEval : public GenericEval
         // wrong atomspace in some other thread.  Quite unfortunate.
         static std::recursive_mutex _mtx;
 
+        // Python callbacks hold one of _max_calls slots; with just the
+        // one slot, they also hold _mtx. See set_max_concurrent_calls().
+        static std::atomic<size_t> _max_calls;
+        static size_t _active_calls;
+        static std::mutex _calls_mtx;
+        static std::condition_variable _calls_cv;
+
+        // Taken by every call into a python callback; holds a call
+        // slot, and also _mtx if there is only the one slot.
+        class CallLock
+        {
+                bool _serial = false;
+            public:
+                CallLock();
+                ~CallLock();
+        };
+
         // Computed results are typically polled in a distinct thread.
         bool _eval_done;
         std::mutex _poll_mtx;
@@ -125,6 +144,30 @@ class PythonEval : public GenericEval
 
         std::map <std::string, PyObject*> _modules;
 
+        // A resolved python callable, and where its name was found:
+        // the dict of the module, the first part of the name within
+        // that module, and what that was bound to. Holds a reference
+        // to each of the objects.
+        struct CachedFunction
+        {
+            PyObject* func;
+            PyObject* dict;
+            std::string head;
+            PyObject* bound;
+        };
+
+        // Cache of resolved python callables, keyed by the full dotted
+        // name, as passed to get_function(). Guarded by _cache_mtx,
+        // since python callbacks may run concurrently (see CallLock);
+        // it is only held briefly.
+        mutable std::mutex _cache_mtx;
+        std::map <std::string, CachedFunction> _function_cache;
+        size_t _function_cache_hits;
+        size_t _function_cache_misses;
+        void do_clear_function_cache(const std::string&);
+        PyObject* resolve_function(const std::string& moduleFunction,
+                                   PyObject*& pyDict, std::string& head);
+
         std::string _result;
         std::string _capture_stdout;
         int _paren_count;
@@ -186,12 +229,61 @@ class PythonEval : public GenericEval
                                const std::string& func, Handle varargs)
         { return TruthValueCast(apply_v(as, func, varargs)); }
 
+        /**
+         * Calls the Python function passed in `func` just once, for
+         * a whole batch of arguments, returning one Value for each.
+         * See the .cc file for the calling convention.
+         */
+        ValueSeq apply_batch(AtomSpace * as, const std::string& func,
+                             const HandleSeq& arglists);
+
         /**
          * Calls the Python function passed in `func`, passing it
          * the AtomSpace as an argument, returning void.
          */
         void apply_as(const std::string& func, AtomSpace*);
 
+        /**
+         * Forget the cached lookup of the python function `func`, and
+         * of anything found inside of it (e.g. "mod" also forgets
+         * "mod.func" and "mod.Class.method"). If `func` is empty, the
+         * entire cache is cleared. A name that is rebound in its
+         * module (e.g. by importlib.reload(), or by assigning to a
+         * module attribute) is noticed on the next lookup; but a
+         * rebinding further down (e.g. of a method of a class, for
+         * "mod.Class.method") is not, and needs this to be called.
+         */
+        void clear_function_cache(const std::string& func = "");
+
+        /// Number of get_function() calls answered from the cache.
+        size_t function_cache_hits() const;
+        /// Number of get_function() calls that had to do a full lookup.
+        size_t function_cache_misses() const;
+        size_t function_cache_size() const;
+
+        /**
+         * Set how many threads may be inside python callbacks (grounded
+         * schemas and predicates, apply_v(), apply_batch(), ...) at
+         * the same time. The default, 1, serializes all of them on a
+         * single global lock, as has always been done. With a larger
+         * value, up to that many threads are let in at once, each
+         * with its own context atomspace.
+         *
+         * This does not make python code run in parallel: the callbacks
+         * still take turns on the GIL. They only overlap where the GIL
+         * is released, e.g. while sleeping, doing I/O, or in atomspace
+         * and pattern-matcher calls made from python; this helps when
+         * callbacks spend most of their time there. (The opencog python
+         * modules are not declared free-threading safe, so importing
+         * them turns the GIL back on even on a free-threaded build.)
+         * eval() and execute_script() are always serialized.
+         *
+         * The limit cannot be changed while any callback is running;
+         * doing so throws. Set it once, before starting the threads.
+         */
+        static void set_max_concurrent_calls(size_t);
+        static size_t get_max_concurrent_calls(void) { return _max_calls; }
+
 #if 0
         /**
          * Debug utility
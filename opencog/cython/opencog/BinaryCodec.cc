@@ -0,0 +1,462 @@
+/*
+ * opencog/cython/opencog/BinaryCodec.cc
+ *
+ * Copyright (C) 2026 by The OpenCog Foundation
+ * All Rights Reserved
+ *
+ * This program is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU Affero General Public License v3 as
+ * published by the Free Software Foundation and including the exceptions
+ * at http://opencog.org/wiki/Licenses
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Affero General Public License
+ * along with this program; if not, write to:
+ * Free Software Foundation, Inc.,
+ * 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+ */
+
+#include <cstdint>
+#include <cstring>
+#include <unordered_map>
+
+#include <opencog/util/exceptions.h>
+#include <opencog/atoms/base/Link.h>
+#include <opencog/atoms/base/Node.h>
+#include <opencog/atoms/value/BoolValue.h>
+#include <opencog/atoms/value/FloatValue.h>
+#include <opencog/atoms/value/LinkValue.h>
+#include <opencog/atoms/value/StringValue.h>
+#include <opencog/atoms/value/ValueFactory.h>
+
+#include "BinaryCodec.h"
+
+using namespace opencog;
+
+// Layout, with all counts and indexes written as LEB128 varints:
+//
+//   magic     "OCB1"
+//   types     count, then count x (length, name)
+//   atoms     count, then count x (flags, node name | arity, atom...)
+//   values    count, then count x (atom, nkeys, nkeys x (key, value))
+//   roots     count, then count x value
+//
+//   value     type, then
+//               atom:   atom index
+//               float:  n, n x 8-byte IEEE double, host byte order
+//               string: n, n x (length, bytes)
+//               bool:   n, n x byte
+//               link:   n, n x value
+//
+// The atom flags are the type, shifted left by one, with the low bit
+// set for Atoms that were not in any AtomSpace, such as the key used
+// for TruthValues. These are not added to the AtomSpace on decoding.
+// Atoms always precede the Atoms that contain them.
+
+static const char MAGIC[] = "OCB1";
+
+namespace {
+
+class Encoder
+{
+	std::unordered_map<Type, size_t> _types;
+	std::string _type_names;
+	std::unordered_map<Handle, size_t> _atoms;
+	std::string _atom_buf;
+	std::string _value_buf;
+	size_t _nvalued = 0;
+	std::string _root_buf;
+	size_t _nroots = 0;
+
+	static void put_uint(std::string& buf, uint64_t n)
+	{
+		while (0x80 <= n)
+		{
+			buf.push_back((char) ((n & 0x7f) | 0x80));
+			n >>= 7;
+		}
+		buf.push_back((char) n);
+	}
+
+	static void put_str(std::string& buf, const std::string& s)
+	{
+		put_uint(buf, s.size());
+		buf.append(s);
+	}
+
+	size_t type_index(Type t)
+	{
+		auto it = _types.find(t);
+		if (it == _types.end())
+		{
+			it = _types.emplace(t, _types.size()).first;
+			put_str(_type_names, nameserver().getTypeName(t));
+		}
+		return it->second;
+	}
+
+	void put_type(std::string& buf, Type t)
+	{
+		put_uint(buf, type_index(t));
+	}
+
+	// Streams and containers compute or wait for their contents;
+	// they are not plain data.
+	static bool encodable(const ValuePtr& v)
+	{
+		Type t = v->get_type();
+		if (v->is_atom()) return true;
+		if (nameserver().isA(t, STREAM_VALUE)) return false;
+		if (nameserver().isA(t, LINK_STREAM_VALUE)) return false;
+		return nameserver().isA(t, FLOAT_VALUE) or
+			nameserver().isA(t, STRING_VALUE) or
+			nameserver().isA(t, BOOL_VALUE) or
+			nameserver().isA(t, LINK_VALUE);
+	}
+
+	static bool encodable_tree(const ValuePtr& v)
+	{
+		if (not encodable(v)) return false;
+		if (v->is_atom() or not nameserver().isA(v->get_type(), LINK_VALUE))
+			return true;
+		for (const ValuePtr& vp : LinkValueCast(v)->value())
+			if (not encodable_tree(vp)) return false;
+		return true;
+	}
+
+	void put_value(std::string& buf, const ValuePtr& v)
+	{
+		if (nullptr == v)
+			throw RuntimeException(TRACE_INFO, "Cannot encode a null Value");
+		if (not encodable(v))
+			throw RuntimeException(TRACE_INFO, "Cannot encode Values of type %s",
+				nameserver().getTypeName(v->get_type()).c_str());
+
+		Type t = v->get_type();
+		if (v->is_atom())
+		{
+			size_t idx = add_atom(HandleCast(v));
+			put_type(buf, t);
+			put_uint(buf, idx);
+			return;
+		}
+
+		// Atoms held in link values must be written first.
+		if (nameserver().isA(t, LINK_VALUE))
+		{
+			const ValueSeq& vals = LinkValueCast(v)->value();
+			std::string sub;
+			for (const ValuePtr& vp : vals)
+				put_value(sub, vp);
+			put_type(buf, t);
+			put_uint(buf, vals.size());
+			buf.append(sub);
+			return;
+		}
+
+		put_type(buf, t);
+		if (nameserver().isA(t, FLOAT_VALUE))
+		{
+			const std::vector<double>& dv = FloatValueCast(v)->value();
+			put_uint(buf, dv.size());
+			buf.append((const char*) dv.data(), dv.size() * sizeof(double));
+		}
+		else if (nameserver().isA(t, STRING_VALUE))
+		{
+			const std::vector<std::string>& sv = StringValueCast(v)->value();
+			put_uint(buf, sv.size());
+			for (const std::string& s : sv) put_str(buf, s);
+		}
+		else
+		{
+			const std::vector<bool>& bv = BoolValueCast(v)->value();
+			put_uint(buf, bv.size());
+			for (bool b : bv) buf.push_back(b ? 1 : 0);
+		}
+	}
+
+public:
+	size_t add_atom(const Handle& h)
+	{
+		auto it = _atoms.find(h);
+		if (it != _atoms.end()) return it->second;
+
+		if (not h->is_node() and not h->is_link())
+			throw RuntimeException(TRACE_INFO, "Cannot encode Atoms of type %s",
+				nameserver().getTypeName(h->get_type()).c_str());
+
+		std::string rec;
+		put_uint(rec, 2 * type_index(h->get_type()) +
+			(nullptr == h->getAtomSpace() ? 1 : 0));
+		if (h->is_node())
+			put_str(rec, h->get_name());
+		else
+		{
+			put_uint(rec, h->get_arity());
+			for (const Handle& ho : h->getOutgoingSet())
+				put_uint(rec, add_atom(ho));
+		}
+		_atom_buf.append(rec);
+		size_t idx = _atoms.size();
+		_atoms.emplace(h, idx);
+		return idx;
+	}
+
+	void add_values(const Handle& h)
+	{
+		std::string rec;
+		size_t nkeys = 0;
+		for (const Handle& key : h->getKeys())
+		{
+			ValuePtr v = h->getValue(key);
+			if (nullptr == v or not encodable_tree(v)) continue;
+			put_uint(rec, add_atom(key));
+			put_value(rec, v);
+			nkeys++;
+		}
+		if (0 == nkeys) return;
+		put_uint(_value_buf, add_atom(h));
+		put_uint(_value_buf, nkeys);
+		_value_buf.append(rec);
+		_nvalued++;
+	}
+
+	void add_root(const ValuePtr& v)
+	{
+		put_value(_root_buf, v);
+		_nroots++;
+	}
+
+	std::string str() const
+	{
+		std::string out(MAGIC, 4);
+		put_uint(out, _types.size());
+		out.append(_type_names);
+		put_uint(out, _atoms.size());
+		out.append(_atom_buf);
+		put_uint(out, _nvalued);
+		out.append(_value_buf);
+		put_uint(out, _nroots);
+		out.append(_root_buf);
+		return out;
+	}
+};
+
+class Decoder
+{
+	const std::string& _buf;
+	size_t _pos = 0;
+	AtomSpace* _as;
+	std::vector<Type> _types;
+	HandleSeq _atoms;
+
+	[[noreturn]] void corrupt() const
+	{
+		throw RuntimeException(TRACE_INFO,
+			"Malformed encoding at byte %zu", _pos);
+	}
+
+	uint64_t get_uint()
+	{
+		uint64_t n = 0;
+		for (int shift = 0; shift < 64; shift += 7)
+		{
+			if (_pos >= _buf.size()) corrupt();
+			unsigned char c = _buf[_pos++];
+			n |= ((uint64_t) (c & 0x7f)) << shift;
+			if (0 == (c & 0x80)) return n;
+		}
+		corrupt();
+	}
+
+	size_t get_count(size_t min_bytes)
+	{
+		uint64_t n = get_uint();
+		if (n > (_buf.size() - _pos) / min_bytes) corrupt();
+		return n;
+	}
+
+	std::string get_str()
+	{
+		size_t len = get_count(1);
+		std::string s(_buf, _pos, len);
+		_pos += len;
+		return s;
+	}
+
+	Type get_type(uint64_t idx)
+	{
+		if (idx >= _types.size()) corrupt();
+		return _types[idx];
+	}
+
+	Type get_type()
+	{
+		return get_type(get_uint());
+	}
+
+	const Handle& get_atom()
+	{
+		uint64_t idx = get_uint();
+		if (idx >= _atoms.size()) corrupt();
+		return _atoms[idx];
+	}
+
+	// Use the registered factory, so that e.g. TruthValues come back
+	// as TruthValues. Types without one come back as the base type.
+	template<typename ARG, typename FALLBACK>
+	static ValuePtr create(Type t, ARG&& arg, FALLBACK fallback)
+	{
+		try
+		{
+			return valueserver().create(t, std::forward<ARG>(arg));
+		}
+		catch (const IndexErrorException&) {}
+		return fallback(std::forward<ARG>(arg));
+	}
+
+	ValuePtr get_value()
+	{
+		Type t = get_type();
+		if (nameserver().isA(t, ATOM))
+			return get_atom();
+
+		if (nameserver().isA(t, LINK_VALUE))
+		{
+			ValueSeq vals(get_count(2));
+			for (ValuePtr& v : vals) v = get_value();
+			return create(t, std::move(vals), [](ValueSeq&& vs) -> ValuePtr
+				{ return createLinkValue(std::move(vs)); });
+		}
+		if (nameserver().isA(t, FLOAT_VALUE))
+		{
+			std::vector<double> dv(get_count(sizeof(double)));
+			memcpy(dv.data(), _buf.data() + _pos, dv.size() * sizeof(double));
+			_pos += dv.size() * sizeof(double);
+			return create(t, std::move(dv), [](std::vector<double>&& d) -> ValuePtr
+				{ return createFloatValue(std::move(d)); });
+		}
+		if (nameserver().isA(t, STRING_VALUE))
+		{
+			std::vector<std::string> sv(get_count(1));
+			for (std::string& s : sv) s = get_str();
+			return create(t, std::move(sv), [](std::vector<std::string>&& s) -> ValuePtr
+				{ return createStringValue(std::move(s)); });
+		}
+		if (nameserver().isA(t, BOOL_VALUE))
+		{
+			std::vector<bool> bv(get_count(1));
+			for (size_t i = 0; i < bv.size(); i++)
+				bv[i] = (0 != _buf[_pos++]);
+			return create(t, std::move(bv), [](std::vector<bool>&& b) -> ValuePtr
+				{ return createBoolValue(std::move(b)); });
+		}
+		corrupt();
+	}
+
+public:
+	Decoder(const std::string& buf, AtomSpace* as) : _buf(buf), _as(as) {}
+
+	ValueSeq decode()
+	{
+		if (_buf.size() < 4 or 0 != _buf.compare(0, 4, MAGIC, 4))
+			throw RuntimeException(TRACE_INFO, "Not an encoded AtomSpace");
+		_pos = 4;
+
+		size_t ntypes = get_count(1);
+		for (size_t i = 0; i < ntypes; i++)
+		{
+			std::string name = get_str();
+			Type t = nameserver().getType(name);
+			if (NOTYPE == t)
+				throw RuntimeException(TRACE_INFO,
+					"Unknown type %s; is its module loaded?", name.c_str());
+			_types.push_back(t);
+		}
+
+		size_t natoms = get_count(2);
+		_atoms.reserve(natoms);
+		for (size_t i = 0; i < natoms; i++)
+		{
+			uint64_t flags = get_uint();
+			Type t = get_type(flags >> 1);
+			bool add = _as and 0 == (flags & 1);
+			Handle h;
+			if (nameserver().isNode(t))
+			{
+				std::string name = get_str();
+				h = add ? _as->xadd_node(t, std::move(name))
+				        : createNode(t, std::move(name));
+			}
+			else if (nameserver().isLink(t))
+			{
+				HandleSeq oset(get_count(1));
+				for (Handle& ho : oset) ho = get_atom();
+				h = add ? _as->xadd_link(t, std::move(oset))
+				        : createLink(std::move(oset), t);
+			}
+			else corrupt();
+			_atoms.emplace_back(h);
+		}
+
+		size_t nvalued = get_count(2);
+		for (size_t i = 0; i < nvalued; i++)
+		{
+			Handle h = get_atom();
+			size_t nkeys = get_count(2);
+			for (size_t k = 0; k < nkeys; k++)
+			{
+				Handle key = get_atom();
+				ValuePtr v = get_value();
+				if (_as and h->getAtomSpace()) h = _as->set_value(h, key, v);
+				else h->setValue(key, v);
+			}
+		}
+
+		ValueSeq roots(get_count(2));
+		for (ValuePtr& v : roots) v = get_value();
+		if (_pos != _buf.size()) corrupt();
+		return roots;
+	}
+};
+
+} // namespace
+
+std::string opencog::encode_values(const ValueSeq& vals, bool with_values)
+{
+	Encoder enc;
+	for (const ValuePtr& v : vals)
+	{
+		enc.add_root(v);
+		if (with_values and v->is_atom()) enc.add_values(HandleCast(v));
+	}
+	return enc.str();
+}
+
+std::string opencog::encode_atoms(const HandleSeq& atoms, bool with_values)
+{
+	Encoder enc;
+	for (const Handle& h : atoms)
+	{
+		enc.add_atom(h);
+		if (with_values) enc.add_values(h);
+	}
+	return enc.str();
+}
+
+std::string opencog::encode_atomspace(const AtomSpace* as, bool with_values)
+{
+	HandleSeq atoms;
+	as->get_handles_by_type(atoms, ATOM, true);
+	return encode_atoms(atoms, with_values);
+}
+
+ValueSeq opencog::decode_values(const std::string& buf, AtomSpace* as)
+{
+	Decoder dec(buf, as);
+	return dec.decode();
+}
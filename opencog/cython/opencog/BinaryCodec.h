@@ -0,0 +1,66 @@
+/*
+ * opencog/cython/opencog/BinaryCodec.h
+ *
+ * Copyright (C) 2026 by The OpenCog Foundation
+ * All Rights Reserved
+ *
+ * This program is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU Affero General Public License v3 as
+ * published by the Free Software Foundation and including the exceptions
+ * at http://opencog.org/wiki/Licenses
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Affero General Public License
+ * along with this program; if not, write to:
+ * Free Software Foundation, Inc.,
+ * 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+ */
+
+#ifndef _OPENCOG_BINARY_CODEC_H
+#define _OPENCOG_BINARY_CODEC_H
+
+#include <string>
+#include <opencog/atoms/base/Handle.h>
+#include <opencog/atoms/value/Value.h>
+#include <opencog/atomspace/AtomSpace.h>
+
+namespace opencog {
+
+/**
+ * Compact binary encoding of Atoms and Values, used for pickling
+ * from python. The encoding holds a table of the type names used
+ * (type numbers differ from process to process), a table of Atoms,
+ * each written once, with links referring to their outgoing Atoms
+ * by index, optionally the Values attached to those Atoms, and then
+ * a list of "root" Values.
+ *
+ * Only plain data is encoded: Atoms, and Float, String, Bool and
+ * Link Values (including TruthValues). Streams and containers are
+ * not; encode_values() throws on them, and encode_atoms() skips them
+ * when they are attached to Atoms.
+ */
+
+/// Encode the given Values. If with_values is set, the Values attached
+/// to those of them that are Atoms are encoded too; otherwise, Atoms
+/// are encoded without their Values.
+std::string encode_values(const ValueSeq&, bool with_values=false);
+
+/// Encode the given Atoms, together with everything in their
+/// outgoing sets, and, if with_values is set, all of their Values.
+std::string encode_atoms(const HandleSeq&, bool with_values);
+
+/// Encode all of the Atoms in the AtomSpace.
+std::string encode_atomspace(const AtomSpace*, bool with_values);
+
+/// Decode; return the root Values. The encoded Atoms and their Values
+/// are added to the AtomSpace; if it is null, the Atoms are created
+/// without one.
+ValueSeq decode_values(const std::string&, AtomSpace*);
+
+} // namespace opencog
+
+#endif // _OPENCOG_BINARY_CODEC_H
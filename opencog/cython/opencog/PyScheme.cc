@@ -22,22 +22,22 @@
 #include "PyScheme.h"
 
 #include <atomic>
+#include <chrono>
+#include <condition_variable>
+#include <cstdint>
+#include <cstdlib>
+#include <memory>
+#include <mutex>
 #include <opencog/util/oc_assert.h>
+#include <opencog/atoms/base/Link.h>
 #include <opencog/atomspace/AtomSpace.h>
 #include <opencog/guile/SchemeEval.h>
 
 using namespace opencog;
 
-static void do_init()
+#ifdef HAVE_GUILE
+static void init_evaluator(SchemeEval* evaluator)
 {
-	// It should be enough to do this only once, instead of once
-	// per thread; so this is a belt-and-suspenders strategy for
-	// making sure python initialization doesn't fall down.
-	static thread_local bool thread_is_inited = false;
-	if (thread_is_inited) return;
-	thread_is_inited = true;
-
-	SchemeEval* evaluator = SchemeEval::get_evaluator(nullptr);
 	evaluator->clear_pending();
 	evaluator->eval(
 		"(define cog-initial-as (cog-atomspace))"
@@ -47,15 +47,220 @@ static void do_init()
 		"		(cog-set-atomspace! cog-initial-as)))");
 }
 
+// Init for the evaluator of this thread, i.e. the one that
+// SchemeEval::get_evaluator() hands out. Pooled evaluators are
+// initialized when they are created, instead.
+static void do_init(SchemeEval* evaluator)
+{
+	// It should be enough to do this only once, instead of once
+	// per thread; so this is a belt-and-suspenders strategy for
+	// making sure python initialization doesn't fall down.
+	static thread_local bool thread_is_inited = false;
+	if (thread_is_inited) return;
+	thread_is_inited = true;
+
+	init_evaluator(evaluator);
+}
+
+/* ============================================================== */
+// Evaluator pool. By default, each python thread gets its own
+// evaluator from SchemeEval::get_evaluator(), created on first use.
+// Once a pool is configured, python threads instead borrow one of a
+// fixed set of pre-warmed evaluators for the duration of each call,
+// waiting if all of them are busy. Nested calls (scheme calling
+// python calling scheme) re-use the evaluator the thread holds.
+
+namespace {
+struct PoolSlot
+{
+	SchemeEval* evaluator;
+	bool in_use;
+	size_t calls;
+	std::chrono::nanoseconds busy;
+	std::chrono::nanoseconds wait;
+};
+}
+
+static std::mutex eval_pool_mtx;
+static std::condition_variable eval_pool_cv;
+static std::vector<std::unique_ptr<PoolSlot>> eval_pool;
+static std::atomic<size_t> eval_pool_size(0);
+static thread_local PoolSlot* held_slot = nullptr;
+
+/// The evaluator used for one call from python. Picks the evaluator,
+/// runs the per-thread init, if it is not pooled, and sets the
+/// atomspace, if any.
+class EvalLease
+{
+	SchemeEval* _evaluator;
+	PoolSlot* _slot;
+	std::chrono::steady_clock::time_point _start;
+
+public:
+	EvalLease(AtomSpace* as) : _slot(nullptr)
+	{
+		if (held_slot)
+			_evaluator = held_slot->evaluator;
+		else if (0 < eval_pool_size)
+			_evaluator = acquire(as);
+		else
+			_evaluator = SchemeEval::get_evaluator(as);
+
+		try
+		{
+			if (nullptr == held_slot) do_init(_evaluator);
+			_evaluator->clear_pending();
+			if (as) _evaluator->set_scheme_as(as);
+		}
+		catch (...)
+		{
+			release();
+			throw;
+		}
+	}
+
+	~EvalLease() { release(); }
+
+	SchemeEval* operator->() const { return _evaluator; }
+
+private:
+	void release(void)
+	{
+		if (nullptr == _slot) return;
+		auto now = std::chrono::steady_clock::now();
+		std::lock_guard<std::mutex> lck(eval_pool_mtx);
+		_slot->busy += now - _start;
+		_slot->calls++;
+		_slot->in_use = false;
+		_slot = nullptr;
+		held_slot = nullptr;
+		eval_pool_cv.notify_all();
+	}
+
+	SchemeEval* acquire(AtomSpace* as)
+	{
+		auto begin = std::chrono::steady_clock::now();
+		std::unique_lock<std::mutex> lck(eval_pool_mtx);
+		while (true)
+		{
+			// The pool may have been removed while we waited.
+			if (eval_pool.empty())
+				return SchemeEval::get_evaluator(as);
+
+			for (const auto& slot : eval_pool)
+			{
+				if (slot->in_use) continue;
+				_start = std::chrono::steady_clock::now();
+				slot->in_use = true;
+				slot->wait += _start - begin;
+				_slot = slot.get();
+				held_slot = _slot;
+				return _slot->evaluator;
+			}
+			eval_pool_cv.wait(lck);
+		}
+	}
+};
+
+// Warm-up expression for one entry of the module list: a file to
+// load, or a module to use.
+static std::string warmup_expr(const std::string& mod)
+{
+	const std::string scm(".scm");
+	if (scm.size() < mod.size() and
+	    0 == mod.compare(mod.size() - scm.size(), scm.size(), scm))
+		return "(load-from-path \"" + mod + "\")";
+	if ('(' == mod[0])
+		return "(use-modules " + mod + ")";
+	return "(use-modules (" + mod + "))";
+}
+#endif // HAVE_GUILE
+
+void opencog::configure_evaluator_pool(size_t size,
+                                       const std::vector<std::string>& modules)
+{
+#ifdef HAVE_GUILE
+	// Create and warm up the new evaluators before publishing them.
+	std::vector<std::unique_ptr<PoolSlot>> fresh;
+	size_t have;
+	{
+		std::lock_guard<std::mutex> lck(eval_pool_mtx);
+		have = eval_pool.size();
+	}
+	for (size_t i = have; i < size; i++)
+	{
+		SchemeEval* evaluator = new SchemeEval();
+		fresh.emplace_back(new PoolSlot{evaluator, false, 0,
+			std::chrono::nanoseconds(0), std::chrono::nanoseconds(0)});
+		init_evaluator(evaluator);
+		for (const std::string& mod : modules)
+		{
+			if (mod.empty()) continue;
+			evaluator->clear_pending();
+			std::string rv = evaluator->eval(warmup_expr(mod));
+			if (evaluator->eval_error() or evaluator->input_pending())
+			{
+				for (auto& slot : fresh) delete slot->evaluator;
+				throw RuntimeException(TRACE_INFO,
+				      "Python-Scheme Wrapper: Failed to load '%s'\n%s",
+				      mod.c_str(), rv.c_str());
+			}
+		}
+	}
+
+	// Wait for the pool to go idle, then grow or shrink it.
+	std::vector<std::unique_ptr<PoolSlot>> stale;
+	{
+		std::unique_lock<std::mutex> lck(eval_pool_mtx);
+		eval_pool_cv.wait(lck, [] {
+			for (const auto& slot : eval_pool)
+				if (slot->in_use) return false;
+			return true;
+		});
+		while (size < eval_pool.size())
+		{
+			stale.emplace_back(std::move(eval_pool.back()));
+			eval_pool.pop_back();
+		}
+		for (auto& slot : fresh)
+			if (eval_pool.size() < size)
+				eval_pool.emplace_back(std::move(slot));
+		eval_pool_size = eval_pool.size();
+		eval_pool_cv.notify_all();
+	}
+	for (auto& slot : stale) delete slot->evaluator;
+	for (auto& slot : fresh) if (slot) delete slot->evaluator;
+#else // HAVE_GUILE
+	throw RuntimeException(TRACE_INFO,
+	      "Python-Scheme Wrapper: Compiled without Guile support");
+#endif // HAVE_GUILE
+}
+
+std::vector<EvaluatorStats> opencog::get_evaluator_pool_stats(void)
+{
+	std::vector<EvaluatorStats> stats;
+#ifdef HAVE_GUILE
+	std::lock_guard<std::mutex> lck(eval_pool_mtx);
+	for (const auto& slot : eval_pool)
+	{
+		EvaluatorStats st;
+		st.calls = slot->calls;
+		st.busy = std::chrono::duration<double>(slot->busy).count();
+		st.wait = std::chrono::duration<double>(slot->wait).count();
+		st.in_use = slot->in_use;
+		stats.push_back(st);
+	}
+#endif // HAVE_GUILE
+	return stats;
+}
+
 // Convenience wrapper, for stand-alone usage.
 std::string opencog::eval_scheme(AtomSpace* as, const std::string &s)
 {
 #ifdef HAVE_GUILE
-	do_init();
 	OC_ASSERT(nullptr != as, "Cython failed to specify an atomspace!");
-	SchemeEval* evaluator = SchemeEval::get_evaluator(as);
-	evaluator->clear_pending();
-	evaluator->set_scheme_as(as);
+
+	EvalLease evaluator(as);
 	std::string scheme_return_value = evaluator->eval(s);
 
 	// If there's an error, the scheme_return_value will contain
@@ -79,12 +284,9 @@ std::string opencog::eval_scheme(AtomSpace* as, const std::string &s)
 ValuePtr opencog::eval_scheme_v(AtomSpace* as, const std::string &s)
 {
 #ifdef HAVE_GUILE
-	do_init();
 	OC_ASSERT(nullptr != as, "Cython failed to specify an atomspace!");
 
-	SchemeEval* evaluator = SchemeEval::get_evaluator(as);
-	evaluator->clear_pending();
-	evaluator->set_scheme_as(as);
+	EvalLease evaluator(as);
 	ValuePtr scheme_return_value = evaluator->eval_v(s);
 
 	if (evaluator->eval_error())
@@ -101,12 +303,9 @@ ValuePtr opencog::eval_scheme_v(AtomSpace* as, const std::string &s)
 Handle opencog::eval_scheme_h(AtomSpace* as, const std::string &s)
 {
 #ifdef HAVE_GUILE
-	do_init();
 	OC_ASSERT(nullptr != as, "Cython failed to specify an atomspace!");
 
-	SchemeEval* evaluator = SchemeEval::get_evaluator(as);
-	evaluator->clear_pending();
-	evaluator->set_scheme_as(as);
+	EvalLease evaluator(as);
 	Handle scheme_return_value = evaluator->eval_h(s);
 
 	if (evaluator->eval_error())
@@ -123,9 +322,7 @@ Handle opencog::eval_scheme_h(AtomSpace* as, const std::string &s)
 ValuePtr opencog::eval_scheme_as(const std::string &s)
 {
 #ifdef HAVE_GUILE
-	do_init();
-	SchemeEval* evaluator = SchemeEval::get_evaluator(nullptr);
-	evaluator->clear_pending();
+	EvalLease evaluator(nullptr);
 	const AtomSpacePtr& asp = evaluator->eval_as(s);
 
 	if (nullptr == asp)
@@ -141,3 +338,242 @@ ValuePtr opencog::eval_scheme_as(const std::string &s)
 	return nullptr;
 #endif // HAVE_GUILE
 }
+
+#ifdef HAVE_GUILE
+typedef PyObject* (*ValueWrapper)(const ValuePtr&);
+
+// Convert a guile object into the equivalent python object. Must be
+// called in guile mode, holding the GIL. Returns a new reference, or
+// NULL with a python exception set.
+static PyObject* scm_to_python(SCM sv, ValueWrapper wrap)
+{
+	if (scm_is_bool(sv))
+		return PyBool_FromLong(scm_is_true(sv));
+
+	if (scm_is_exact_integer(sv))
+	{
+		if (scm_is_signed_integer(sv, INT64_MIN, INT64_MAX))
+			return PyLong_FromLongLong(scm_to_int64(sv));
+
+		// Bignum: go through the decimal representation.
+		char* str = scm_to_utf8_string(scm_number_to_string(sv, SCM_UNDEFINED));
+		PyObject* pyo = PyLong_FromString(str, nullptr, 10);
+		free(str);
+		return pyo;
+	}
+
+	// Inexact reals, and exact rationals.
+	if (scm_is_real(sv))
+		return PyFloat_FromDouble(scm_to_double(sv));
+
+	if (scm_is_complex(sv))
+		return PyComplex_FromDoubles(scm_c_real_part(sv), scm_c_imag_part(sv));
+
+	if (scm_is_string(sv) or scm_is_symbol(sv) or scm_is_keyword(sv))
+	{
+		if (scm_is_symbol(sv)) sv = scm_symbol_to_string(sv);
+		else if (scm_is_keyword(sv))
+			sv = scm_symbol_to_string(scm_keyword_to_symbol(sv));
+		size_t len;
+		char* str = scm_to_utf8_stringn(sv, &len);
+		PyObject* pyo = PyUnicode_FromStringAndSize(str, len);
+		free(str);
+		return pyo;
+	}
+
+	if (scm_is_true(scm_char_p(sv)))
+	{
+		Py_UCS4 ch = SCM_CHAR(sv);
+		return PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND, &ch, 1);
+	}
+
+	// Proper lists become python lists; a lone pair, a 2-tuple.
+	if (scm_is_null(sv) or scm_is_true(scm_list_p(sv)))
+	{
+		PyObject* pylist = PyList_New(0);
+		if (nullptr == pylist) return nullptr;
+		for (; scm_is_pair(sv); sv = SCM_CDR(sv))
+		{
+			PyObject* item = scm_to_python(SCM_CAR(sv), wrap);
+			if (nullptr == item or 0 != PyList_Append(pylist, item))
+			{
+				Py_XDECREF(item);
+				Py_DECREF(pylist);
+				return nullptr;
+			}
+			Py_DECREF(item);
+		}
+		return pylist;
+	}
+
+	if (scm_is_pair(sv))
+	{
+		PyObject* car = scm_to_python(SCM_CAR(sv), wrap);
+		if (nullptr == car) return nullptr;
+		PyObject* cdr = scm_to_python(SCM_CDR(sv), wrap);
+		if (nullptr == cdr) { Py_DECREF(car); return nullptr; }
+		PyObject* pair = PyTuple_Pack(2, car, cdr);
+		Py_DECREF(car);
+		Py_DECREF(cdr);
+		return pair;
+	}
+
+	if (scm_is_vector(sv))
+	{
+		size_t len = scm_c_vector_length(sv);
+		PyObject* pylist = PyList_New(len);
+		if (nullptr == pylist) return nullptr;
+		for (size_t i = 0; i < len; i++)
+		{
+			PyObject* item = scm_to_python(scm_c_vector_ref(sv, i), wrap);
+			if (nullptr == item) { Py_DECREF(pylist); return nullptr; }
+			PyList_SET_ITEM(pylist, i, item);
+		}
+		return pylist;
+	}
+
+	ValuePtr vp(SchemeEval::protom_of(sv));
+	if (vp) return wrap(vp);
+
+	if (scm_is_eq(sv, SCM_UNSPECIFIED) or SCM_UNBNDP(sv))
+		Py_RETURN_NONE;
+
+	char* str = scm_to_utf8_string(scm_object_to_string(sv, SCM_UNDEFINED));
+	PyErr_Format(PyExc_TypeError,
+		"Python-Scheme Wrapper: no python equivalent for %s", str);
+	free(str);
+	return nullptr;
+}
+
+struct PyConversion
+{
+	ValueWrapper wrap;
+	PyObject* result;
+};
+
+static void convert_to_python(SCM sv, void* data)
+{
+	PyConversion* conv = (PyConversion*) data;
+	PyGILState_STATE gstate = PyGILState_Ensure();
+	conv->result = scm_to_python(sv, conv->wrap);
+	PyGILState_Release(gstate);
+}
+#endif // HAVE_GUILE
+
+// Convenience wrapper, for stand-alone usage.
+PyObject* opencog::eval_scheme_py(AtomSpace* as, const std::string &s,
+                                  PyObject* (*wrap)(const ValuePtr&))
+{
+#ifdef HAVE_GUILE
+	OC_ASSERT(nullptr != as, "Cython failed to specify an atomspace!");
+
+	EvalLease evaluator(as);
+
+	PyConversion conv = {wrap, nullptr};
+	evaluator->eval_scm(s, convert_to_python, &conv);
+	return conv.result;
+#else // HAVE_GUILE
+	PyGILState_STATE gstate = PyGILState_Ensure();
+	PyErr_SetString(PyExc_RuntimeError, "Compiled without Guile support");
+	PyGILState_Release(gstate);
+	return nullptr;
+#endif // HAVE_GUILE
+}
+
+// Convenience wrapper, for stand-alone usage. Evaluates all of the
+// expressions with one evaluator, set up just once for the batch.
+ValueSeq opencog::eval_scheme_many(AtomSpace* as,
+                                   const std::vector<std::string>& exprs)
+{
+	ValueSeq results;
+#ifdef HAVE_GUILE
+	OC_ASSERT(nullptr != as, "Cython failed to specify an atomspace!");
+
+	EvalLease evaluator(as);
+
+	results.reserve(exprs.size());
+	for (const std::string& s : exprs)
+	{
+		ValuePtr scheme_return_value = evaluator->eval_v(s);
+		if (evaluator->eval_error())
+			throw RuntimeException(TRACE_INFO,
+			       "Python-Scheme Wrapper: Failed to execute '%s'", s.c_str());
+		if (evaluator->input_pending())
+			throw RuntimeException(TRACE_INFO,
+			      "Python-Scheme Wrapper: Syntax error in input: '%s'", s.c_str());
+		results.emplace_back(scheme_return_value);
+	}
+#endif // HAVE_GUILE
+	return results;
+}
+
+/* ============================================================== */
+// Compiled expressions. The expression is wrapped in a lambda taking
+// the given parameters, compiled once by Guile, and bound to a fresh
+// top-level name. Invoking it is then an ordinary procedure call: the
+// string is not parsed again.
+
+static std::atomic<unsigned long> compiled_count(0);
+
+std::string opencog::compile_scheme(const std::vector<std::string>& params,
+                                    const std::string& expr)
+{
+#ifdef HAVE_GUILE
+	std::string name = "py-compiled-" + std::to_string(compiled_count++);
+
+	std::string lambda = "(lambda (";
+	for (const std::string& p : params)
+		lambda += p + " ";
+	lambda += ") " + expr + ")";
+
+	std::string def = "(define " + name +
+		" ((@ (system base compile) compile) '" + lambda +
+		" #:env (current-module)))";
+
+	EvalLease evaluator(nullptr);
+	std::string scheme_return_value = evaluator->eval(def);
+
+	if (evaluator->eval_error())
+		throw RuntimeException(TRACE_INFO,
+		       "Python-Scheme Wrapper: Failed to compile '%s'\n%s",
+		       expr.c_str(), scheme_return_value.c_str());
+
+	if (evaluator->input_pending())
+	{
+		evaluator->clear_pending();
+		throw RuntimeException(TRACE_INFO,
+		      "Python-Scheme Wrapper: Syntax error in input: '%s'", expr.c_str());
+	}
+
+	return name;
+#else // HAVE_GUILE
+	throw RuntimeException(TRACE_INFO,
+	      "Python-Scheme Wrapper: Compiled without Guile support");
+#endif // HAVE_GUILE
+}
+
+ValuePtr opencog::apply_scheme(AtomSpace* as, const std::string& name,
+                               const HandleSeq& args)
+{
+#ifdef HAVE_GUILE
+	OC_ASSERT(nullptr != as, "Cython failed to specify an atomspace!");
+
+	EvalLease evaluator(as);
+
+	// apply_v() unpacks a ListLink into the argument list.
+	ValuePtr varargs;
+	if (not args.empty())
+		varargs = createLink(HandleSeq(args), LIST_LINK);
+	return evaluator->apply_v(name, varargs);
+#else // HAVE_GUILE
+	return nullptr;
+#endif // HAVE_GUILE
+}
+
+void opencog::release_scheme(const std::string& name)
+{
+#ifdef HAVE_GUILE
+	EvalLease evaluator(nullptr);
+	evaluator->eval("(module-remove! (current-module) '" + name + ")");
+#endif // HAVE_GUILE
+}
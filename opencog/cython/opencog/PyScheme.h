@@ -3,7 +3,9 @@
 #define _OPENCOG_PYTHON_SCHEME_H
 
 #include <string>
+#include <vector>
 #include <opencog/atomspace/AtomSpace.h>
+#include <opencog/cython/PyIncludeWrapper.h>
 
 namespace opencog
 {
@@ -14,6 +16,33 @@ ValuePtr eval_scheme_v(AtomSpace*, const std::string &);
 Handle eval_scheme_h(AtomSpace*, const std::string &);
 ValuePtr eval_scheme_as(const std::string &);
 
+/** Evaluate, converting the result directly to a python object.
+ *  Atoms and Values are wrapped with the given function. Returns
+ *  a new reference, or NULL with a python exception set. */
+PyObject* eval_scheme_py(AtomSpace*, const std::string &,
+                         PyObject* (*)(const ValuePtr&));
+
+ValueSeq eval_scheme_many(AtomSpace*, const std::vector<std::string>&);
+
+/** Evaluator pool shared by python threads; see scheme.pyx */
+struct EvaluatorStats
+{
+	size_t calls;   // calls completed
+	double busy;    // seconds spent evaluating
+	double wait;    // seconds callers spent waiting for it
+	bool in_use;
+};
+void configure_evaluator_pool(size_t size,
+                              const std::vector<std::string>& modules);
+std::vector<EvaluatorStats> get_evaluator_pool_stats(void);
+
+/** Compiled scheme expressions; see CompiledScheme in scheme.pyx */
+std::string compile_scheme(const std::vector<std::string>& params,
+                           const std::string& expr);
+ValuePtr apply_scheme(AtomSpace*, const std::string& name,
+                      const HandleSeq& args);
+void release_scheme(const std::string& name);
+
 } // namespace opencog
 
 #endif // _OPENCOG_PYTHON_SCHEME_H
@@ -0,0 +1,187 @@
+/*
+ * opencog/cython/opencog/QueryStream.cc
+ *
+ * Copyright (C) 2026 by The OpenCog Foundation
+ * All Rights Reserved
+ *
+ * This program is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU Affero General Public License v3 as
+ * published by the Free Software Foundation and including the exceptions
+ * at http://opencog.org/wiki/Licenses
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Affero General Public License
+ * along with this program; if not, write to:
+ * Free Software Foundation, Inc.,
+ * 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+ */
+
+#include <opencog/util/exceptions.h>
+#include <opencog/atoms/execution/Instantiator.h>
+#include <opencog/atoms/pattern/PatternLink.h>
+#include <opencog/query/Implicator.h>
+#include <opencog/query/InitiateSearchMixin.h>
+#include <opencog/query/Satisfier.h>
+
+#include "QueryStream.h"
+
+using namespace opencog;
+
+QueryStream::QueryStream(size_t capacity) :
+	_capacity(0 < capacity ? capacity : 1),
+	_count(0),
+	_closed(true),
+	_finished(false),
+	_cancel(false)
+{
+}
+
+// ==============================================================
+
+void QueryStream::run(AtomSpace* as, const Handle& query)
+{
+	// The search stops before its next candidate, once cancelled.
+	const std::atomic<bool>* prev =
+		InitiateSearchMixin::set_cancel_flag(&_cancel);
+
+	std::exception_ptr error;
+	try
+	{
+		ValuePtr self(shared_from_this());
+		ContainerValuePtr cvp(ContainerValueCast(self));
+		PatternLinkPtr plp(PatternLinkCast(query));
+
+		if (nullptr != plp and query->is_type(QUERY_LINK))
+		{
+			Implicator impl(as, cvp);
+			impl.satisfy(plp);
+
+			// No groundings at all; same special case for
+			// AbsentLinks as in QueryLink::do_execute().
+			const Pattern& pat = plp->get_pattern();
+			if (0 == _count and 0 == pat.pmandatory.size()
+			    and 0 < pat.absents.size()
+			    and not impl.optionals_present())
+			{
+				Instantiator inst(as);
+				for (const Handle& himp : plp->get_implicand())
+					add(inst.execute(himp, true));
+			}
+		}
+		else if (nullptr != plp and query->is_type(MEET_LINK))
+		{
+			SatisfyingSet sater(as, cvp);
+			sater.satisfy(plp);
+		}
+		else
+			throw InvalidParamException(TRACE_INFO,
+				"Expecting a QueryLink or a MeetLink, got %s",
+				query->to_short_string().c_str());
+	}
+	catch (...)
+	{
+		// Nobody is listening for errors once cancelled.
+		if (not _cancel) error = std::current_exception();
+	}
+
+	InitiateSearchMixin::set_cancel_flag(prev);
+	finish(error);
+}
+
+void QueryStream::finish(std::exception_ptr error)
+{
+	std::lock_guard<std::mutex> lck(_mtx);
+	_finished = true;
+	_error = error;
+	_not_empty.notify_all();
+}
+
+size_t QueryStream::next_batch(ValueSeq& out, size_t n)
+{
+	std::unique_lock<std::mutex> lck(_mtx);
+	_not_empty.wait(lck, [&] { return not _items.empty() or _finished; });
+
+	size_t moved = 0;
+	while (moved < n and not _items.empty())
+	{
+		out.emplace_back(std::move(_items.front()));
+		_items.pop_front();
+		moved++;
+	}
+	if (0 < moved)
+	{
+		_not_full.notify_all();
+		return moved;
+	}
+
+	// Errors come after all of the results found before them.
+	if (_error) std::rethrow_exception(_error);
+	return 0;
+}
+
+void QueryStream::cancel(void)
+{
+	std::lock_guard<std::mutex> lck(_mtx);
+	_cancel = true;
+	_items.clear();
+	_not_full.notify_all();
+}
+
+// ==============================================================
+
+void QueryStream::open(void)
+{
+	std::lock_guard<std::mutex> lck(_mtx);
+	_closed = false;
+}
+
+void QueryStream::close(void)
+{
+	std::lock_guard<std::mutex> lck(_mtx);
+	_closed = true;
+}
+
+bool QueryStream::is_closed(void) const
+{
+	std::lock_guard<std::mutex> lck(_mtx);
+	return _closed;
+}
+
+void QueryStream::add(const ValuePtr& vp)
+{
+	add(ValuePtr(vp));
+}
+
+void QueryStream::add(ValuePtr&& vp)
+{
+	std::unique_lock<std::mutex> lck(_mtx);
+	if (_seen.end() != _seen.find(vp)) return;
+	_not_full.wait(lck, [&] { return _items.size() < _capacity or _cancel; });
+	if (_cancel) return;
+
+	// Check again; the same result may have been added meanwhile.
+	if (not _seen.insert(vp).second) return;
+	_items.emplace_back(std::move(vp));
+	_count++;
+	_not_empty.notify_one();
+}
+
+ValuePtr QueryStream::remove(void)
+{
+	ValueSeq out;
+	if (0 == next_batch(out, 1)) return nullptr;
+	return out[0];
+}
+
+void QueryStream::clear(void)
+{
+	std::lock_guard<std::mutex> lck(_mtx);
+	_items.clear();
+	_not_full.notify_all();
+}
+
+/* ===================== END OF FILE ===================== */
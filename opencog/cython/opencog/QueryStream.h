@@ -0,0 +1,104 @@
+/*
+ * opencog/cython/opencog/QueryStream.h
+ *
+ * Copyright (C) 2026 by The OpenCog Foundation
+ * All Rights Reserved
+ *
+ * This program is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU Affero General Public License v3 as
+ * published by the Free Software Foundation and including the exceptions
+ * at http://opencog.org/wiki/Licenses
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Affero General Public License
+ * along with this program; if not, write to:
+ * Free Software Foundation, Inc.,
+ * 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+ */
+
+#ifndef _OPENCOG_QUERY_STREAM_H
+#define _OPENCOG_QUERY_STREAM_H
+
+#include <atomic>
+#include <condition_variable>
+#include <deque>
+#include <exception>
+#include <mutex>
+
+#include <opencog/atoms/base/Handle.h>
+#include <opencog/atoms/value/ContainerValue.h>
+#include <opencog/atomspace/AtomSpace.h>
+
+namespace opencog {
+
+/**
+ * Bounded channel carrying the results of a query from the thread
+ * running the search to a consumer, used by AtomSpace.iter_query()
+ * in python. The search is given the channel as its result container;
+ * it blocks in add() while the channel is full, so that the search
+ * runs no further ahead of the consumer than the channel capacity.
+ *
+ * Results are deduplicated, as they are by the UnisetValue that
+ * execute() collects them in: the search may find the same grounding
+ * more than once, but each is sent down the channel only once.
+ *
+ * Once cancelled, the channel drops whatever is added to it, and the
+ * search stops before exploring its next candidate start point.
+ */
+class QueryStream
+	: public ContainerValue
+{
+protected:
+	mutable std::mutex _mtx;
+	std::condition_variable _not_full;
+	std::condition_variable _not_empty;
+	std::deque<ValuePtr> _items;
+	ValueSet _seen;
+	size_t _capacity;
+	size_t _count;
+	bool _closed;
+	bool _finished;
+	std::atomic<bool> _cancel;
+	std::exception_ptr _error;
+
+	void finish(std::exception_ptr);
+
+public:
+	QueryStream(size_t capacity);
+	virtual ~QueryStream() {}
+
+	/// Run the query (a QueryLink or a MeetLink) on the calling
+	/// thread, sending its results down the channel. Returns when the
+	/// search is done or cancelled. Errors are handed to the consumer.
+	void run(AtomSpace*, const Handle&);
+
+	/// Move up to n results into the sequence, waiting until there is
+	/// at least one, or the search is over. Returns the number moved;
+	/// zero means that there are no more. Re-throws search errors.
+	size_t next_batch(ValueSeq&, size_t n);
+
+	/// Stop the search, and drop any results not yet consumed.
+	void cancel(void);
+
+	// The ContainerValue API, used by the query engine.
+	virtual void open(void);
+	virtual void close(void);
+	virtual bool is_closed(void) const;
+	virtual void add(const ValuePtr&);
+	virtual void add(ValuePtr&&);
+	virtual ValuePtr remove(void);
+	virtual void clear(void);
+};
+
+typedef std::shared_ptr<QueryStream> QueryStreamPtr;
+
+static inline QueryStreamPtr createQueryStream(size_t capacity)
+	{ return std::make_shared<QueryStream>(capacity); }
+
+} // namespace opencog
+
+#endif // _OPENCOG_QUERY_STREAM_H
@@ -31,6 +31,30 @@ void opencog::finalize_python()
     global_python_finalize();
 }
 
+void opencog::clear_python_function_cache(const std::string& func)
+{
+    PythonEval::instance().clear_function_cache(func);
+}
+
+void opencog::get_python_function_cache_stats(size_t& hits, size_t& misses,
+                                              size_t& size)
+{
+    PythonEval& pyev = PythonEval::instance();
+    hits = pyev.function_cache_hits();
+    misses = pyev.function_cache_misses();
+    size = pyev.function_cache_size();
+}
+
+void opencog::set_python_max_concurrent_calls(size_t n)
+{
+    PythonEval::set_max_concurrent_calls(n);
+}
+
+size_t opencog::get_python_max_concurrent_calls()
+{
+    return PythonEval::get_max_concurrent_calls();
+}
+
 Handle opencog::add_node(Type t, std::string name) {
     AtomSpacePtr atomspace = get_context_atomspace();
     if (atomspace == nullptr){
@@ -29,6 +29,11 @@ namespace opencog {
 
 void initialize_python();
 void finalize_python();
+void clear_python_function_cache(const std::string&);
+void get_python_function_cache_stats(size_t& hits, size_t& misses,
+                                     size_t& size);
+void set_python_max_concurrent_calls(size_t);
+size_t get_python_max_concurrent_calls();
 Handle add_node(Type, std::string);
 Handle add_link(Type, HandleSeq);
 AtomSpacePtr get_context_atomspace(void);
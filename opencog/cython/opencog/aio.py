@@ -0,0 +1,123 @@
+"""
+Awaitable versions of the blocking AtomSpace calls, for asyncio.
+
+Each coroutine hands the C++ work to a thread pool, and completes when
+that work is done; the GIL is released while the C++ code runs, so the
+event loop stays responsive during long queries. Example:
+
+    from opencog.aio import aexecute, ascheme_eval
+
+    result = await aexecute(atomspace, query)
+    text = await ascheme_eval(atomspace, "(cog-execute! q)")
+
+Cancelling the awaiting task (directly, or with asyncio.wait_for)
+cancels any pattern search running in the worker thread: the search
+stops before its next candidate start point, and CancelledError is
+raised in the task right away. Work that is not a pattern search (a
+long python callback, say) is not interrupted; its result is dropped.
+
+The pool is created on first use. Use set_executor() to supply a
+different concurrent.futures.Executor, e.g. one with more workers.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from opencog.atomspace import CancelToken
+from opencog.execute import evaluate_atom
+from opencog.utilities import push_default_atomspace, pop_default_atomspace
+
+__all__ = ["arun", "aexecute", "aevaluate",
+           "ascheme_eval", "ascheme_eval_v", "ascheme_eval_h",
+           "get_executor", "set_executor", "shutdown"]
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Return the executor used to run the blocking calls."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(thread_name_prefix="opencog-aio")
+        return _executor
+
+
+def set_executor(executor):
+    """Use executor for subsequent calls. The previous executor is
+    not shut down; that is up to the caller."""
+    global _executor
+    with _executor_lock:
+        _executor = executor
+
+
+def shutdown(wait=True):
+    """Shut down the default pool. A new one is created on next use."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+def _run_cancellable(token, atomspace, func, args, kwargs):
+    # The default atomspace is thread-local; set it for the worker, so
+    # that python callbacks creating atoms land in the right place.
+    if atomspace is not None:
+        push_default_atomspace(atomspace)
+    try:
+        with token:
+            return func(*args, **kwargs)
+    finally:
+        if atomspace is not None:
+            pop_default_atomspace()
+
+
+async def arun(func, *args, atomspace=None, **kwargs):
+    """Run func(*args, **kwargs) in the pool, under a CancelToken.
+
+    If atomspace is given, it is the default atomspace of the worker
+    thread for the duration of the call.
+    """
+    loop = asyncio.get_running_loop()
+    token = CancelToken()
+    call = functools.partial(_run_cancellable, token, atomspace,
+                             func, args, kwargs)
+    future = loop.run_in_executor(get_executor(), call)
+    try:
+        return await future
+    except asyncio.CancelledError:
+        token.cancel()
+        raise
+
+
+async def aexecute(atomspace, atom, parallel=None):
+    """Awaitable AtomSpace.execute()."""
+    return await arun(atomspace.execute, atom, parallel=parallel,
+                      atomspace=atomspace)
+
+
+async def aevaluate(atomspace, atom):
+    """Awaitable opencog.execute.evaluate_atom()."""
+    return await arun(evaluate_atom, atomspace, atom, atomspace=atomspace)
+
+
+async def ascheme_eval(atomspace, code):
+    """Awaitable opencog.scheme.scheme_eval()."""
+    from opencog.scheme import scheme_eval
+    return await arun(scheme_eval, atomspace, code, atomspace=atomspace)
+
+
+async def ascheme_eval_v(atomspace, code):
+    """Awaitable opencog.scheme.scheme_eval_v()."""
+    from opencog.scheme import scheme_eval_v
+    return await arun(scheme_eval_v, atomspace, code, atomspace=atomspace)
+
+
+async def ascheme_eval_h(atomspace, code):
+    """Awaitable opencog.scheme.scheme_eval_h()."""
+    from opencog.scheme import scheme_eval_h
+    return await arun(scheme_eval_h, atomspace, code, atomspace=atomspace)
@@ -15,6 +15,8 @@ cdef class Atom(Value):
     
     @staticmethod
     cdef Atom createAtom(const cHandle& handle):
+        if _atom_cache_enabled and handle.get() != NULL:
+            return cached_atom_wrapper(<cValuePtr&>handle, Atom)
         return Atom(PtrHolder.create(<shared_ptr[void]&>handle))
 
     cdef cHandle get_c_handle(Atom self):
@@ -61,6 +63,30 @@ cdef class Atom(Value):
             raise RuntimeError("Null Atom!")
         atom_ptr.setTruthValue(deref((<TruthValue>truth_value)._tvptr()))
 
+    @property
+    def mean(self):
+        """The mean (strength) of the TruthValue. Unlike atom.tv.mean,
+        this does not create a python TruthValue."""
+        cdef cAtom* atom_ptr = self.handle.atom_ptr()
+        if atom_ptr == NULL:   # avoid null-pointer deref
+            raise RuntimeError("Null Atom!")
+        cdef tv_ptr tvp = atom_ptr.getTruthValue()
+        if (not tvp.get()):
+            raise AttributeError('cAtom returned NULL TruthValue pointer')
+        return tvp.get().get_mean()
+
+    @property
+    def confidence(self):
+        """The confidence of the TruthValue. Unlike atom.tv.confidence,
+        this does not create a python TruthValue."""
+        cdef cAtom* atom_ptr = self.handle.atom_ptr()
+        if atom_ptr == NULL:   # avoid null-pointer deref
+            raise RuntimeError("Null Atom!")
+        cdef tv_ptr tvp = atom_ptr.getTruthValue()
+        if (not tvp.get()):
+            raise AttributeError('cAtom returned NULL TruthValue pointer')
+        return tvp.get().get_confidence()
+
     def id_string(self):
         return self.get_c_handle().get().id_to_string().decode('UTF-8')
 
@@ -129,8 +155,85 @@ cdef class Atom(Value):
         atom_ptr.getIncomingSetByType(back_inserter(handle_vector), type)
         return convert_handle_seq_to_python_list(handle_vector)
 
-    def truth_value(self, mean, count):
-        self.tv = createTruthValue(mean, count)
+    @property
+    def incoming_size(self):
+        """The number of Links holding this Atom; nothing is copied."""
+        cdef cAtom* atom_ptr = self.handle.atom_ptr()
+        if atom_ptr == NULL:   # avoid null-pointer deref
+            raise RuntimeError("Null Atom!")
+        return atom_ptr.getIncomingSetSize()
+
+    def incoming_size_by_type(self, Type type):
+        cdef cAtom* atom_ptr = self.handle.atom_ptr()
+        if atom_ptr == NULL:   # avoid null-pointer deref
+            raise RuntimeError("Null Atom!")
+        return atom_ptr.getIncomingSetSizeByType(type)
+
+    def iter_incoming(self, type=None, limit=None):
+        """
+        Iterate over the incoming set, wrapping Atoms only as they are
+        consumed. The incoming set is snapshotted one Link type at a
+        time, as the iteration reaches that type; or all at once, if
+        all of it is wanted.
+
+        type -- only visit Links of exactly this type.
+        limit -- stop after this many Links. None means no limit.
+        """
+        cdef cAtom* atom_ptr = self.handle.atom_ptr()
+        if atom_ptr == NULL:   # avoid null-pointer deref
+            raise RuntimeError("Null Atom!")
+        if limit is not None and limit < 0:
+            raise ValueError("limit must not be negative")
+        if type is not None and not nameserver().isLink(type):
+            raise ValueError("Not a Link type: {0}".format(type))
+        return self._iter_incoming(type, -1 if limit is None else limit)
+
+    def _iter_incoming(self, type, Py_ssize_t remaining):
+        cdef cAtom* atom_ptr = self.handle.atom_ptr()
+        cdef vector[cHandle] batch
+        cdef vector[Type] link_types
+        cdef Type t
+        cdef size_t i, j
+
+        # If every Link is wanted, take them in one go, rather than
+        # looking up each Link type in turn.
+        if type is None:
+            whole = remaining < 0
+        else:
+            whole = (atom_ptr.getIncomingSetSizeByType(type)
+                     == atom_ptr.getIncomingSetSize())
+
+        if whole:
+            atom_ptr.getIncomingIter(back_inserter(batch))
+            link_types.push_back(NOTYPE)
+        elif type is not None:
+            link_types.push_back(type)
+        else:
+            for t in range(nameserver().getNumberOfClasses()):
+                if nameserver().isLink(t):
+                    link_types.push_back(t)
+
+        for i in range(link_types.size()):
+            if 0 == remaining:
+                return
+            if not whole:
+                batch.clear()
+                atom_ptr.getIncomingSetByType(back_inserter(batch),
+                                              link_types[i])
+            for j in range(batch.size()):
+                if 0 == remaining:
+                    return
+                if 0 < remaining:
+                    remaining -= 1
+                yield create_python_value_from_c_value(<cValuePtr&>(batch[j]))
+
+    def truth_value(self, double mean, double count):
+        cdef cAtom* atom_ptr = self.handle.atom_ptr()
+        if atom_ptr == NULL:   # avoid null-pointer deref
+            raise RuntimeError("Null Atom!")
+        cdef tv_ptr tvp
+        tvp.reset(new cSimpleTruthValue(mean, count))
+        atom_ptr.setTruthValue(tvp)
         return self
 
     def is_executable(self):
@@ -142,6 +245,7 @@ cdef class Atom(Value):
     def execute(self):
         """
         Execute the Atom, returning the result of execution.
+        The GIL is released for the duration of the execution.
 
         :returns: A Value
         """
@@ -151,7 +255,9 @@ cdef class Atom(Value):
         if not atom_ptr.is_executable():
             return self
 
-        cdef cValuePtr c_value_ptr = atom_ptr.execute()
+        cdef cValuePtr c_value_ptr
+        with nogil:
+            c_value_ptr = atom_ptr.execute()
         return create_python_value_from_c_value(c_value_ptr)
 
     def __richcmp__(self, other, int op):
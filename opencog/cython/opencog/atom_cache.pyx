@@ -0,0 +1,54 @@
+import weakref
+
+# Optional cache of python Atom wrappers, keyed on the address of the
+# C++ Atom. With it enabled, asking for the same Atom twice (by name,
+# via get_out(), the incoming set, query results ...) hands back the
+# same python object, so that its cached name and outgoing set get
+# re-used, and no new wrapper is allocated.
+#
+# The cache holds only weak references: it never keeps a wrapper, and
+# thus never keeps an Atom alive. A live wrapper holds a reference to
+# its C++ Atom, so a cached address cannot be re-used by some other
+# Atom while its entry is still present. The cache is process-wide,
+# rather than per-AtomSpace, since python AtomSpace objects are
+# themselves short-lived wrappers, and an Atom lives in at most one
+# AtomSpace anyway.
+
+cdef bint _atom_cache_enabled = False
+cdef object _atom_cache = weakref.WeakValueDictionary()
+cdef size_t _atom_cache_hits = 0
+cdef size_t _atom_cache_misses = 0
+
+def enable_atom_cache(bint enable=True):
+    """Turn the Atom wrapper cache on or off. Turning it off empties it."""
+    global _atom_cache_enabled
+    _atom_cache_enabled = enable
+    if not enable:
+        _atom_cache.clear()
+
+def clear_atom_cache():
+    """Drop all cached wrappers and reset the hit/miss counters."""
+    global _atom_cache_hits, _atom_cache_misses
+    _atom_cache.clear()
+    _atom_cache_hits = 0
+    _atom_cache_misses = 0
+
+def atom_cache_stats():
+    """Return a dict holding the cache hits, misses and current size."""
+    return {"enabled": _atom_cache_enabled,
+            "hits": _atom_cache_hits,
+            "misses": _atom_cache_misses,
+            "size": len(_atom_cache)}
+
+cdef object cached_atom_wrapper(const cValuePtr& value, object clazz):
+    """Return the cached wrapper for this Atom, creating it if needed."""
+    global _atom_cache_hits, _atom_cache_misses
+    key = <size_t> value.get()
+    atom = _atom_cache.get(key)
+    if atom is not None:
+        _atom_cache_hits += 1
+        return atom
+    _atom_cache_misses += 1
+    atom = clazz(PtrHolder.create(<shared_ptr[void]&>value))
+    _atom_cache[key] = atom
+    return atom
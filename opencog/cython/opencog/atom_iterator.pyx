@@ -0,0 +1,72 @@
+from libcpp.vector cimport vector
+
+# from atomspace cimport AtomSpace, cHandle, Type, nameserver
+
+cdef class AtomIterator:
+    """Iterate over the Atoms of a given type in an AtomSpace.
+
+    Atoms are fetched one type at a time: the Handles of a single
+    (exact) type are copied out of the TypeIndex, and python wrappers
+    are created only as the iterator is advanced. Thus, only one type's
+    worth of Handles, and no wrappers at all, are held at any moment,
+    instead of a list of wrappers for the whole AtomSpace.
+
+    Semantics under concurrent update: each type is snapshotted when
+    the iterator reaches it. Atoms added to a type after its snapshot
+    are not seen; Atoms added to types not yet reached are seen. Atoms
+    removed after the snapshot are still returned; they remain valid
+    (but orphaned) for as long as they are referenced.
+
+    limit -- stop after this many Atoms. None means no limit.
+    """
+    cdef AtomSpace atomspace
+    cdef vector[Type] types
+    cdef size_t type_pos
+    cdef vector[cHandle] batch
+    cdef size_t batch_pos
+    cdef Py_ssize_t remaining
+
+    def __cinit__(self, AtomSpace atomspace, Type t, bint subtype=True,
+                  limit=None):
+        if atomspace.atomspace == NULL:
+            raise RuntimeError("Null AtomSpace!")
+        self.atomspace = atomspace
+        self.type_pos = 0
+        self.batch_pos = 0
+        if limit is not None and limit < 0:
+            raise ValueError("limit must not be negative")
+        self.remaining = -1 if limit is None else limit
+
+        cdef Type nt = nameserver().getNumberOfClasses()
+        cdef Type ty
+        self.types.push_back(t)
+        if subtype:
+            for ty in range(t + 1, nt):
+                if nameserver().isA(ty, t):
+                    self.types.push_back(ty)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        cdef cAtomSpace* asp = self.atomspace.atomspace
+        cdef Type ty
+        if 0 == self.remaining:
+            raise StopIteration
+
+        while self.batch_pos >= self.batch.size():
+            if self.type_pos >= self.types.size():
+                self.batch.clear()
+                raise StopIteration
+            ty = self.types[self.type_pos]
+            self.type_pos += 1
+            self.batch.clear()
+            self.batch_pos = 0
+            with nogil:
+                asp.get_handles_by_type(self.batch, ty, False)
+
+        cdef size_t i = self.batch_pos
+        self.batch_pos += 1
+        if 0 < self.remaining:
+            self.remaining -= 1
+        return create_python_value_from_c_value(<cValuePtr&>(self.batch[i]))
@@ -1,6 +1,7 @@
 from libcpp cimport bool
 from libcpp.vector cimport vector
 from libcpp.memory cimport shared_ptr
+from libcpp.map cimport map as cpp_map
 from libcpp.set cimport set as cpp_set
 from libcpp.string cimport string
 from cython.operator cimport dereference as deref
@@ -33,6 +34,7 @@ cdef extern from "opencog/atoms/atom_types/NameServer.h" namespace "opencog":
         bint isDefined(string typename)
         Type getType(string typename)
         string getTypeName(Type t)
+        string getTypeShortName(Type t)
         Type getNumberOfClasses()
 
         bint beginTypeDecls(const char* module)
@@ -43,6 +45,7 @@ cdef extern from "opencog/atoms/atom_types/NameServer.h" namespace "opencog":
 
 cdef extern from "opencog/atoms/atom_types/atom_types.h" namespace "opencog":
     cdef Type NOTYPE
+    cdef Type FLOAT_VALUE
 
 # Value
 cdef extern from "opencog/atoms/value/Value.h" namespace "opencog":
@@ -82,8 +85,8 @@ cdef extern from "opencog/atoms/truthvalue/TruthValue.h" namespace "opencog":
     ctypedef shared_ptr[const cTruthValue] tv_ptr "opencog::TruthValuePtr"
 
     cdef cppclass cTruthValue "const opencog::TruthValue"(cValue):
-        strength_t get_mean()
-        confidence_t get_confidence()
+        strength_t get_mean() nogil
+        confidence_t get_confidence() nogil
         count_t get_count()
         @staticmethod
         tv_ptr DEFAULT_TV()
@@ -92,7 +95,7 @@ cdef extern from "opencog/atoms/truthvalue/TruthValue.h" namespace "opencog":
 
 cdef extern from "opencog/atoms/truthvalue/SimpleTruthValue.h" namespace "opencog":
     cdef cppclass cSimpleTruthValue "opencog::SimpleTruthValue"(cTruthValue):
-        cSimpleTruthValue(double, double)
+        cSimpleTruthValue(double, double) nogil
         strength_t get_mean()
         confidence_t get_confidence()
         count_t get_count()
@@ -124,16 +127,18 @@ cdef extern from "opencog/atoms/base/Atom.h" namespace "opencog":
 
         output_iterator getIncomingIter(output_iterator)
 
-        tv_ptr getTruthValue()
+        tv_ptr getTruthValue() nogil
         void setTruthValue(tv_ptr tvp)
         void setValue(const cHandle& key, const cValuePtr& value)
         cValuePtr getValue(const cHandle& key) const
         cpp_set[cHandle] getKeys()
 
         output_iterator getIncomingSetByType(output_iterator, Type type)
+        size_t getIncomingSetSize()
+        size_t getIncomingSetSizeByType(Type type)
 
         bool is_executable()
-        cValuePtr execute() except +
+        cValuePtr execute() except + nogil
 
         string to_string()
         string to_short_string()
@@ -177,6 +182,7 @@ cdef class Atom(Value):
     cdef object _atom_type
     cdef object _name
     cdef object _outgoing
+    cdef object __weakref__
     cdef cHandle get_c_handle(Atom self)
     # Cython compiler complains that signature of the method should be
     # compatible with one from the parent class. It is the reason why we cannot
@@ -186,46 +192,182 @@ cdef class Atom(Value):
 
 
 cdef vector[cHandle] atom_list_to_vector(list lst);
+cdef vector[cHandle] atom_seq_to_vector(object seq);
+
+# Compact, read-only array of Handles. Atom wrappers are created only
+# when elements are accessed.
+cdef class HandleArray:
+    cdef vector[cHandle] handles
+
+    @staticmethod
+    cdef HandleArray create(vector[cHandle]& handles)
+
+# Query result cache
+cdef extern from "opencog/atomspace/QueryCache.h" namespace "opencog":
+    cdef cppclass cQueryCacheStats "opencog::QueryCache::Stats":
+        size_t hits
+        size_t misses
+        size_t stale
+        size_t evictions
+        size_t size
+        size_t capacity
+    cdef cppclass cQueryCache "opencog::QueryCache":
+        cQueryCacheStats get_stats()
+        void clear()
 
 # AtomSpace
 cdef extern from "opencog/atomspace/AtomSpace.h" namespace "opencog":
     cdef cppclass cAtomSpace "opencog::AtomSpace":
         cHandle add_atom(cHandle handle) except +
 
-        cHandle xadd_node(Type t, string s) except +
+        cHandle xadd_node(Type t, string s) except + nogil
         cHandle add_node(Type t, string s, tv_ptr tvn) except +
 
-        cHandle xadd_link(Type t, vector[cHandle]) except +
+        cHandle xadd_link(Type t, vector[cHandle]) except + nogil
         cHandle add_link(Type t, vector[cHandle], tv_ptr tvn) except +
 
         cHandle xget_handle(Type t, string s)
         cHandle xget_handle(Type t, vector[cHandle])
 
-        cHandle set_value(cHandle h, cHandle key, cValuePtr value)
-        cHandle set_truthvalue(cHandle h, tv_ptr tvn)
+        cHandle set_value(cHandle h, cHandle key, cValuePtr value) except + nogil
+        cHandle set_truthvalue(cHandle h, tv_ptr tvn) except + nogil
         cHandle get_atom(cHandle & h)
         bint is_valid_handle(cHandle h)
         int get_size()
+        size_t get_num_atoms_of_type(Type t, bint subclass)
         string get_name()
 
         # ==== query methods ====
         # get by type
-        void get_handles_by_type(vector[cHandle], Type t, bint subclass)
+        void get_handles_by_type(vector[cHandle]&, Type t, bint subclass) nogil
 
         void clear()
         bint extract_atom(cHandle h, bint recursive)
 
+        void set_query_cache(size_t capacity)
+        shared_ptr[cQueryCache] get_query_cache()
+
     cdef cValuePtr createAtomSpace(cAtomSpace *parent)
     cdef cValuePtr as_cast "AtomSpaceCast"(cAtomSpace *) except +
 
 
 cdef AtomSpace_factoid(cValuePtr to_wrap)
 
+# Cancellation, parallelism and planning of the pattern searches run
+# on the current thread.
+cdef extern from "<atomic>" namespace "std":
+    cdef cppclass cAtomicBool "std::atomic<bool>":
+        cAtomicBool(bool)
+        void store(bool) nogil
+        bool load() nogil
+
+cdef extern from "opencog/query/InitiateSearchMixin.h" namespace "opencog":
+    const cAtomicBool* set_search_cancel_flag \
+        "opencog::InitiateSearchMixin::set_cancel_flag"(const cAtomicBool*) nogil
+    size_t set_search_parallel \
+        "opencog::InitiateSearchMixin::set_parallel"(size_t) nogil
+    size_t get_search_parallel \
+        "opencog::InitiateSearchMixin::get_parallel"() nogil
+
+    ctypedef enum cSearchPlanner "opencog::InitiateSearchMixin::SearchPlanner":
+        LEGACY_PLANNER "opencog::InitiateSearchMixin::LEGACY_PLANNER"
+        COST_PLANNER "opencog::InitiateSearchMixin::COST_PLANNER"
+    cSearchPlanner set_search_planner \
+        "opencog::InitiateSearchMixin::set_planner"(cSearchPlanner) nogil
+    cSearchPlanner get_search_planner \
+        "opencog::InitiateSearchMixin::get_planner"() nogil
+
+cdef class CancelToken:
+    cdef cAtomicBool* flag
+    cdef dict saved
+
 cdef class AtomSpace(Value):
     cdef cValuePtr asp
     cdef cAtomSpace *atomspace
     cdef object parent_atomspace
 
+# Builder; fast creation of Atoms in a given AtomSpace.
+cdef class DeferredBatch:
+    cdef HandleArray atoms
+
+cdef class DeferredAtom:
+    cdef DeferredBatch batch
+    cdef size_t index
+
+cdef class Builder:
+    cdef AtomSpace space
+    cdef dict methods
+    cdef bint deferring
+    cdef DeferredBatch batch
+    # The queue of deferred Atoms, one entry per Atom.
+    cdef vector[Type] kinds
+    cdef vector[bint] is_node
+    cdef vector[string] names
+    cdef vector[vector[cHandle]] outsets
+    cdef vector[tv_ptr] tvs
+    # Outgoing-set slots that refer to Atoms of the same batch.
+    cdef vector[size_t] fix_entry
+    cdef vector[size_t] fix_pos
+    cdef vector[size_t] fix_src
+    cdef object queued(self, Type t, bint is_node, TruthValue tv)
+    cdef object node(self, Type t, object name, TruthValue tv)
+    cdef object link(self, Type t, object outgoing, TruthValue tv)
+    cdef object created(self, cHandle& result, TruthValue tv)
+
+# Streaming of query results, for AtomSpace.iter_query().
+cdef extern from "opencog/cython/opencog/QueryStream.h" namespace "opencog":
+    cdef cppclass cQueryStream "opencog::QueryStream":
+        void run(cAtomSpace*, const cHandle&) nogil
+        size_t next_batch(vector[cValuePtr]&, size_t) except + nogil
+        void cancel() nogil
+    shared_ptr[cQueryStream] createQueryStream(size_t)
+
+cdef class QueryStream:
+    cdef shared_ptr[cQueryStream] stream
+    cdef size_t batch_size
+
+# Queries analyzed once, and run with different parameter values.
+cdef extern from "opencog/query/PreparedQuery.h" namespace "opencog":
+    cdef cppclass cPreparedQuery "opencog::PreparedQuery":
+        cValuePtr execute(cAtomSpace*, const vector[cHandle]&) except + nogil
+    shared_ptr[cPreparedQuery] createPreparedQuery(const cHandle&,
+                                                   const vector[cHandle]&) except +
+
+cdef class PreparedQuery:
+    cdef shared_ptr[cPreparedQuery] prepared
+    cdef AtomSpace space
+    cdef readonly Atom query
+    cdef readonly tuple params
+
+# Search plans and profiles of queries.
+cdef extern from "opencog/query/QueryProfile.h" namespace "opencog":
+    cdef cppclass cQueryProfileCounter "opencog::QueryProfile::Counter":
+        size_t calls
+        size_t accepted
+        double seconds
+    cdef cppclass cQueryProfileSearch "opencog::QueryProfile::Search":
+        string strategy
+        cHandle clause
+        cHandle start_term
+        cHandle start
+        size_t candidates
+        size_t explored
+        double seconds
+    cdef cppclass cQueryProfile "opencog::QueryProfile":
+        bint plan_only
+        vector[cQueryProfileSearch] searches
+        cQueryProfileCounter* callbacks
+        cpp_map[cHandle, cQueryProfileCounter] clauses
+        cpp_map[cHandle, cQueryProfileCounter] evaluations
+        double seconds
+    cdef size_t QUERY_PROFILE_NUM_CALLBACKS \
+        "opencog::QueryProfile::NUM_CALLBACKS"
+    const char* query_profile_callback_name \
+        "opencog::QueryProfile::callback_name"(size_t) except +
+    cQueryProfile explain_query(cAtomSpace*, const cHandle&) except + nogil
+    cValuePtr profile_query(cAtomSpace*, const cHandle&,
+                            cQueryProfile&) except + nogil
+
 
 cdef create_python_value_from_c_value(const cValuePtr& value)
 
@@ -242,7 +384,7 @@ cdef extern from "opencog/atoms/value/BoolValue.h" namespace "opencog":
 cdef extern from "opencog/atoms/value/FloatValue.h" namespace "opencog":
     cdef cppclass cFloatValue "opencog::FloatValue":
         cFloatValue(double value)
-        cFloatValue(const vector[double]& values)
+        cFloatValue(const vector[double]& values) nogil
         const vector[double]& value() const
 
 
@@ -262,3 +404,4 @@ cdef extern from "opencog/atoms/value/LinkValue.h" namespace "opencog":
 
 
 include "value_types.pxd"
+
@@ -6,7 +6,10 @@
 # things work or not
 
 include "value.pyx"
+include "atom_cache.pyx"
+include "handle_array.pyx"
 include "atomspace_details.pyx"
+include "atom_iterator.pyx"
 include "truth_value.pyx"
 include "bool_value.pyx"
 include "float_value.pyx"
@@ -14,3 +17,9 @@ include "string_value.pyx"
 include "atom.pyx"
 include "nameserver.pyx"
 include "link_value.pyx"
+include "cancel_token.pyx"
+include "builder.pyx"
+include "parallel_search.pyx"
+include "query_stream.pyx"
+include "prepared_query.pyx"
+include "query_profile.pyx"
@@ -1,7 +1,13 @@
 from libcpp cimport bool
 from libcpp.set cimport set as cpp_set
 from libcpp.vector cimport vector
+from libcpp.utility cimport move
 from cython.operator cimport dereference as deref, preincrement as inc
+from cpython cimport array
+from cpython.buffer cimport PyObject_CheckBuffer
+from libc.string cimport memcpy
+from libcpp.memory cimport shared_ptr
+import array
 
 # from atomspace cimport *
 
@@ -39,8 +45,53 @@ cdef vector[cHandle] atom_list_to_vector(list lst):
     return handle_vector
 
 
+# Return styles for the bulk methods (add_nodes, add_links, ...)
+_BULK_RETURNS = ("atoms", "handles", None)
+
+cdef object wrap_bulk_result(vector[cHandle]& handles, object returns):
+    if returns is None:
+        return None
+    if returns == "handles":
+        return HandleArray.create(handles)
+    return convert_handle_seq_to_python_list(handles)
+
+
+# Arrays of doubles for the bulk methods (get_truthvalues, ...). These
+# are array.array('d') underneath; when NumPy is installed, a NumPy
+# view of the same memory is handed out instead. NumPy is not needed
+# to build or use the bindings.
+cdef array.array _double_template = array.array('d')
+
+cdef array.array new_double_array(size_t n):
+    return array.clone(_double_template, n, False)
+
+cdef object double_array_result(array.array arr, tuple shape=None):
+    try:
+        import numpy
+    except ImportError:
+        if shape is None:
+            return arr
+        return memoryview(arr).cast('B').cast('d', shape)
+    if shape is None:
+        return numpy.frombuffer(arr, dtype=numpy.float64)
+    return numpy.frombuffer(arr, dtype=numpy.float64).reshape(shape)
+
+cdef object as_double_buffer(object obj):
+    """Return obj if it supports the buffer protocol, else copy it
+    into an array of doubles."""
+    if PyObject_CheckBuffer(obj):
+        return obj
+    return array.array('d', obj)
+
+
 cdef extern from "opencog/cython/opencog/ExecuteStub.h" namespace "opencog":
-    cdef cValuePtr c_do_execute_atom "do_execute"(cAtomSpace*, cHandle) except +
+    cdef cValuePtr c_do_execute_atom "do_execute"(cAtomSpace*, cHandle) except + nogil
+
+cdef extern from "opencog/cython/opencog/BinaryCodec.h" namespace "opencog":
+    cdef string c_encode_values "opencog::encode_values"(const vector[cValuePtr]&, bint) except + nogil
+    cdef string c_encode_atoms "opencog::encode_atoms"(const vector[cHandle]&, bint) except + nogil
+    cdef string c_encode_atomspace "opencog::encode_atomspace"(const cAtomSpace*, bint) except + nogil
+    cdef vector[cValuePtr] c_decode_values "opencog::decode_values"(const string&, cAtomSpace*) except + nogil
 
 
 cdef AtomSpace_factoid(cValuePtr to_wrap):
@@ -140,6 +191,100 @@ cdef class AtomSpace(Value):
             atom.tv = tv
         return atom
 
+    def add_nodes(self, Type t, names, returns="atoms"):
+        """ Add many Nodes, all of the same type, to the AtomSpace.
+
+        names -- an iterable of node names; either str or bytes. Bytes
+            are used as-is, and must already be UTF-8 encoded.
+        returns -- "atoms" to get a list of Atoms, "handles" to get a
+            compact HandleArray, or None to get nothing back at all.
+
+        The names are converted first; all of the atoms are then
+        created in one pass, with the GIL released.
+        """
+        if self.atomspace == NULL:
+            raise RuntimeError("Null AtomSpace!")
+        if returns not in _BULK_RETURNS:
+            raise ValueError("returns must be one of {0}".format(_BULK_RETURNS))
+
+        cdef vector[string] cnames
+        for name in names:
+            if isinstance(name, bytes):
+                cnames.push_back(name)
+            else:
+                # See comments on encoding in utilities.pyx
+                cnames.push_back(name.encode('UTF-8', 'surrogateescape'))
+
+        cdef cAtomSpace* asp = self.atomspace
+        cdef vector[cHandle] results
+        cdef bint keep = returns is not None
+        cdef size_t i
+        cdef size_t n = cnames.size()
+        with nogil:
+            if keep:
+                results.reserve(n)
+            for i in range(n):
+                if keep:
+                    results.push_back(asp.xadd_node(t, move(cnames[i])))
+                else:
+                    asp.xadd_node(t, move(cnames[i]))
+        return wrap_bulk_result(results, returns)
+
+    def add_links(self, Type t, outgoing_seqs, returns="atoms",
+                  columnar=False):
+        """ Add many Links, all of the same type, to the AtomSpace.
+
+        outgoing_seqs -- an iterable of outgoing sets, one per link.
+            Each outgoing set is a list, tuple or HandleArray of Atoms.
+        returns -- "atoms" to get a list of Atoms, "handles" to get a
+            compact HandleArray, or None to get nothing back at all.
+        columnar -- if set, then outgoing_seqs is instead a sequence
+            of columns, all of the same length. The i'th link has the
+            i'th element of each column as its outgoing set. Thus,
+            passing two HandleArrays creates a batch of binary links.
+
+        The outgoing sets are converted first; all of the links are
+        then created in one pass, with the GIL released.
+        """
+        if self.atomspace == NULL:
+            raise RuntimeError("Null AtomSpace!")
+        if returns not in _BULK_RETURNS:
+            raise ValueError("returns must be one of {0}".format(_BULK_RETURNS))
+
+        cdef vector[vector[cHandle]] outsets
+        cdef vector[vector[cHandle]] columns
+        cdef size_t i, j, n
+
+        if columnar:
+            for col in outgoing_seqs:
+                columns.push_back(atom_seq_to_vector(col))
+            n = columns[0].size() if columns.size() > 0 else 0
+            for j in range(columns.size()):
+                if columns[j].size() != n:
+                    raise ValueError("all columns must have the same length")
+            outsets.resize(n)
+            for i in range(n):
+                outsets[i].reserve(columns.size())
+                for j in range(columns.size()):
+                    outsets[i].push_back(columns[j][i])
+        else:
+            for out in outgoing_seqs:
+                outsets.push_back(atom_seq_to_vector(out))
+
+        cdef cAtomSpace* asp = self.atomspace
+        cdef vector[cHandle] results
+        cdef bint keep = returns is not None
+        n = outsets.size()
+        with nogil:
+            if keep:
+                results.reserve(n)
+            for i in range(n):
+                if keep:
+                    results.push_back(asp.xadd_link(t, move(outsets[i])))
+                else:
+                    asp.xadd_link(t, move(outsets[i]))
+        return wrap_bulk_result(results, returns)
+
     def is_valid(self, atom):
         """ Check whether the passed handle refers to an actual atom
         """
@@ -190,6 +335,169 @@ cdef class AtomSpace(Value):
             raise RuntimeError("Null AtomSpace!")
         self.atomspace.set_truthvalue(deref(atom.handle), deref(tv._tvptr()))
 
+    def get_truthvalues(self, atoms):
+        """ Return the TruthValues of many atoms, as two arrays.
+
+        atoms -- a list, HandleArray or other iterable of Atoms.
+
+        Returns (means, confidences), two float64 arrays holding one
+        entry per atom. These are NumPy arrays if NumPy is installed,
+        and array.array('d') otherwise. No TruthValue objects are
+        created; the GIL is released while the values are read.
+        """
+        if self.atomspace == NULL:
+            raise RuntimeError("Null AtomSpace!")
+        cdef vector[cHandle] handles = atom_seq_to_vector(atoms)
+        cdef size_t n = handles.size()
+        cdef array.array means = new_double_array(n)
+        cdef array.array confs = new_double_array(n)
+        cdef double* mp = means.data.as_doubles
+        cdef double* cp = confs.data.as_doubles
+        cdef size_t i
+        cdef cAtom* atom_ptr
+        cdef tv_ptr tvp
+        cdef bint null_atom = False
+        with nogil:
+            for i in range(n):
+                atom_ptr = handles[i].atom_ptr()
+                if atom_ptr == NULL:
+                    null_atom = True
+                    break
+                tvp = atom_ptr.getTruthValue()
+                mp[i] = tvp.get().get_mean()
+                cp[i] = tvp.get().get_confidence()
+        if null_atom:
+            raise RuntimeError("Null Atom!")
+        return double_array_result(means), double_array_result(confs)
+
+    def set_truthvalues(self, atoms, means, confidences):
+        """ Set the TruthValues of many atoms at once.
+
+        atoms -- a list, HandleArray or other iterable of Atoms.
+        means, confidences -- one float64 entry per atom. Anything
+            supporting the buffer protocol (NumPy arrays, array.array,
+            memoryviews) is read in place; other sequences are copied.
+
+        The SimpleTruthValues are built and set in C++, with the GIL
+        released.
+        """
+        if self.atomspace == NULL:
+            raise RuntimeError("Null AtomSpace!")
+        cdef vector[cHandle] handles = atom_seq_to_vector(atoms)
+        cdef const double[:] mv = as_double_buffer(means)
+        cdef const double[:] cv = as_double_buffer(confidences)
+        cdef size_t n = handles.size()
+        if <size_t>mv.shape[0] != n or <size_t>cv.shape[0] != n:
+            raise ValueError("need exactly one mean and one confidence per atom")
+
+        cdef cAtomSpace* asp = self.atomspace
+        cdef size_t i
+        cdef tv_ptr tvp
+        with nogil:
+            for i in range(n):
+                tvp.reset(new cSimpleTruthValue(mv[i], cv[i]))
+                asp.set_truthvalue(handles[i], tvp)
+
+    def get_values(self, atoms, Atom key):
+        """ Return the Values stored at key on many atoms.
+
+        atoms -- a list, HandleArray or other iterable of Atoms.
+
+        If every atom holds a FloatValue (or a TruthValue, or any other
+        kind of FloatValue) of the same length, then a dense float64
+        matrix is returned, with one row per atom. It is a NumPy array
+        if NumPy is installed, and a 2-D memoryview otherwise; either
+        way, no python Values are created. Otherwise, a list of Values
+        is returned, with None for atoms that have no Value at key.
+        """
+        if self.atomspace == NULL:
+            raise RuntimeError("Null AtomSpace!")
+        cdef vector[cHandle] handles = atom_seq_to_vector(atoms)
+        cdef cHandle key_h = deref(key.handle)
+        cdef size_t n = handles.size()
+        cdef vector[cValuePtr] values
+        cdef size_t i
+        cdef cAtom* atom_ptr
+        values.reserve(n)
+        for i in range(n):
+            atom_ptr = handles[i].atom_ptr()
+            if atom_ptr == NULL:
+                raise RuntimeError("Null Atom!")
+            values.push_back(atom_ptr.getValue(key_h))
+
+        # Try for a dense matrix first; the row length is set by the
+        # first row. Give up at the first Value that does not fit.
+        cdef size_t ncols = 0
+        cdef array.array mat = None
+        cdef double* mp = NULL
+        cdef const vector[double]* row
+        cdef bint dense = True
+        for i in range(n):
+            if values[i].get() == NULL or \
+               not nameserver().isA(values[i].get().get_type(), FLOAT_VALUE):
+                dense = False
+                break
+            row = &((<cFloatValue*>values[i].get()).value())
+            if 0 == i:
+                ncols = row.size()
+                mat = new_double_array(n * ncols)
+                mp = mat.data.as_doubles
+            if row.size() != ncols:
+                dense = False
+                break
+            if 0 < ncols:
+                memcpy(mp + i * ncols, row.data(), ncols * sizeof(double))
+
+        if dense:
+            if 0 == n:
+                mat = new_double_array(0)
+            return double_array_result(mat, (n, ncols))
+        return [None if values[i].get() == NULL
+                else create_python_value_from_c_value(values[i])
+                for i in range(n)]
+
+    def set_values(self, atoms, Atom key, matrix):
+        """ Store one FloatValue at key on each of many atoms.
+
+        atoms -- a list, HandleArray or other iterable of Atoms.
+        matrix -- one row of doubles per atom. A 2-D float64 buffer
+            (such as a NumPy array) is read in place, and all of the
+            FloatValues are built in C++ with the GIL released. Any
+            other sequence of rows is also accepted; the rows then
+            need not all have the same length.
+        """
+        if self.atomspace == NULL:
+            raise RuntimeError("Null AtomSpace!")
+        cdef vector[cHandle] handles = atom_seq_to_vector(atoms)
+        cdef cHandle key_h = deref(key.handle)
+        cdef size_t n = handles.size()
+        if len(matrix) != n:
+            raise ValueError("need exactly one row per atom")
+
+        cdef cAtomSpace* asp = self.atomspace
+        cdef shared_ptr[cFloatValue] fvp
+        cdef vector[double] cpp_vector
+        cdef const double[:, :] mv
+        cdef size_t i, j, ncols
+        if PyObject_CheckBuffer(matrix) and 2 == memoryview(matrix).ndim:
+            mv = matrix
+            ncols = mv.shape[1]
+            with nogil:
+                for i in range(n):
+                    cpp_vector.resize(ncols)
+                    for j in range(ncols):
+                        cpp_vector[j] = mv[i, j]
+                    fvp.reset(new cFloatValue(move(cpp_vector)))
+                    asp.set_value(handles[i], key_h, <cValuePtr&>fvp)
+            return
+
+        i = 0
+        for row in matrix:
+            cpp_vector = buffer_of_doubles_to_vector(as_double_buffer(row))
+            fvp.reset(new cFloatValue(move(cpp_vector)))
+            asp.set_value(handles[i], key_h, <cValuePtr&>fvp)
+            i += 1
+
     # Methods to make the atomspace act more like a standard Python container
     def __contains__(self, atom):
         """ Custom checker to see if object is in AtomSpace """
@@ -211,9 +519,7 @@ cdef class AtomSpace(Value):
 
     def __iter__(self):
         """ Support iterating across all atoms in the atomspace """
-        if self.atomspace == NULL:
-            raise RuntimeError("Null AtomSpace!")
-        return iter(self.get_atoms_by_type(0))
+        return self.iter_atoms_by_type(0)
 
     def size(self):
         """ Return the number of atoms in the AtomSpace """
@@ -222,14 +528,42 @@ cdef class AtomSpace(Value):
         return self.atomspace.get_size()
 
     # query methods
-    def get_atoms_by_type(self, Type t, subtype = True):
+    def get_atoms_by_type(self, Type t, subtype = True, count_only = False,
+                          limit = None):
+        """ Return a list of all Atoms of type t.
+
+        subtype -- include Atoms of all subtypes of t, as well.
+        count_only -- return just the number of such Atoms, instead of
+            the Atoms themselves. Nothing is copied or wrapped.
+        limit -- return at most this many Atoms. The scan stops as
+            soon as the limit is reached. None means no limit.
+        """
         if self.atomspace == NULL:
             raise RuntimeError("Null AtomSpace!")
+        if limit is not None and limit < 0:
+            raise ValueError("limit must not be negative")
         cdef vector[cHandle] handle_vector
         cdef bint subt = subtype
+        cdef size_t count
+        if count_only:
+            count = self.atomspace.get_num_atoms_of_type(t, subt)
+            if limit is not None and limit < count:
+                return limit
+            return count
+        if limit is not None:
+            return list(AtomIterator(self, t, subt, limit))
         self.atomspace.get_handles_by_type(handle_vector,t,subt)
         return convert_handle_seq_to_python_list(handle_vector)
 
+    def iter_atoms_by_type(self, Type t, subtype = True, limit = None):
+        """ Return an iterator over all Atoms of type t.
+
+        Unlike get_atoms_by_type(), this does not build a list up
+        front; Atoms are wrapped only as they are consumed. See
+        AtomIterator for the behavior under concurrent updates.
+        """
+        return AtomIterator(self, t, subtype, limit)
+
     def is_node_in_atomspace(self, Type t, s):
         cdef string name = s.encode('UTF-8', 'surrogateescape')
         result = self.atomspace.xget_handle(t, name)
@@ -240,13 +574,217 @@ cdef class AtomSpace(Value):
         result = self.atomspace.xget_handle(t, handle_vector)
         return result != result.UNDEFINED
 
-    def execute(self, Atom atom):
+    def execute(self, Atom atom, parallel=None):
+        """ Execute the Atom in this AtomSpace, returning the result.
+
+        The GIL is released while the C++ code runs; it is taken again
+        only if a python GroundedSchemaNode or GroundedPredicateNode
+        is called. Other python threads keep running meanwhile.
+
+        parallel -- if given, the number of threads used by the pattern
+            searches of this query (True for one per core, 0 or False
+            for a sequential search), as with parallel_search().
+        """
         if atom is None:
             raise ValueError("No atom provided!")
-        cdef cValuePtr c_value_ptr = c_do_execute_atom(
-            self.atomspace, deref(atom.handle))
+        cdef cAtomSpace* asp = self.atomspace
+        cdef cHandle h = deref(atom.handle)
+        cdef cValuePtr c_value_ptr
+        cdef size_t prev = 0
+        cdef bint scoped = parallel is not None
+        if scoped:
+            prev = set_search_parallel(_search_threads(parallel))
+        try:
+            with nogil:
+                c_value_ptr = c_do_execute_atom(asp, h)
+        finally:
+            if scoped:
+                set_search_parallel(prev)
         return create_python_value_from_c_value(c_value_ptr)
 
+    def iter_query(self, Atom query, batch_size=100, parallel=None):
+        """ Execute the query (a QueryLink or BindLink, MeetLink or
+        GetLink), yielding its results as they are found.
+
+        The search runs on a background thread. It hands its results
+        over in batches of up to batch_size, and waits while the
+        previous batch has not been taken, so that results do not pile
+        up. Each result is yielded once, as execute() returns it once;
+        only references to the results already yielded are kept, to
+        drop duplicates. If the caller stops early
+        (breaks out of the loop, or closes the generator), the search
+        is cancelled. Errors raised by the search are raised by the
+        generator, after the results found before them.
+
+        parallel -- as for execute(); by default, the setting of the
+            calling thread, see parallel_search().
+        """
+        if query is None:
+            raise ValueError("No atom provided!")
+        if not (query.is_a(types.QueryLink) or query.is_a(types.MeetLink)):
+            raise TypeError("Expecting a QueryLink or a MeetLink, got "
+                            + query.type_name)
+        if parallel is None:
+            nthreads = get_search_parallel()
+        else:
+            nthreads = _search_threads(parallel)
+        stream = QueryStream(batch_size)
+        return _stream_results(stream, self, query, nthreads)
+
+    def prepare(self, Atom query, *params):
+        """ Prepare the query (a QueryLink or BindLink, MeetLink or
+        GetLink) for running many times in this AtomSpace, with the
+        variables params grounded by different values each time.
+        Returns a PreparedQuery; call it with the values.
+        """
+        if query is None:
+            raise ValueError("No atom provided!")
+        return PreparedQuery(self, query, *params)
+
+    def set_query_cache(self, capacity):
+        """ Cache the results of up to capacity queries (QueryLink,
+        BindLink, MeetLink and GetLink) executed in this AtomSpace.
+        A cached result is used until an Atom of one of the types in
+        the query is added or removed. Queries with grounded or
+        defined predicates and schemas, or that look at Values, are
+        never cached. Zero or None turns the cache off, the default.
+        """
+        if capacity is None:
+            capacity = 0
+        if capacity < 0:
+            raise ValueError("capacity must not be negative")
+        self.atomspace.set_query_cache(capacity)
+
+    def query_cache_stats(self):
+        """ Return a dict with the hits, misses (stale: the misses due
+        to a stale entry), evictions, size, capacity and hit_rate of
+        the query cache, or None if it is off.
+        """
+        cdef shared_ptr[cQueryCache] qc = self.atomspace.get_query_cache()
+        if qc.get() == NULL:
+            return None
+        cdef cQueryCacheStats st = qc.get().get_stats()
+        lookups = st.hits + st.misses
+        return {"hits": st.hits, "misses": st.misses, "stale": st.stale,
+                "evictions": st.evictions, "size": st.size,
+                "capacity": st.capacity,
+                "hit_rate": st.hits / lookups if lookups else 0.0}
+
+    def clear_query_cache(self):
+        """ Drop all of the results in the query cache. """
+        cdef shared_ptr[cQueryCache] qc = self.atomspace.get_query_cache()
+        if qc.get() != NULL:
+            qc.get().clear()
+
+    def explain(self, Atom query):
+        """ Return the search plan of the query (a QueryLink, BindLink,
+        MeetLink, GetLink or other pattern), without running it. This
+        is a list with a dict for each search; a query with several
+        disconnected components has one search per component. Each
+        dict holds:
+
+            strategy -- how the starting points were found: "neighbor"
+                (the incoming set of the thinnest constant),
+                "deep-type", "link-type" or "variable" (the Atoms of
+                the rarest type), or "no-search" (nothing to ground).
+            clause -- the clause the search starts in.
+            start_term -- the term in it that is grounded first.
+            start -- the constant a "neighbor" search starts at, else
+                None.
+            candidates -- the number of starting points.
+        """
+        if query is None:
+            raise ValueError("No atom provided!")
+        cdef cAtomSpace* asp = self.atomspace
+        cdef cHandle h = deref(query.handle)
+        cdef cQueryProfile prof
+        with nogil:
+            prof = explain_query(asp, h)
+        return _profile_searches(prof)
+
+    def profile(self, Atom query, parallel=None):
+        """ Execute the query, as execute() does, and return a dict
+        with the result and what the searches did:
+
+            result -- the result of execute().
+            seconds -- the time taken by the query.
+            searches -- as for explain(), with, for each search, the
+                number of starting points explored and the seconds
+                it took.
+            callbacks -- for each pattern matcher callback (node_match,
+                link_match, clause_match, evaluate_sentence and so on),
+                a dict with the number of calls, the number accepted
+                (that returned true) and the seconds spent in them.
+            clauses -- the same, for the clause_match callbacks of
+                each clause (Atom).
+            evaluations -- the same, for each evaluatable term (Atom);
+                the accepted calls are the ones that evaluated to true.
+
+        The query result cache is bypassed.
+        """
+        if query is None:
+            raise ValueError("No atom provided!")
+        cdef cAtomSpace* asp = self.atomspace
+        cdef cHandle h = deref(query.handle)
+        cdef cQueryProfile prof
+        cdef cValuePtr c_value_ptr
+        cdef size_t prev = 0
+        cdef bint scoped = parallel is not None
+        if scoped:
+            prev = set_search_parallel(_search_threads(parallel))
+        try:
+            with nogil:
+                c_value_ptr = profile_query(asp, h, prof)
+        finally:
+            if scoped:
+                set_search_parallel(prev)
+        result = _profile_dict(prof)
+        result["result"] = create_python_value_from_c_value(c_value_ptr)
+        return result
+
+    def to_bytes(self, atoms=None, values=True):
+        """ Return a compact binary encoding of the Atoms in this
+        AtomSpace. Use AtomSpace.from_bytes() or load_bytes() to read
+        it back, in this or in another process.
+
+        atoms -- if given, encode just these Atoms (a list, HandleArray
+            or other iterable), together with their outgoing sets,
+            instead of the whole AtomSpace.
+        values -- if set, also encode the Values (including the
+            TruthValues) attached to the Atoms. Streams and other
+            dynamic Values are skipped.
+        """
+        if self.atomspace == NULL:
+            raise RuntimeError("Null AtomSpace!")
+        cdef cAtomSpace* asp = self.atomspace
+        cdef bint with_values = values
+        cdef vector[cHandle] handles
+        cdef string buf
+        if atoms is None:
+            with nogil:
+                buf = c_encode_atomspace(asp, with_values)
+        else:
+            handles = atom_seq_to_vector(atoms)
+            with nogil:
+                buf = c_encode_atoms(handles, with_values)
+        return buf
+
+    def load_bytes(self, data):
+        """ Add the Atoms and Values encoded by to_bytes() to this
+        AtomSpace. """
+        if self.atomspace == NULL:
+            raise RuntimeError("Null AtomSpace!")
+        values_from_bytes(data, self)
+
+    @staticmethod
+    def from_bytes(data):
+        """ Return a new AtomSpace holding the Atoms and Values encoded
+        by to_bytes(). """
+        return _atomspace_from_bytes(data)
+
+    def __reduce__(self):
+        return (_atomspace_from_bytes, (self.to_bytes(),))
+
 cdef api object py_atomspace(cValuePtr c_atomspace) with gil:
     cdef AtomSpace atomspace = AtomSpace_factoid(c_atomspace)
     return atomspace
@@ -261,4 +799,48 @@ def create_child_atomspace(object atomspace):
     result.parent_atomspace = atomspace
     return result
 
+# Binary encoding, used for pickling. The encoding does not depend on
+# the type numbers, so it can be read by a process that loaded the
+# atom types in another order.
+
+def values_to_bytes(values, with_values=False):
+    """ Return a compact binary encoding of a sequence of Values and
+    Atoms. If with_values is set, the Values (including the TruthValue)
+    attached to the Atoms in the sequence are encoded too; otherwise,
+    Atoms are encoded without them. """
+    cdef vector[cValuePtr] vals
+    cdef bint atom_values = with_values
+    for v in values:
+        if not isinstance(v, Value):
+            raise TypeError("expecting a sequence of Values, got {0} instead".format(type(v)))
+        vals.push_back((<Value>v).get_c_value_ptr())
+    cdef string buf
+    with nogil:
+        buf = c_encode_values(vals, atom_values)
+    return buf
+
+def values_from_bytes(data, AtomSpace atomspace=None):
+    """ Decode the output of values_to_bytes() or AtomSpace.to_bytes(),
+    returning the list of Values encoded by the former. Atoms are added
+    to the given AtomSpace; if it is None, they are created outside of
+    any AtomSpace. """
+    cdef string buf = bytes(data)
+    cdef cAtomSpace* asp = NULL
+    if atomspace is not None:
+        asp = atomspace.atomspace
+    cdef vector[cValuePtr] vals
+    with nogil:
+        vals = c_decode_values(buf, asp)
+    return [create_python_value_from_c_value(v) for v in vals]
+
+def _value_from_bytes(data):
+    # Unpickled Atoms go into the default AtomSpace, if there is one.
+    from opencog.utilities import get_default_atomspace
+    return values_from_bytes(data, get_default_atomspace())[0]
+
+def _atomspace_from_bytes(data):
+    cdef AtomSpace atomspace = AtomSpace()
+    values_from_bytes(data, atomspace)
+    return atomspace
+
 # ====================== end of file ============================
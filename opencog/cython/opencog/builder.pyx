@@ -0,0 +1,237 @@
+from contextlib import contextmanager
+from libcpp.utility cimport move
+
+# A Builder creates Atoms in one given AtomSpace. It is a faster
+# alternative to the type constructors, for code that generates many
+# Atoms: there is no lookup of the context atomspace, no sniffing of
+# argument types, and no unwrapping of nested lists. Usage:
+#
+#    b = Builder(atomspace)
+#    b.Inheritance(b.Concept("cat"), b.Concept("animal"))
+#
+# In deferred mode, the Atoms are queued, and then all inserted in one
+# pass, with the GIL released:
+#
+#    with b.defer():
+#        for i in range(1000000):
+#            b.Member(b.Concept(str(i)), b.Concept("numbers"))
+#
+# A Builder is not thread-safe; use one per thread.
+
+cdef class DeferredBatch:
+    """The Atoms queued by one Builder between two flushes."""
+    def __cinit__(self):
+        self.atoms = None
+
+
+cdef class DeferredAtom:
+    """Placeholder for an Atom queued in a deferred Builder. It can be
+    used in the outgoing set of other Atoms of the same batch. The
+    Atom itself is available once the batch has been flushed."""
+
+    @property
+    def atom(self):
+        if self.batch.atoms is None:
+            raise RuntimeError("Atom not yet inserted; flush the Builder first")
+        return self.batch.atoms[self.index]
+
+    def __repr__(self):
+        if self.batch.atoms is None:
+            return "<DeferredAtom {0}, not yet inserted>".format(self.index)
+        return "<DeferredAtom {0}: {1}>".format(self.index, self.atom)
+
+
+def _builder_method(Builder builder, Type t, bint is_node, str name):
+    # Closures compiled by Cython are called through vectorcall, and
+    # go straight to the C methods of the Builder.
+    if is_node:
+        def make(node_name, TruthValue tv=None):
+            return builder.node(t, node_name, tv)
+    else:
+        def make(*args, TruthValue tv=None):
+            return builder.link(t, args, tv)
+    make.__name__ = make.__qualname__ = name
+    return make
+
+
+cdef string builder_node_name(object name) except *:
+    if type(name) is str:
+        return (<str>name).encode('UTF-8', 'surrogateescape')
+    if type(name) is bytes:
+        return name
+    # NumberNodes; same conversions as utilities.add_node()
+    if type(name) is list:
+        name = ' '.join(map(str, name))
+    return str(name).encode('UTF-8', 'surrogateescape')
+
+
+cdef class Builder:
+    """Create Atoms in the given AtomSpace, with one method per Atom
+    type: b.ConceptNode("x"), or b.Concept("x"), and so on."""
+
+    def __init__(self, AtomSpace atomspace not None):
+        if atomspace.atomspace == NULL:
+            raise RuntimeError("Null AtomSpace!")
+        self.space = atomspace
+        self.methods = {}
+        self.deferring = False
+        self.batch = DeferredBatch()
+
+    def __getattr__(self, name):
+        method = self.methods.get(name)
+        if method is not None:
+            return method
+        cdef Type t = NOTYPE
+        if not name.startswith("_"):
+            t = nameserver().getType(name.encode('UTF-8'))
+        if t == NOTYPE or not (nameserver().isNode(t) or nameserver().isLink(t)):
+            raise AttributeError("Builder has no attribute or atom type " + name)
+        method = _builder_method(self, t, nameserver().isNode(t), name)
+        self.methods[name] = method
+        return method
+
+    @property
+    def atomspace(self):
+        return self.space
+
+    @property
+    def pending(self):
+        """The number of Atoms queued, and not yet inserted."""
+        return self.kinds.size()
+
+    def add_node(self, Type t, name, TruthValue tv=None):
+        """Create a Node of type t."""
+        if not nameserver().isNode(t):
+            raise TypeError("not a Node type: " + get_type_name(t))
+        return self.node(t, name, tv)
+
+    def add_link(self, Type t, outgoing, TruthValue tv=None):
+        """Create a Link of type t, with the given sequence of Atoms
+        as its outgoing set."""
+        if not nameserver().isLink(t):
+            raise TypeError("not a Link type: " + get_type_name(t))
+        return self.link(t, outgoing, tv)
+
+    @contextmanager
+    def defer(self):
+        """Queue all Atoms created in the with-block, and insert them
+        in one batch at the end of the block. If the block raises an
+        exception, the queued Atoms are discarded."""
+        if self.deferring:
+            raise RuntimeError("Builder is already deferring")
+        self.deferring = True
+        try:
+            yield self
+        except BaseException:
+            self.discard()
+            raise
+        else:
+            self.flush()
+        finally:
+            self.deferring = False
+
+    def flush(self):
+        """Insert all queued Atoms, and return them as a HandleArray,
+        in the order in which they were queued."""
+        cdef cAtomSpace* asp = self.space.atomspace
+        cdef vector[cHandle] results
+        cdef size_t n = self.kinds.size()
+        cdef size_t i
+        cdef size_t k = 0
+        cdef size_t nfix = self.fix_entry.size()
+        cdef DeferredBatch batch = self.batch
+        try:
+            with nogil:
+                results.reserve(n)
+                for i in range(n):
+                    # Fill in the Atoms of this batch that were used in
+                    # the outgoing set; they have all been created.
+                    while k < nfix and self.fix_entry[k] == i:
+                        self.outsets[i][self.fix_pos[k]] = results[self.fix_src[k]]
+                        k += 1
+                    if self.is_node[i]:
+                        results.push_back(asp.xadd_node(self.kinds[i],
+                                                        move(self.names[i])))
+                    else:
+                        results.push_back(asp.xadd_link(self.kinds[i],
+                                                        move(self.outsets[i])))
+                    if self.tvs[i].get() != NULL:
+                        results[i] = asp.set_truthvalue(results[i], self.tvs[i])
+        finally:
+            self.discard()
+        batch.atoms = HandleArray.create(results)
+        return batch.atoms
+
+    def discard(self):
+        """Drop all queued Atoms, without inserting them."""
+        self.kinds.clear()
+        self.is_node.clear()
+        self.names.clear()
+        self.outsets.clear()
+        self.tvs.clear()
+        self.fix_entry.clear()
+        self.fix_pos.clear()
+        self.fix_src.clear()
+        self.batch = DeferredBatch()
+
+    cdef object queued(self, Type t, bint is_node, TruthValue tv):
+        cdef DeferredAtom pending = DeferredAtom.__new__(DeferredAtom)
+        cdef tv_ptr tvp
+        if tv is not None:
+            tvp = deref(tv._tvptr())
+        pending.batch = self.batch
+        pending.index = self.kinds.size()
+        self.kinds.push_back(t)
+        self.is_node.push_back(is_node)
+        self.tvs.push_back(tvp)
+        return pending
+
+    cdef object node(self, Type t, object name, TruthValue tv):
+        cdef string cname = builder_node_name(name)
+        if self.deferring:
+            self.names.push_back(move(cname))
+            self.outsets.push_back(vector[cHandle]())
+            return self.queued(t, True, tv)
+
+        cdef cHandle result = self.space.atomspace.xadd_node(t, move(cname))
+        return self.created(result, tv)
+
+    cdef object link(self, Type t, object outgoing, TruthValue tv):
+        cdef vector[cHandle] out
+        cdef vector[size_t] fix_pos, fix_src
+        cdef DeferredAtom pending
+        cdef size_t i
+        for atom in outgoing:
+            if isinstance(atom, Atom):
+                out.push_back(deref((<Atom>atom).handle))
+                continue
+            if not isinstance(atom, DeferredAtom):
+                raise TypeError("outgoing set should contain atoms, got {0} instead".format(type(atom)))
+            pending = <DeferredAtom>atom
+            if pending.batch.atoms is not None:
+                out.push_back(pending.batch.atoms.handles[pending.index])
+            elif self.deferring and pending.batch is self.batch:
+                fix_pos.push_back(out.size())
+                fix_src.push_back(pending.index)
+                out.push_back(cHandle())
+            else:
+                raise ValueError("{0} is not part of this batch".format(pending))
+
+        if self.deferring:
+            for i in range(fix_pos.size()):
+                self.fix_entry.push_back(self.kinds.size())
+                self.fix_pos.push_back(fix_pos[i])
+                self.fix_src.push_back(fix_src[i])
+            self.names.push_back(string())
+            self.outsets.push_back(move(out))
+            return self.queued(t, False, tv)
+
+        cdef cHandle result = self.space.atomspace.xadd_link(t, move(out))
+        return self.created(result, tv)
+
+    cdef object created(self, cHandle& result, TruthValue tv):
+        if result == result.UNDEFINED: return None
+        if tv is not None:
+            result = self.space.atomspace.set_truthvalue(result,
+                deref(tv._tvptr()))
+        return create_python_value_from_c_value(<cValuePtr&>result)
@@ -0,0 +1,42 @@
+import threading
+
+cdef class CancelToken:
+    """Cancel the queries run inside a ``with token:`` block.
+
+    While the block is active, every pattern search started on that
+    thread checks the token before exploring each candidate start
+    point. Calling cancel(), from any thread, makes the search throw;
+    the blocking call then raises RuntimeError. Queries started from
+    Scheme, or from python callbacks, on the same thread are covered
+    too. Blocks may nest; the innermost token wins.
+    """
+
+    def __cinit__(self):
+        self.flag = new cAtomicBool(False)
+        self.saved = {}
+
+    def __dealloc__(self):
+        del self.flag
+
+    def cancel(self):
+        """Request cancellation. Safe to call from any thread."""
+        self.flag.store(True)
+
+    @property
+    def cancelled(self):
+        return self.flag.load()
+
+    def __enter__(self):
+        cdef const cAtomicBool* prev = set_search_cancel_flag(self.flag)
+        self.saved.setdefault(threading.get_ident(), []).append(
+            PyLong_FromVoidPtr(<void*>prev))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        tid = threading.get_ident()
+        stack = self.saved[tid]
+        prev = stack.pop()
+        if not stack:
+            del self.saved[tid]
+        set_search_cancel_flag(<const cAtomicBool*>PyLong_AsVoidPtr(prev))
+        return False
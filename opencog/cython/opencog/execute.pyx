@@ -1,5 +1,5 @@
 from opencog.atomspace cimport Atom, AtomSpace
-from opencog.atomspace cimport cAtomSpace, cTruthValue
+from opencog.atomspace cimport cAtomSpace, cTruthValue, cHandle
 from opencog.atomspace cimport tv_ptr, strength_t, confidence_t, count_t
 from opencog.atomspace cimport create_python_value_from_c_value
 
@@ -13,9 +13,13 @@ def execute_atom(AtomSpace atomspace, Atom atom):
 def evaluate_atom(AtomSpace atomspace, Atom atom):
     if atom is None:
         raise ValueError("evaluate_atom atom is: None")
-    cdef tv_ptr result_tv_ptr = c_evaluate_atom(
-        atomspace.atomspace, deref(atom.handle)
-    )
+    cdef cAtomSpace* asp = atomspace.atomspace
+    cdef cHandle h = deref(atom.handle)
+    cdef tv_ptr result_tv_ptr
+    # Release the GIL, so that other python threads can run while
+    # this thread is evaluating.
+    with nogil:
+        result_tv_ptr = c_evaluate_atom(asp, h)
     cdef cTruthValue* result_tv = result_tv_ptr.get()
     cdef strength_t strength = deref(result_tv).get_mean()
     cdef confidence_t confidence = deref(result_tv).get_confidence()
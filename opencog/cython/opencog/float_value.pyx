@@ -1,18 +1,84 @@
+from cpython.buffer cimport PyObject_CheckBuffer, PyBUF_WRITABLE, PyBUF_FORMAT
+from libc.stdlib cimport malloc, free
+from libc.string cimport memcpy
+from libcpp.utility cimport move
 
 def createFloatValue(arg):
     cdef shared_ptr[cFloatValue] c_ptr
+    cdef vector[double] cpp_vector
     if (isinstance(arg, list)):
         c_ptr.reset(new cFloatValue(FloatValue.list_of_doubles_to_vector(arg)))
+    elif PyObject_CheckBuffer(arg):
+        # NumPy arrays, array.array('d'), memoryviews, other FloatValues.
+        cpp_vector = buffer_of_doubles_to_vector(arg)
+        c_ptr.reset(new cFloatValue(move(cpp_vector)))
     else:
         c_ptr.reset(new cFloatValue(<double>arg))
     return FloatValue(PtrHolder.create(<shared_ptr[void]&>c_ptr))
 
+cdef vector[double] buffer_of_doubles_to_vector(const double[:] buf):
+    """Copy a 1-D float64 buffer. Contiguous buffers are copied with
+    a single memcpy; strided ones element by element."""
+    cdef vector[double] cpp_vector
+    cdef size_t n = buf.shape[0]
+    cdef size_t i
+    cpp_vector.resize(n)
+    if 0 == n:
+        return cpp_vector
+    if buf.strides[0] == sizeof(double):
+        memcpy(cpp_vector.data(), &buf[0], n * sizeof(double))
+    else:
+        for i in range(n):
+            cpp_vector[i] = buf[i]
+    return cpp_vector
+
 cdef class FloatValue(Value):
+    """A vector of doubles.
+
+    FloatValues support the buffer protocol: memoryview(fv) and
+    numpy.asarray(fv) give a read-only view of the underlying C++
+    storage, without copying. The view keeps the FloatValue alive.
+    """
 
     def to_list(self):
         return FloatValue.vector_of_doubles_to_list(
             &((<cFloatValue*>self.get_c_value_ptr().get()).value()))
 
+    def as_array(self):
+        """Return a read-only NumPy array viewing this FloatValue.
+        No data is copied. Requires NumPy."""
+        import numpy
+        return numpy.asarray(self)
+
+    def __getbuffer__(self, Py_buffer *buffer, int flags):
+        if flags & PyBUF_WRITABLE:
+            raise BufferError("FloatValue is immutable; buffer is read-only")
+
+        cdef const vector[double]* cpp_vector = \
+            &((<cFloatValue*>self.get_c_value_ptr().get()).value())
+
+        # Shape and strides, released in __releasebuffer__
+        cdef Py_ssize_t* dims = <Py_ssize_t*> malloc(2 * sizeof(Py_ssize_t))
+        if dims == NULL:
+            raise MemoryError()
+        dims[0] = cpp_vector.size()
+        dims[1] = sizeof(double)
+
+        buffer.buf = <void*> cpp_vector.data()
+        buffer.obj = self
+        buffer.len = cpp_vector.size() * sizeof(double)
+        buffer.readonly = 1
+        buffer.itemsize = sizeof(double)
+        buffer.format = b'd' if flags & PyBUF_FORMAT else NULL
+        buffer.ndim = 1
+        buffer.shape = dims
+        buffer.strides = dims + 1
+        buffer.suboffsets = NULL
+        buffer.internal = dims
+
+    def __releasebuffer__(self, Py_buffer *buffer):
+        free(buffer.internal)
+
     @staticmethod
     cdef vector[double] list_of_doubles_to_vector(list python_list):
         cdef vector[double] cpp_vector
@@ -29,4 +95,3 @@ cdef class FloatValue(Value):
             list.append(deref(it))
             inc(it)
         return list
-
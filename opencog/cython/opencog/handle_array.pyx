@@ -0,0 +1,69 @@
+from cython.operator cimport dereference as deref
+from libcpp.vector cimport vector
+
+# from atomspace cimport cHandle, HandleArray
+
+cdef class HandleArray:
+    """A compact, read-only sequence of Atoms, held as a C++ HandleSeq.
+
+    Bulk methods return one of these, instead of a list, when asked to.
+    No python Atom wrappers are created until an element is accessed,
+    so a HandleArray of a million Atoms costs about the same memory as
+    a million pointers. It can be passed back to the bulk methods
+    wherever a sequence of Atoms is expected.
+    """
+
+    @staticmethod
+    cdef HandleArray create(vector[cHandle]& handles):
+        """Factory method; takes ownership of the contents of handles."""
+        cdef HandleArray arr = HandleArray.__new__(HandleArray)
+        arr.handles.swap(handles)
+        return arr
+
+    def __len__(self):
+        return self.handles.size()
+
+    def __getitem__(self, idx):
+        cdef vector[cHandle] sub
+        cdef Py_ssize_t i
+        cdef Py_ssize_t n = self.handles.size()
+        if isinstance(idx, slice):
+            for i in range(*idx.indices(n)):
+                sub.push_back(self.handles[i])
+            return HandleArray.create(sub)
+
+        i = idx
+        if i < 0:
+            i += n
+        if i < 0 or i >= n:
+            raise IndexError("HandleArray index out of range")
+        return create_python_value_from_c_value(<cValuePtr&>(self.handles[i]))
+
+    def __iter__(self):
+        cdef size_t i
+        for i in range(self.handles.size()):
+            yield create_python_value_from_c_value(<cValuePtr&>(self.handles[i]))
+
+    def __repr__(self):
+        return "<HandleArray of {0} atoms>".format(self.handles.size())
+
+    def to_list(self):
+        """Return a list of Atoms."""
+        return convert_handle_seq_to_python_list(self.handles)
+
+
+cdef vector[cHandle] atom_seq_to_vector(object seq):
+    """Convert a list, tuple, HandleArray or other iterable of Atoms
+    into a HandleSeq."""
+    if isinstance(seq, HandleArray):
+        return (<HandleArray>seq).handles
+    if isinstance(seq, list):
+        return atom_list_to_vector(seq)
+
+    cdef vector[cHandle] handle_vector
+    for atom in seq:
+        if isinstance(atom, Atom):
+            handle_vector.push_back(deref((<Atom>(atom)).handle))
+        else:
+            raise TypeError("expecting a sequence of atoms, got {0} instead".format(type(atom)))
+    return handle_vector
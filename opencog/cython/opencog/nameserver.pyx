@@ -7,6 +7,7 @@ from libc.string cimport strcmp
 from libcpp cimport string
 import sys
 import warnings
+from collections.abc import Mapping
 from contextlib import contextmanager
 
 # Dynamically construct a "types" module.
@@ -61,38 +62,84 @@ def is_a(Type t1, Type t2):
 #    setattr(mod, name, class_)
 
 # Create a python dictionary holding the string-name -> id number lookup.
-typedict = {}
-cdef generate_typedict():
-    global typedict
-    typedict = {}
+cdef dict build_typedict():
+    cdef dict tdict = {}
     cdef string s
     # print("Class server has num types=", nameserver().getNumberOfClasses())
     for i in range(0, nameserver().getNumberOfClasses()):
         s = nameserver().getTypeName(i)
         assert s.size() > 0, "Got blank type name while generating types module"
-        typedict[string(s.c_str()).decode('UTF-8')] = i
+        tdict[string(s.c_str()).decode('UTF-8')] = i
         # print("type ", i, " has name ", string(s.c_str()).decode('UTF-8'))
-    typedict["NO_TYPE"] = NOTYPE
-    return typedict
+    tdict["NO_TYPE"] = NOTYPE
+    return tdict
+
+# The typedict is a read-only mapping, filled in from the nameserver
+# the first time that it is used, rather than at import time, and
+# again whenever types have been added since.
+class _TypeDict(Mapping):
+    def __init__(self):
+        self._dict = None
+        self._size = 0
+
+    def _current(self):
+        cdef Type size = nameserver().getNumberOfClasses()
+        if self._dict is None or self._size != size:
+            self._dict = build_typedict()
+            self._size = size
+        return self._dict
+
+    def __getitem__(self, name):
+        return self._current()[name]
+
+    def __iter__(self):
+        return iter(self._current())
+
+    def __len__(self):
+        return len(self._current())
 
-# Bulk-define the types class
-types = type('atom_types', (), generate_typedict())
+    def __repr__(self):
+        return repr(self._current())
+
+typedict = _TypeDict()
+
+cdef generate_typedict():
+    typedict._dict = None
+    return typedict._current()
+
+# The types class resolves each type name when it is first used, and
+# then keeps it as an ordinary class attribute. This avoids walking
+# the whole nameserver at import time.
+class _AtomTypes(type):
+    def __getattr__(cls, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        t = NOTYPE
+        if name != "NO_TYPE":
+            t = c_get_named_type(name)
+            if t == NOTYPE and name != get_type_name(NOTYPE):
+                raise AttributeError("No atom type named " + name)
+        type.__setattr__(cls, name, t)
+        return t
+
+    def __dir__(cls):
+        return sorted(set(type.__dir__(cls)) | set(typedict))
+
+types = _AtomTypes('atom_types', (), {})
 
 # Update/refresh list of types. This needs to be called whenever
 # additional atom types were declared in other atomspace modules.
 # i.e. when new types were added to the C++ nameserver.
 def regenerate_types():
-    global typedict
     global types
     # print("Enter regenerate_types")
     # A one-liner solution would have been this:
     # types = type('atom_types', (), generate_typedict())
     # but the above one-liner doesn't work. So just reiterate
     # over the typedict, one line at a time.
-    generate_typedict()
-    for t in typedict:
-        # setattr(types, name, type_id)
-        setattr(types, t, typedict[t])
+    for name, type_id in generate_typedict().items():
+        setattr(types, name, type_id)
+    update_wrapper_classes()
     # print("Exit regenerate_types")
     return types
 
@@ -121,36 +168,64 @@ def type_decl_context(module):
 def decl_type(parent, name):
     type_id = nameserver().declType(parent, name.encode('UTF-8'))
     setattr(types, name, type_id)
+    update_wrapper_classes()
     return type_id
 
-cdef create_python_value_from_c_value(const cValuePtr& value):
-    if value.get() == NULL:
-        return None
-
-    value_type = value.get().get_type()
-    type_name = get_type_name(value_type)
-    ptr_holder = PtrHolder.create(<shared_ptr[void]&>value)
+# Type -> python wrapper class dispatch table, indexed by the numeric
+# type. Every Value and Atom handed to python passes through
+# create_python_value_from_c_value(), so the class is looked up here
+# once per type, instead of once per value. The table is rebuilt when
+# types are declared, and extended lazily if some C++ module added
+# types behind our back.
+cdef list _wrapper_classes = []
 
+cdef object find_wrapper_class(Type t):
     thismodule = sys.modules[__name__]
-    clazz = getattr(thismodule, type_name, None)
+    clazz = getattr(thismodule, get_type_name(t), None)
     if clazz is not None:
-        return clazz(ptr_holder=ptr_holder)
+        return clazz
 
     # For handling the children types of TruthValue.
-    if is_a(value_type, types.TruthValue):
-        return TruthValue(ptr_holder=ptr_holder)
+    if is_a(t, types.TruthValue):
+        return TruthValue
 
     # For handling the children types of LinkValue.
-    if is_a(value_type, types.LinkValue):
-        return LinkValue(ptr_holder=ptr_holder)
+    if is_a(t, types.LinkValue):
+        return LinkValue
+
     # For handling the children types of Atom.
-    if is_a(value_type, types.Atom):
-        return Atom(ptr_holder=ptr_holder)
+    if is_a(t, types.Atom):
+        return Atom
 
     # For handling the children types of Value.
-    if is_a(value_type, types.Value):
-        return Value(ptr_holder=ptr_holder)
+    if is_a(t, types.Value):
+        return Value
+
+    # No wrapper; report the error when a value of this type shows up.
+    return None
+
+cdef update_wrapper_classes():
+    global _wrapper_classes
+    _wrapper_classes = [find_wrapper_class(t)
+        for t in range(0, nameserver().getNumberOfClasses())]
+
+cdef create_python_value_from_c_value(const cValuePtr& value):
+    if value.get() == NULL:
+        return None
+
+    cdef Type value_type = value.get().get_type()
+    if value_type >= len(_wrapper_classes):
+        update_wrapper_classes()
+
+    clazz = None
+    if 0 <= value_type < len(_wrapper_classes):
+        clazz = _wrapper_classes[value_type]
+    if clazz is None:
+        raise TypeError("Python API for " + get_type_name(value_type) +
+                        " is not implemented yet")
 
-    raise TypeError("Python API for " + type_name + " is not implemented yet")
+    if _atom_cache_enabled and value.get().is_atom():
+        return cached_atom_wrapper(value, clazz)
+    return clazz(PtrHolder.create(<shared_ptr[void]&>value))
 
 # ========================== END OF FILE =========================
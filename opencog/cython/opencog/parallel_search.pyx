@@ -0,0 +1,67 @@
+import os
+
+def _search_threads(nthreads):
+    if nthreads is True:
+        return os.cpu_count() or 1
+    if nthreads is False:
+        return 0
+    if nthreads < 0:
+        raise ValueError("number of search threads must not be negative")
+    return nthreads
+
+
+@contextmanager
+def parallel_search(nthreads=True):
+    """Run the queries inside a ``with parallel_search():`` block in
+    parallel: the candidate groundings of each search are spread over
+    up to nthreads worker threads. True, the default, means one per
+    core; 0 or 1 means a sequential search.
+
+    This pays off for large queries, rooted at atoms with a big
+    incoming set; small searches are always run sequentially. Like
+    CancelToken, the setting applies to the queries started on the
+    current thread, including those started from Scheme. Blocks may
+    nest; the innermost one wins. See also the ``parallel`` argument
+    of AtomSpace.execute().
+    """
+    prev = set_search_parallel(_search_threads(nthreads))
+    try:
+        yield
+    finally:
+        set_search_parallel(prev)
+
+
+_search_planners = {
+    "legacy": LEGACY_PLANNER,
+    "cost": COST_PLANNER,
+}
+
+
+@contextmanager
+def search_planner(name):
+    """Plan the queries inside a ``with search_planner(name):`` block
+    with the named planner; one of:
+
+    ``"legacy"``
+        Start each search at the constant with the smallest incoming
+        set, then ground the clause with the fewest ungrounded
+        variables. This is the default.
+    ``"cost"``
+        Estimate the number of candidate groundings of each possible
+        start and each possible next clause, from the incoming-set
+        sizes of the atoms involved and sampled per-type statistics
+        of the AtomSpace, and pick the cheapest.
+
+    Both planners find the same results; only the order of the search,
+    and so its speed, differs. Use AtomSpace.explain() to see the
+    plans. The setting applies to the queries started on the current
+    thread; blocks may nest, the innermost one wins.
+    """
+    if name not in _search_planners:
+        raise ValueError("unknown search planner: %r; expected one of %s"
+                         % (name, ", ".join(sorted(_search_planners))))
+    prev = set_search_planner(_search_planners[name])
+    try:
+        yield
+    finally:
+        set_search_planner(prev)
@@ -0,0 +1,48 @@
+cdef class PreparedQuery:
+    """A query that is run many times, with different values for some
+    of its variables, the parameters. The query is analyzed once,
+    instead of once per set of values. Use AtomSpace.prepare():
+
+        who_is_a = space.prepare(
+            GetLink(VariableNode("who"),
+                    InheritanceLink(VariableNode("who"), VariableNode("what"))),
+            VariableNode("what"))
+        who_is_a(ConceptNode("animal"))
+
+    The result is the same as executing the query with the parameters
+    replaced by the given values. Safe to call from several threads.
+    """
+
+    def __init__(self, AtomSpace space not None, Atom query not None, *params):
+        if space.atomspace == NULL:
+            raise RuntimeError("Null AtomSpace!")
+        cdef vector[cHandle] c_params = atom_list_to_vector(list(params))
+        self.prepared = createPreparedQuery(deref(query.handle), c_params)
+        self.space = space
+        self.query = query
+        self.params = params
+
+    def execute(self, *values, parallel=None):
+        """Run the query with the parameters grounded by the values,
+        given in the same order as the parameters.
+
+        parallel -- as for AtomSpace.execute().
+        """
+        cdef vector[cHandle] c_values = atom_list_to_vector(list(values))
+        cdef cPreparedQuery* pq = self.prepared.get()
+        cdef cAtomSpace* asp = self.space.atomspace
+        cdef cValuePtr result
+        cdef size_t prev = 0
+        cdef bint scoped = parallel is not None
+        if scoped:
+            prev = set_search_parallel(_search_threads(parallel))
+        try:
+            with nogil:
+                result = pq.execute(asp, c_values)
+        finally:
+            if scoped:
+                set_search_parallel(prev)
+        return create_python_value_from_c_value(result)
+
+    def __call__(self, *values, parallel=None):
+        return self.execute(*values, parallel=parallel)
@@ -0,0 +1,54 @@
+from cython.operator cimport preincrement as inc
+
+# Conversion of the search plans and profiles of AtomSpace.explain()
+# and AtomSpace.profile() to python.
+
+cdef object _atom_or_none(const cHandle& h):
+    if h == h.UNDEFINED:
+        return None
+    return Atom.createAtom(h)
+
+
+cdef dict _profile_counter(const cQueryProfileCounter& cnt):
+    return {"calls": cnt.calls, "accepted": cnt.accepted,
+            "seconds": cnt.seconds}
+
+
+cdef dict _profile_counters(cpp_map[cHandle, cQueryProfileCounter]& cnts):
+    result = {}
+    cdef cpp_map[cHandle, cQueryProfileCounter].iterator it = cnts.begin()
+    while it != cnts.end():
+        result[Atom.createAtom(deref(it).first)] = \
+            _profile_counter(deref(it).second)
+        inc(it)
+    return result
+
+
+cdef list _profile_searches(cQueryProfile& prof):
+    searches = []
+    cdef size_t i
+    for i in range(prof.searches.size()):
+        search = {
+            "strategy": prof.searches[i].strategy.decode('UTF-8'),
+            "clause": _atom_or_none(prof.searches[i].clause),
+            "start_term": _atom_or_none(prof.searches[i].start_term),
+            "start": _atom_or_none(prof.searches[i].start),
+            "candidates": prof.searches[i].candidates}
+        if not prof.plan_only:
+            search["explored"] = prof.searches[i].explored
+            search["seconds"] = prof.searches[i].seconds
+        searches.append(search)
+    return searches
+
+
+cdef dict _profile_dict(cQueryProfile& prof):
+    callbacks = {}
+    cdef size_t i
+    for i in range(QUERY_PROFILE_NUM_CALLBACKS):
+        name = query_profile_callback_name(i).decode('UTF-8')
+        callbacks[name] = _profile_counter(prof.callbacks[i])
+    return {"seconds": prof.seconds,
+            "searches": _profile_searches(prof),
+            "callbacks": callbacks,
+            "clauses": _profile_counters(prof.clauses),
+            "evaluations": _profile_counters(prof.evaluations)}
@@ -0,0 +1,63 @@
+import threading
+
+cdef class QueryStream:
+    """Results of a query, handed over in batches by a search running
+    on another thread, through a channel holding at most batch_size
+    results. Use AtomSpace.iter_query() rather than this directly."""
+
+    def __cinit__(self, size_t batch_size):
+        if batch_size == 0:
+            raise ValueError("batch_size must be positive")
+        self.batch_size = batch_size
+        self.stream = createQueryStream(batch_size)
+
+    def run(self, AtomSpace space, Atom query, size_t nthreads=0):
+        """Run the query on the calling thread, sending its results
+        down the channel. Returns when the search is done, or has
+        been cancelled; errors are raised by next_batch()."""
+        # Python callbacks run on this thread; point them at the
+        # atomspace being searched.
+        from opencog.utilities import push_default_atomspace, pop_default_atomspace
+        cdef cQueryStream* qs = self.stream.get()
+        cdef cAtomSpace* asp = space.atomspace
+        cdef cHandle h = deref(query.handle)
+        cdef size_t prev = set_search_parallel(nthreads)
+        push_default_atomspace(space)
+        try:
+            with nogil:
+                qs.run(asp, h)
+        finally:
+            pop_default_atomspace()
+            set_search_parallel(prev)
+
+    def next_batch(self):
+        """Return a list of the next results, waiting until there are
+        some. An empty list means that the search is over."""
+        cdef cQueryStream* qs = self.stream.get()
+        cdef vector[cValuePtr] values
+        cdef size_t n = self.batch_size
+        with nogil:
+            qs.next_batch(values, n)
+        return [create_python_value_from_c_value(v) for v in values]
+
+    def cancel(self):
+        """Stop the search, and drop the results not yet consumed."""
+        self.stream.get().cancel()
+
+
+def _stream_results(QueryStream stream, AtomSpace space, Atom query,
+                    size_t nthreads):
+    producer = threading.Thread(target=stream.run,
+                                args=(space, query, nthreads),
+                                name="opencog-iter-query", daemon=True)
+    producer.start()
+    try:
+        while True:
+            batch = stream.next_batch()
+            if not batch:
+                return
+            yield from batch
+    finally:
+        # If the consumer stopped early, this stops the search.
+        stream.cancel()
+        producer.join()
@@ -8,12 +8,18 @@ functionality, see:
     tests/cython/guile/test_pattern.py
 
 Also refer to the list of .scm type definition files in opencog.conf
+
+The GIL is released while Scheme runs; it is taken again only when
+Scheme calls back into python.
 """
 
 from cython.operator cimport dereference as deref
+from cpython.ref cimport PyObject, Py_XDECREF
+from libcpp.vector cimport vector
 from opencog.atomspace cimport (cValuePtr, Value, cAtomSpace,
                                 Atom, AtomSpace, cAtom, cHandle,
-                                AtomSpace_factoid)
+                                AtomSpace_factoid, atom_seq_to_vector,
+                                create_python_value_from_c_value)
 
 
 # basic wrapping for std::string conversion
@@ -25,7 +31,7 @@ cdef extern from "<string>" namespace "std":
         int size()
 
 cdef extern from "opencog/cython/opencog/PyScheme.h" namespace "opencog":
-    string eval_scheme(cAtomSpace* as, const string& s) except +
+    string eval_scheme(cAtomSpace* as, const string& s) except + nogil
 
 def scheme_eval(AtomSpace a, str pys):
     """Evaluate Scheme program and return string.
@@ -41,11 +47,13 @@ def scheme_eval(AtomSpace a, str pys):
     cdef string expr
     expr = pys.encode('UTF-8')
     # print "Debug: called scheme eval with atomspace {0:x}".format(<unsigned long int>a.atomspace)
-    ret = eval_scheme(a.atomspace, expr)
+    cdef cAtomSpace* asp = a.atomspace
+    with nogil:
+        ret = eval_scheme(asp, expr)
     return ret.c_str()
 
 cdef extern from "opencog/cython/opencog/PyScheme.h" namespace "opencog":
-    cValuePtr eval_scheme_v(cAtomSpace* as, const string& s) except +
+    cValuePtr eval_scheme_v(cAtomSpace* as, const string& s) except + nogil
 
 def scheme_eval_v(AtomSpace a, str pys):
     """Evaluate Scheme program when expected result is Value.
@@ -60,11 +68,13 @@ def scheme_eval_v(AtomSpace a, str pys):
     cdef cValuePtr ret
     cdef string expr
     expr = pys.encode('UTF-8')
-    ret = eval_scheme_v(a.atomspace, expr)
+    cdef cAtomSpace* asp = a.atomspace
+    with nogil:
+        ret = eval_scheme_v(asp, expr)
     return Value.create(ret)
 
 cdef extern from "opencog/cython/opencog/PyScheme.h" namespace "opencog":
-    cHandle eval_scheme_h(cAtomSpace* as, const string& s) except +
+    cHandle eval_scheme_h(cAtomSpace* as, const string& s) except + nogil
 
 def scheme_eval_h(AtomSpace a, str pys):
     """Evaluate Scheme program when expected result is Handle.
@@ -79,11 +89,13 @@ def scheme_eval_h(AtomSpace a, str pys):
     cdef cHandle ret
     cdef string expr
     expr = pys.encode('UTF-8')
-    ret = eval_scheme_h(a.atomspace, expr)
+    cdef cAtomSpace* asp = a.atomspace
+    with nogil:
+        ret = eval_scheme_h(asp, expr)
     return Atom.createAtom(ret)
 
 cdef extern from "opencog/cython/opencog/PyScheme.h" namespace "opencog":
-    cValuePtr eval_scheme_as(const string& s) except +
+    cValuePtr eval_scheme_as(const string& s) except + nogil
 
 def scheme_eval_as(str pys):
     """Evaluate Scheme program when expected result is AtomSpace.
@@ -98,9 +110,187 @@ def scheme_eval_as(str pys):
     cdef cValuePtr ret
     cdef string expr
     expr = pys.encode('UTF-8')
-    ret = eval_scheme_as(expr)
+    with nogil:
+        ret = eval_scheme_as(expr)
     return AtomSpace_factoid(ret)
 
+ctypedef PyObject* (*value_wrapper)(const cValuePtr&)
+
+cdef extern from "opencog/cython/opencog/PyScheme.h" namespace "opencog":
+    PyObject* eval_scheme_py(cAtomSpace* as, const string& s,
+                             value_wrapper wrap) except + nogil
+
+cdef object _wrap_value(const cValuePtr& value):
+    return create_python_value_from_c_value(value)
+
+cdef int _raise_pending() except -1:
+    # The exception was already set, by the C++ converter.
+    return -1
+
+def scheme_eval_py(AtomSpace a, str pys):
+    """Evaluate Scheme program, returning a native python object.
+
+    The result is converted in C++, without printing and re-parsing:
+    booleans, integers, reals and complex numbers become bool, int,
+    float and complex; strings, symbols, keywords and characters
+    become str; proper lists and vectors become lists, and other
+    pairs 2-tuples; Atoms and Values are wrapped as usual. An
+    unspecified result is None.
+    Args:
+        a (AtomSpace): atomspace to work on
+        pys (str): Scheme program to evaluate
+    Returns:
+        object: result of a evaluation
+    Raises:
+        RuntimeError: in case of evaluation error
+        TypeError: if the result has no python equivalent
+    """
+    cdef string expr
+    expr = pys.encode('UTF-8')
+    cdef cAtomSpace* asp = a.atomspace
+    cdef PyObject* ret
+    with nogil:
+        ret = eval_scheme_py(asp, expr, <value_wrapper>_wrap_value)
+    if ret == NULL:
+        _raise_pending()
+    result = <object>ret
+    Py_XDECREF(ret)
+    return result
+
+cdef extern from "opencog/cython/opencog/PyScheme.h" namespace "opencog":
+    vector[cValuePtr] eval_scheme_many(cAtomSpace* as,
+                                       const vector[string]& exprs) except + nogil
+
+def scheme_eval_many(AtomSpace a, exprs):
+    """Evaluate a batch of Scheme expressions, in order.
+
+    The evaluator is fetched and set up once for the whole batch,
+    instead of once per expression.
+    Args:
+        a (AtomSpace): atomspace to work on
+        exprs (iterable of str): Scheme expressions to evaluate
+    Returns:
+        list: the Value (or None) returned by each expression
+    Raises:
+        RuntimeError: in case of evaluation error
+    """
+    cdef vector[string] cexprs
+    cdef vector[cValuePtr] ret
+    for pys in exprs:
+        cexprs.push_back(string(pys.encode('UTF-8')))
+    cdef cAtomSpace* asp = a.atomspace
+    with nogil:
+        ret = eval_scheme_many(asp, cexprs)
+    return [create_python_value_from_c_value(v) for v in ret]
+
+cdef extern from "opencog/cython/opencog/PyScheme.h" namespace "opencog":
+    string compile_scheme(const vector[string]& params,
+                          const string& expr) except + nogil
+    cValuePtr apply_scheme(cAtomSpace* as, const string& name,
+                           const vector[cHandle]& args) except + nogil
+    void release_scheme(const string& name) except + nogil
+
+cdef class CompiledScheme:
+    """A Scheme expression, parsed and compiled once.
+
+    Create with scheme_compile(). Calling it evaluates the compiled
+    code against the given AtomSpace; the parameters, if any, are
+    bound to the Atoms passed after the AtomSpace.
+    """
+    cdef string name
+    cdef readonly str source
+    cdef readonly tuple params
+
+    def __call__(self, AtomSpace a, *args):
+        if len(args) != len(self.params):
+            raise TypeError("expected {0} arguments, got {1}".format(
+                len(self.params), len(args)))
+        cdef vector[cHandle] cargs = atom_seq_to_vector(args)
+        cdef cAtomSpace* asp = a.atomspace
+        cdef cValuePtr ret
+        with nogil:
+            ret = apply_scheme(asp, self.name, cargs)
+        return create_python_value_from_c_value(ret)
+
+    def __dealloc__(self):
+        if self.name.size() == 0:
+            return
+        try:
+            with nogil:
+                release_scheme(self.name)
+        except RuntimeError:
+            pass
+
+    def __repr__(self):
+        return "<CompiledScheme ({0}) {1}>".format(
+            " ".join(self.params), self.source)
+
+def scheme_compile(str pys, params=()):
+    """Compile a Scheme expression for repeated evaluation.
+    Args:
+        pys (str): Scheme expression
+        params (sequence of str): names of the parameters that
+            the expression refers to
+    Returns:
+        CompiledScheme: call it as compiled(atomspace, *atoms)
+    Raises:
+        RuntimeError: in case of syntax or compilation error
+    """
+    cdef vector[string] cparams
+    for p in params:
+        cparams.push_back(string(p.encode('UTF-8')))
+    cdef string expr = pys.encode('UTF-8')
+    cdef string name
+    with nogil:
+        name = compile_scheme(cparams, expr)
+    cdef CompiledScheme compiled = CompiledScheme.__new__(CompiledScheme)
+    compiled.name = name
+    compiled.source = pys
+    compiled.params = tuple(params)
+    return compiled
+
+cdef extern from "opencog/cython/opencog/PyScheme.h" namespace "opencog":
+    cdef struct EvaluatorStats:
+        size_t calls
+        double busy
+        double wait
+        bint in_use
+    void configure_evaluator_pool(size_t size,
+                                  const vector[string]& modules) except + nogil
+    vector[EvaluatorStats] get_evaluator_pool_stats() nogil
+
+def scheme_pool_configure(size_t size, modules=()):
+    """Share a fixed pool of Scheme evaluators among python threads.
+
+    By default, each python thread calling into Scheme gets its own
+    evaluator, created on first use. With a pool of size > 0, calls
+    instead borrow an idle evaluator from the pool, waiting for one
+    if all are busy. New evaluators are created and warmed up here,
+    before any call can use them. A size of 0 removes the pool.
+    Must not be called from inside a Scheme evaluation.
+    Args:
+        size (int): number of evaluators
+        modules (iterable of str): loaded into each new evaluator;
+            ".scm" files are loaded with load-from-path, anything
+            else is a module name, such as "(opencog exec)"
+    Raises:
+        RuntimeError: if loading a module fails
+    """
+    cdef vector[string] cmodules
+    for mod in modules:
+        cmodules.push_back(string(mod.encode('UTF-8')))
+    with nogil:
+        configure_evaluator_pool(size, cmodules)
+
+def scheme_pool_stats():
+    """Return a list with one dict per pooled evaluator, holding the
+    number of calls it ran, the seconds spent running them ("busy"),
+    the seconds callers waited to get it ("wait"), and whether it is
+    in use right now."""
+    cdef vector[EvaluatorStats] stats = get_evaluator_pool_stats()
+    return [{"calls": st.calls, "busy": st.busy, "wait": st.wait,
+             "in_use": st.in_use} for st in stats]
+
 cdef extern from "opencog/cython/opencog/load-file.h" namespace "opencog":
     int load_scm_file_relative (cAtomSpace& as, char* filename) except +
 
@@ -1,12 +1,14 @@
 #
-# This file reads files that are generated by the OPENCOG_ADD_ATOM_TYPES
-# macro so they can be imported using:
+# This file provides the python wrappers for atom creation, one per
+# Node and Link type, so they can be imported using:
 #
 # from type_constructors import *
 #
-# This imports all the python wrappers for atom creation.
+# The wrappers are created on first use, by the module __getattr__
+# below, rather than all at import time.
 #
 from opencog.atomspace cimport strength_t, confidence_t
+from opencog.atomspace cimport nameserver, Type
 
 import warnings
 
@@ -24,9 +26,80 @@ from opencog.utilities import get_default_atomspace, set_default_atomspace
 from opencog.utilities import push_default_atomspace, pop_default_atomspace
 
 # -----------------------------------------------------------------
-# The core Atom types are taken from an auto-generated file
-# built in the build dir, installed into the filesystem.
-include "opencog/atoms/atom_types/core_types.pyx"
+# Constructors for the Atom types. These used to be defined eagerly,
+# by including the auto-generated core_types.pyx; now a table of
+# constructor names is built from the nameserver on first lookup,
+# and each constructor is made when it is first asked for. The names
+# are the same as before: the full type name, and the short name.
+# The table is rebuilt when new types get added to the nameserver.
+#
+# As before, types that are neither Nodes nor Links, and that are not
+# named like Values, get a constructor that makes a Link with no
+# TruthValue (e.g. Frame and Valuation). These can only ever fail;
+# they are kept so that the names remain importable.
+
+# Kinds of constructor, in the table.
+_LINK_CTOR, _NODE_CTOR, _OTHER_CTOR = range(3)
+
+cdef dict _ctor_table = None
+cdef Type _ctor_table_size = 0
+
+cdef dict ctor_table():
+    """name -> (type, kind) for every constructor name."""
+    global _ctor_table, _ctor_table_size
+    cdef Type t
+    cdef Type num_types = nameserver().getNumberOfClasses()
+    if _ctor_table is not None and _ctor_table_size == num_types:
+        return _ctor_table
+    table = {}
+    for t in range(0, num_types):
+        name = nameserver().getTypeName(t).decode('UTF-8')
+        if name == "Atom" or not name.isidentifier():
+            continue
+        if nameserver().isNode(t):
+            kind = _NODE_CTOR
+        elif nameserver().isLink(t):
+            kind = _LINK_CTOR
+        elif name.endswith(("Value", "Stream", "AtomSpace")):
+            continue
+        else:
+            table[name] = (t, _OTHER_CTOR)
+            continue
+        table[name] = (t, kind)
+        short = nameserver().getTypeShortName(t).decode('UTF-8')
+        if short:
+            table[short] = (t, kind)
+    _ctor_table = table
+    _ctor_table_size = num_types
+    return table
+
+def _make_ctor(Type t, int kind, str name):
+    if kind == _NODE_CTOR:
+        def ctor(node_name, tv=None):
+            return add_node(t, node_name, tv)
+    elif kind == _LINK_CTOR:
+        def ctor(*args, tv=None):
+            return add_link(t, args, tv=tv)
+    else:
+        def ctor(*args):
+            return add_link(t, args)
+    ctor.__name__ = ctor.__qualname__ = name
+    return ctor
+
+def __getattr__(name):
+    if name == "__all__":
+        public = [n for n in globals() if not n.startswith("_")]
+        return sorted(set(public) | set(ctor_table()))
+    entry = None if name.startswith("__") else ctor_table().get(name)
+    if entry is None:
+        raise AttributeError("module {0!r} has no attribute {1!r}".format(
+            __name__, name))
+    ctor = _make_ctor(entry[0], entry[1], name)
+    globals()[name] = ctor
+    return ctor
+
+def __dir__():
+    return sorted(set(globals()) | set(ctor_table()))
 
 # -----------------------------------------------------------------
 # The auto-gened types do not include the Values. So handle these
@@ -8,6 +8,10 @@ from opencog.atomspace cimport cAtomSpace, Type, tv_ptr, cHandle, cValuePtr
 cdef extern from "opencog/cython/opencog/Utilities.h" namespace "opencog":
     cdef void c_initialize_python "opencog::initialize_python" ()
     cdef void c_finalize_python "opencog::finalize_python" ()
+    cdef void c_clear_python_function_cache "opencog::clear_python_function_cache" (const string& func)
+    cdef void c_get_python_function_cache_stats "opencog::get_python_function_cache_stats" (size_t& hits, size_t& misses, size_t& size)
+    cdef void c_set_python_max_concurrent_calls "opencog::set_python_max_concurrent_calls" (size_t n) except +
+    cdef size_t c_get_python_max_concurrent_calls "opencog::get_python_max_concurrent_calls" ()
     cHandle c_add_node "opencog::add_node" (Type t, const string s) except +
     # cHandle c_add_node "opencog::add_node" (Type t, string s, tv_ptr tvn) except +
     cHandle c_add_link "opencog::add_link" (Type t, const vector[cHandle]) except +
@@ -42,6 +42,53 @@ def finalize_opencog():
     is_initialized = False
 
 
+def clear_python_function_cache(name=None):
+    """
+    Forget the cached lookups of python functions called from Atomese,
+    by GroundedSchemaNodes and GroundedPredicateNodes ("py:...").
+
+    name -- forget just this function, or module, or class, and
+        everything found inside of it. None forgets everything.
+
+    Rebinding a function in its module, e.g. with importlib.reload()
+    or by assigning to a module attribute, is noticed automatically.
+    Call this after rebinding something further down the name, e.g.
+    a method of a class, for "py:module.Class.method".
+    """
+    cdef string cname = b"" if name is None else name.encode('UTF-8')
+    c_clear_python_function_cache(cname)
+
+
+def python_function_cache_stats():
+    """
+    Return a dict with the hits, misses and current size of the cache
+    of python functions called from Atomese.
+    """
+    cdef size_t hits = 0, misses = 0, size = 0
+    c_get_python_function_cache_stats(hits, misses, size)
+    return {"hits": hits, "misses": misses, "size": size}
+
+
+def set_python_max_concurrent_calls(size_t n):
+    """
+    Set how many threads may be inside python callbacks
+    (GroundedSchemaNodes and GroundedPredicateNodes) at the same time.
+    The default is 1: all callbacks are serialized on one global lock.
+    This is not parallel execution: the callbacks still take turns on
+    the GIL, and only overlap where it is released, such as in sleeps,
+    I/O, and atomspace and query calls. With n > 1, the callbacks must
+    be thread-safe.
+
+    Raises RuntimeError if any callback is running; set it before
+    starting the threads that run queries.
+    """
+    c_set_python_max_concurrent_calls(n)
+
+
+def get_python_max_concurrent_calls():
+    return c_get_python_max_concurrent_calls()
+
+
 @contextmanager
 def tmp_atomspace():
     """
@@ -87,6 +87,11 @@ cdef class Value:
            return self.short_string()
         return self.long_string()
 
+    def __reduce__(self):
+        # Atoms are unpickled into the default AtomSpace, together
+        # with their Values.
+        return (_value_from_bytes, (values_to_bytes([self], True),))
+
     def __richcmp__(self, other, op):
         if not isinstance(other, Value):
             raise TypeError('Value cannot be compared with {}'
@@ -85,6 +85,8 @@ void SchemeEval::init(void)
 	_captured_stack = scm_gc_protect_object(_captured_stack);
 
 	_pexpr = NULL;
+	_scm_cb = nullptr;
+	_scm_cb_data = nullptr;
 	_eval_done = true;
 	_poll_done = true;
 
@@ -1014,6 +1016,64 @@ void * SchemeEval::c_wrap_eval_as(void * p)
 	return self;
 }
 
+/**
+ * Evaluate a string containing a scheme expression, and pass the
+ * resulting SCM to the callback, without converting it. The callback
+ * runs in guile mode, in this thread, before eval_scm() returns.
+ * If an evaluation error occurs, the callback is not called, and an
+ * exception is thrown.
+ */
+void SchemeEval::eval_scm(const std::string &expr,
+                          void (*cb)(SCM, void *), void *data)
+{
+	// If we are recursing, then we are already in guile mode.
+	if (_in_eval) {
+		SCM expr_str = scm_from_utf8_string(expr.c_str());
+		SCM rc = do_scm_eval(expr_str, recast_scm_eval_string);
+		if (eval_error())
+			throw RuntimeException(TRACE_INFO, "%s", _error_msg.c_str());
+		cb(rc, data);
+		return;
+	}
+
+	_pexpr = &expr;
+	_scm_cb = cb;
+	_scm_cb_data = data;
+	_in_eval = true;
+	scm_with_guile(c_wrap_eval_scm, this);
+	_in_eval = false;
+	_scm_cb = nullptr;
+	_scm_cb_data = nullptr;
+
+	// Convert evaluation errors into C++ exceptions.
+	if (eval_error())
+		throw RuntimeException(TRACE_INFO, "%s", _error_msg.c_str());
+}
+
+void * SchemeEval::c_wrap_eval_scm(void * p)
+{
+	SchemeEval *self = (SchemeEval *) p;
+
+	// Set per-thread atomspace variable in the execution environment.
+	if (self->_atomspace)
+		SchemeSmob::ss_set_env_as(self->_atomspace);
+
+	SCM expr_str = scm_from_utf8_string(self->_pexpr->c_str());
+	SCM rc = self->do_scm_eval(expr_str, recast_scm_eval_string);
+
+	// Pass evaluation errors out of the wrapper.
+	if (self->eval_error()) return self;
+
+	self->_scm_cb(rc, self->_scm_cb_data);
+	return self;
+}
+
+ValuePtr SchemeEval::protom_of(SCM sv)
+{
+	if (not SchemeSmob::scm_is_protom(sv)) return nullptr;
+	return SchemeSmob::scm_to_protom(sv);
+}
+
 /* ============================================================== */
 /* ============================================================== */
 
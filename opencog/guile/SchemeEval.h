@@ -134,6 +134,11 @@ class SchemeEval : public GenericEval
 		SCM do_apply_scm(const std::string& func, const ValuePtr& varargs);
 		static void * c_wrap_apply_v(void *);
 
+		// Evaluate, handing the raw result to a callback
+		void (*_scm_cb)(SCM, void *);
+		void *_scm_cb_data;
+		static void * c_wrap_eval_scm(void *);
+
 		// Exception and error handling stuff
 		SCM _scm_error_string;
 		std::string _error_msg;
@@ -197,6 +202,15 @@ class SchemeEval : public GenericEval
 		// Evaluate expression, returning AtomSpace.
 		AtomSpacePtr eval_as(const std::string&);
 
+		// Evaluate expression, and pass the raw SCM result to the
+		// callback, while still in guile mode. For language bindings
+		// that convert guile objects to their own native types; the
+		// callback must not throw. Use protom_of() to unwrap atoms.
+		void eval_scm(const std::string&, void (*)(SCM, void *), void *);
+
+		// The Atom or Value held by a scheme object, else nullptr.
+		static ValuePtr protom_of(SCM);
+
 		// Apply expression to args, returning Handle or TV
 		virtual ValuePtr apply_v(const std::string& func, ValuePtr varargs);
 		Handle apply(const std::string& func, Handle varargs) {
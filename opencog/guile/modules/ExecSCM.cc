@@ -27,11 +27,16 @@ void opencog_exec_init(void);
 
 
 #include <cstddef>
+#include <map>
 #include <opencog/atoms/base/Link.h>
 #include <opencog/atomspace/AtomSpace.h>
 #include <opencog/atoms/execution/EvaluationLink.h>
 #include <opencog/atoms/execution/Instantiator.h>
+#include <opencog/query/PreparedQuery.h>
+#include <opencog/query/QueryProfile.h>
 #include <opencog/guile/SchemeModule.h>
+#include <opencog/guile/SchemePrimitive.h>
+#include <opencog/guile/SchemeSmob.h>
 
 // ========================================================
 
@@ -65,6 +70,101 @@ static TruthValuePtr ss_evaluate(AtomSpace* atomspace, const Handle& h)
 	return EvaluationLink::do_evaluate(atomspace, h);
 }
 
+/**
+ * cog-execute-prepared! runs QUERY with the variables PARAMS grounded
+ * by VALUES. The analysis of QUERY is held by the query atom itself,
+ * so making the PreparedQuery each time around costs next to nothing.
+ */
+static ValuePtr ss_execute_prepared(const Handle& query,
+                                    const HandleSeq& params,
+                                    const HandleSeq& values)
+{
+	PreparedQuery pq(query, params);
+	const AtomSpacePtr& asp = SchemeSmob::ss_get_env_as("cog-execute-prepared!");
+	return pq.execute(asp.get(), values);
+}
+
+static SCM acons(const char* key, SCM val, SCM alist)
+{
+	return scm_acons(scm_from_utf8_symbol(key), val, alist);
+}
+
+static SCM counter_to_scm(const QueryProfile::Counter& cnt)
+{
+	SCM rc = SCM_EOL;
+	rc = acons("seconds", scm_from_double(cnt.seconds), rc);
+	rc = acons("accepted", scm_from_size_t(cnt.accepted), rc);
+	rc = acons("calls", scm_from_size_t(cnt.calls), rc);
+	return rc;
+}
+
+static SCM counters_to_scm(const std::map<Handle, QueryProfile::Counter>& cnts)
+{
+	SCM rc = SCM_EOL;
+	for (auto it = cnts.rbegin(); it != cnts.rend(); it++)
+		rc = scm_acons(SchemeSmob::handle_to_scm(it->first),
+		               counter_to_scm(it->second), rc);
+	return rc;
+}
+
+static SCM searches_to_scm(const QueryProfile& prof)
+{
+	SCM rc = SCM_EOL;
+	for (auto it = prof.searches.rbegin(); it != prof.searches.rend(); it++)
+	{
+		SCM srch = SCM_EOL;
+		if (not prof.plan_only)
+		{
+			srch = acons("seconds", scm_from_double(it->seconds), srch);
+			srch = acons("explored", scm_from_size_t(it->explored), srch);
+		}
+		srch = acons("candidates", scm_from_size_t(it->candidates), srch);
+		srch = acons("start", SchemeSmob::handle_to_scm(it->start), srch);
+		srch = acons("start-term",
+			SchemeSmob::handle_to_scm(it->start_term), srch);
+		srch = acons("clause", SchemeSmob::handle_to_scm(it->clause), srch);
+		srch = acons("strategy",
+			scm_from_utf8_string(it->strategy.c_str()), srch);
+		rc = scm_cons(srch, rc);
+	}
+	return rc;
+}
+
+/**
+ * cog-explain returns the search plans of QUERY, without running
+ * the searches: a list with an association list per search.
+ */
+static SCM ss_explain(const Handle& query)
+{
+	const AtomSpacePtr& asp = SchemeSmob::ss_get_env_as("cog-explain");
+	return searches_to_scm(explain_query(asp.get(), query));
+}
+
+/**
+ * cog-profile executes QUERY, and returns an association list with
+ * the result, and the plans, counters and timings of its searches.
+ */
+static SCM ss_profile(const Handle& query)
+{
+	const AtomSpacePtr& asp = SchemeSmob::ss_get_env_as("cog-profile");
+	QueryProfile prof;
+	ValuePtr result(profile_query(asp.get(), query, prof));
+
+	SCM cbs = SCM_EOL;
+	for (size_t i = QueryProfile::NUM_CALLBACKS; 0 < i; i--)
+		cbs = acons(QueryProfile::callback_name(i-1),
+		            counter_to_scm(prof.callbacks[i-1]), cbs);
+
+	SCM rc = SCM_EOL;
+	rc = acons("evaluations", counters_to_scm(prof.evaluations), rc);
+	rc = acons("clauses", counters_to_scm(prof.clauses), rc);
+	rc = acons("callbacks", cbs, rc);
+	rc = acons("searches", searches_to_scm(prof), rc);
+	rc = acons("seconds", scm_from_double(prof.seconds), rc);
+	rc = acons("result", SchemeSmob::protom_to_scm(result), rc);
+	return rc;
+}
+
 // ========================================================
 
 // XXX HACK ALERT This needs to be static, in order for python to
@@ -89,6 +189,12 @@ void ExecSCM::init(void)
 
 	_binders->push_back(new FunctionWrap(ss_evaluate,
 	                   "cog-evaluate!", "exec"));
+
+	define_scheme_primitive("cog-execute-prepared!",
+		ss_execute_prepared, "exec");
+
+	define_scheme_primitive("cog-explain", ss_explain, "exec");
+	define_scheme_primitive("cog-profile", ss_profile, "exec");
 }
 
 ExecSCM::~ExecSCM()
@@ -7,7 +7,8 @@
 (use-modules (opencog as-config))
 (load-extension (string-append opencog-ext-path-exec "libexec") "opencog_exec_init")
 
-(export cog-evaluate! cog-execute!)
+(export cog-evaluate! cog-execute! cog-execute-prepared!
+	cog-explain cog-profile)
 
 (use-modules (ice-9 optargs)) ; for define*-public
 
@@ -49,4 +50,31 @@
 		))
 )
 
+; --------------------------------------------------------------------
+
+(define-public (cog-prepare-query QUERY . PARAMS)
+"
+ cog-prepare-query QUERY PARAM ...
+
+   Return a procedure that runs QUERY, with the variables PARAM ...
+   grounded by its arguments. QUERY must be a QueryLink, BindLink,
+   MeetLink or GetLink, and each PARAM must be one of its variables.
+   The result is the same as running `cog-execute!` on QUERY with
+   each PARAM replaced by the corresponding argument; however, QUERY
+   is analyzed only once, instead of once for each set of arguments.
+
+   Example:
+      (define who-is-a (cog-prepare-query
+         (Get (VariableList (Variable \"$who\") (Variable \"$what\"))
+            (Inheritance (Variable \"$who\") (Variable \"$what\")))
+         (Variable \"$what\")))
+
+      (who-is-a (Concept \"animal\"))
+      (who-is-a (Concept \"plant\"))
+
+   See also `cog-execute-prepared!`, which this calls.
+"
+	(lambda VALUES (cog-execute-prepared! QUERY PARAMS VALUES))
+)
+
 ; ------------------ THE END -------------------
@@ -61,6 +61,7 @@ bool ContinuationMixin::evaluate_sentence(const Handle& top,
 {
 	if (CONTINUATION_LINK == top->get_type())
 	{
+		LOCK_PE_MUTEX;
 		_continuation = Replacement::replace_nocheck(top, gnds);
 		throw ContinuationException();
 	}
@@ -131,7 +132,7 @@ bool ContinuationMixin::satisfy(const PatternLinkPtr& form)
 		{
 			in_continuation = true;
 			Handle plk = _continuation->getOutgoingAtom(0);
-			AtomSpace* tas = TermMatchMixin::_temp_aspace;
+			AtomSpace* tas = scratch().temp_aspace;
 			tas->clear();
 			bool crispy = EvaluationLink::crisp_eval_scratch(tas, plk, tas);
 
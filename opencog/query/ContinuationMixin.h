@@ -67,6 +67,7 @@ class ContinuationMixin :
 		virtual bool satisfy(const PatternLinkPtr&);
 
 	protected:
+		DECLARE_PE_MUTEX;
 		Handle _continuation;
 };
 
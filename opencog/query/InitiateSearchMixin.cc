@@ -21,6 +21,13 @@
  * 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
  */
 
+#include <algorithm>
+#include <cfloat>
+#include <chrono>
+#include <exception>
+#include <mutex>
+#include <thread>
+
 #include <opencog/atomspace/AtomSpace.h>
 
 #include <opencog/atoms/core/DefineLink.h>
@@ -31,12 +38,7 @@
 
 #include "InitiateSearchMixin.h"
 #include "PatternMatchEngine.h"
-
-#ifdef USE_THREADED_PATTERN_ENGINE
-	// #include <algorithm>
-	// #include <execution>
-	#include <opencog/util/oc_omp.h>
-#endif // USE_THREADED_PATTERN_ENGINE
+#include "QueryProfile.h"
 
 using namespace opencog;
 
@@ -49,18 +51,238 @@ using namespace opencog;
 
 /* ======================================================== */
 
+thread_local const std::atomic<bool>*
+	InitiateSearchMixin::_cancel_flag = nullptr;
+
+const std::atomic<bool>*
+InitiateSearchMixin::set_cancel_flag(const std::atomic<bool>* flag)
+{
+	const std::atomic<bool>* prev = _cancel_flag;
+	_cancel_flag = flag;
+	return prev;
+}
+
+bool InitiateSearchMixin::is_cancelled(void)
+{
+	return _cancel_flag and _cancel_flag->load(std::memory_order_relaxed);
+}
+
+void InitiateSearchMixin::check_cancel(void) const
+{
+	if (is_cancelled())
+		throw RuntimeException(TRACE_INFO, "Pattern search cancelled");
+}
+
+/* ======================================================== */
+
+thread_local size_t InitiateSearchMixin::_parallel = 0;
+
+size_t InitiateSearchMixin::set_parallel(size_t nthreads)
+{
+	size_t prev = _parallel;
+	_parallel = nthreads;
+	return prev;
+}
+
+size_t InitiateSearchMixin::get_parallel(void)
+{
+	return _parallel;
+}
+
+thread_local InitiateSearchMixin::SearchPlanner
+	InitiateSearchMixin::_planner = InitiateSearchMixin::LEGACY_PLANNER;
+
+InitiateSearchMixin::SearchPlanner
+InitiateSearchMixin::set_planner(SearchPlanner planner)
+{
+	SearchPlanner prev = _planner;
+	_planner = planner;
+	return prev;
+}
+
+InitiateSearchMixin::SearchPlanner InitiateSearchMixin::get_planner(void)
+{
+	return _planner;
+}
+
+void InitiateSearchMixin::ClauseState::reset(const PatternTermPtr& root)
+{
+	while (0 < issued_stack.size()) issued_stack.pop();
+	issued.clear();
+	issued.insert(root);
+}
+
+InitiateSearchMixin::ClauseState& InitiateSearchMixin::clause_state(void)
+{
+	if (not in_search_worker()) return _clauses;
+
+	static thread_local ClauseState worker_clauses;
+	return worker_clauses;
+}
+
+/* ======================================================== */
+/// A pass-through class, which wraps a regular callback, and counts
+/// and times the calls made to it, for the QueryProfile. The engines
+/// of a search use it in place of the callback, when the search is
+/// being profiled.
+class PMCProfiler : public PatternMatchCallback
+{
+	private:
+		PatternMatchCallback& _cb;
+		QueryProfile* _prof;
+
+		template<typename F>
+		bool timed(QueryProfile::Callback kind, F&& call)
+		{
+			auto start = std::chrono::steady_clock::now();
+			bool ok = call();
+			std::chrono::duration<double> secs =
+				std::chrono::steady_clock::now() - start;
+			_prof->callbacks[kind].add(ok, secs.count());
+			return ok;
+		}
+
+		template<typename F>
+		bool timed_clause(QueryProfile::Callback kind,
+		                  const Handle& clause, F&& call)
+		{
+			auto start = std::chrono::steady_clock::now();
+			bool ok = call();
+			std::chrono::duration<double> secs =
+				std::chrono::steady_clock::now() - start;
+			_prof->callbacks[kind].add(ok, secs.count());
+			_prof->clauses[clause].add(ok, secs.count());
+			return ok;
+		}
+
+	public:
+		PMCProfiler(PatternMatchCallback& cb, QueryProfile* prof) :
+			_cb(cb), _prof(prof) {}
+
+		bool node_match(const Handle& node1, const Handle& node2) {
+			return timed(QueryProfile::NODE_MATCH,
+				[&] { return _cb.node_match(node1, node2); });
+		}
+		bool variable_match(const Handle& node1, const Handle& node2) {
+			return timed(QueryProfile::VARIABLE_MATCH,
+				[&] { return _cb.variable_match(node1, node2); });
+		}
+		bool scope_match(const Handle& node1, const Handle& node2) {
+			return timed(QueryProfile::SCOPE_MATCH,
+				[&] { return _cb.scope_match(node1, node2); });
+		}
+		bool link_match(const PatternTermPtr& link1, const Handle& link2) {
+			return timed(QueryProfile::LINK_MATCH,
+				[&] { return _cb.link_match(link1, link2); });
+		}
+		bool post_link_match(const Handle& link1, const Handle& link2) {
+			return timed(QueryProfile::POST_LINK_MATCH,
+				[&] { return _cb.post_link_match(link1, link2); });
+		}
+		void post_link_mismatch(const Handle& link1, const Handle& link2) {
+			_cb.post_link_mismatch(link1, link2);
+		}
+		bool fuzzy_match(const Handle& h1, const Handle& h2) {
+			return timed(QueryProfile::FUZZY_MATCH,
+				[&] { return _cb.fuzzy_match(h1, h2); });
+		}
+		bool evaluate_sentence(const Handle& link_h,
+		                       const GroundingMap &gnds)
+		{
+			return _prof->evaluate(_cb, link_h, gnds);
+		}
+		bool clause_match(const Handle& pattrn_link_h,
+		                  const Handle& grnd_link_h,
+		                  const GroundingMap& term_gnds)
+		{
+			return timed_clause(QueryProfile::CLAUSE_MATCH, pattrn_link_h,
+				[&] { return _cb.clause_match(pattrn_link_h,
+				                              grnd_link_h, term_gnds); });
+		}
+		bool optional_clause_match(const Handle& pattrn,
+		                           const Handle& grnd,
+		                           const GroundingMap& term_gnds)
+		{
+			return timed_clause(QueryProfile::OPTIONAL_CLAUSE_MATCH, pattrn,
+				[&] { return _cb.optional_clause_match(pattrn,
+				                                       grnd, term_gnds); });
+		}
+		bool always_clause_match(const Handle& pattrn,
+		                         const Handle& grnd,
+		                         const GroundingMap& term_gnds)
+		{
+			return timed_clause(QueryProfile::ALWAYS_CLAUSE_MATCH, pattrn,
+				[&] { return _cb.always_clause_match(pattrn,
+				                                     grnd, term_gnds); });
+		}
+		bool propose_grounding(const GroundingMap &var_soln,
+		                       const GroundingMap &term_soln)
+		{
+			return timed(QueryProfile::PROPOSE_GROUNDING,
+				[&] { return _cb.propose_grounding(var_soln, term_soln); });
+		}
+		bool propose_grouping(const GroundingMap &var_soln,
+		                      const GroundingMap &term_soln,
+		                      const GroundingMap &grouping)
+		{
+			return timed(QueryProfile::PROPOSE_GROUNDING,
+				[&] { return _cb.propose_grouping(var_soln, term_soln,
+				                                  grouping); });
+		}
+		IncomingSet get_incoming_set(const Handle& h, Type t)
+		{
+			return _cb.get_incoming_set(h, t);
+		}
+		Handle get_link(const Handle& hg, Type t, HandleSeq&& oset)
+		{
+			return _cb.get_link(hg, t, std::move(oset));
+		}
+		const TypeSet& get_connectives(void)
+		{
+			return _cb.get_connectives();
+		}
+		void push(void) { _cb.push(); }
+		void pop(void) { _cb.pop(); }
+		void next_connections(const GroundingMap& var_grounding)
+		{
+			_cb.next_connections(var_grounding);
+		}
+		bool get_next_clause(PatternTermPtr& clause, PatternTermPtr& joint)
+		{
+			return _cb.get_next_clause(clause, joint);
+		}
+		void set_pattern(const Variables& vars, const Pattern& pat)
+		{
+			_cb.set_pattern(vars, pat);
+		}
+		const GroundingMap& get_preset_groundings(void)
+		{
+			return _cb.get_preset_groundings();
+		}
+		bool start_search(void) { return _cb.start_search(); }
+		bool perform_search(PatternMatchCallback& pmcb)
+		{
+			return _cb.perform_search(pmcb);
+		}
+		bool search_finished(bool done) { return _cb.search_finished(done); }
+		bool satisfy(const PatternLinkPtr& plp) { return _cb.satisfy(plp); }
+};
+
+/* ======================================================== */
+
 InitiateSearchMixin::InitiateSearchMixin(AtomSpace* as) :
 	_nameserver(nameserver())
 {
 	_variables = nullptr;
 	_pattern = nullptr;
-	_recursing = false;
 
 	_root = PatternTerm::UNDEFINED;
 	_starter_term = PatternTerm::UNDEFINED;
 
 	_curr_clause = PatternTerm::UNDEFINED;
 	_start_choices.clear();
+	_strategy = "";
+	_plan_with = LEGACY_PLANNER;
 	_as = as;
 }
 
@@ -158,6 +380,19 @@ InitiateSearchMixin::find_starter_recursive(const PatternTermPtr& ptm,
 			width = h->getIncomingSetSize();
 			return h;
 		}
+
+		// A variable that is grounded up front is as good as a
+		// constant: start at its grounding.
+		if (VARIABLE_NODE == t and ptm->isBoundVariable())
+		{
+			const GroundingMap& presets = get_preset_groundings();
+			const auto& pre = presets.find(h);
+			if (presets.end() != pre)
+			{
+				width = pre->second->getIncomingSetSize();
+				return pre->second;
+			}
+		}
 		return Handle::UNDEFINED;
 	}
 
@@ -204,6 +439,7 @@ InitiateSearchMixin::find_starter_recursive(const PatternTermPtr& ptm,
 				Choice ch;
 				ch.clause = _curr_clause;
 				ch.start_term = sbr;
+				ch.start = s;
 				ch.search_set = get_incoming_set(s, sbr->getQuote()->get_type());
 				_start_choices.push_back(ch);
 			}
@@ -273,6 +509,193 @@ Handle InitiateSearchMixin::find_thinnest(const PatternTermSeq& clauses,
 	return best_start;
 }
 
+/* ======================================================== */
+/**
+ * Record, in `_fanouts`, the sampled incoming-set statistics that
+ * `estimate_cost()` needs for the term, and all the terms below it.
+ * The parent is the type of the link holding the term, or NOTYPE
+ * for a clause. ChoiceLinks are not in the AtomSpace; the terms
+ * in them are held by the link holding the ChoiceLink.
+ *
+ * The mean fanout is multiplied by the skew of the degrees of the
+ * term type (see `IncomingStats::Degrees::skew()`). A mean says
+ * little when a few hubs hold most of the links: a grounding is
+ * then likely to pass through a hub, so such types are penalised.
+ * The changes are `IncomingStats::all_changes()`, taken once per
+ * search.
+ */
+void InitiateSearchMixin::gather_fanouts(const PatternTermPtr& ptm,
+                                         Type parent, uint64_t changes)
+{
+	const Handle& h = ptm->getHandle();
+	if (not h->is_link()) return;
+
+	Type t = h->get_type();
+	if (CHOICE_LINK == t)
+	{
+		for (const PatternTermPtr& alt : ptm->getOutgoingSet())
+			gather_fanouts(alt, parent, changes);
+		return;
+	}
+
+	std::pair<Type, Type> tp(t, parent);
+	if (NOTYPE != parent and _fanouts.end() == _fanouts.find(tp))
+	{
+		IncomingStats::Degrees deg(
+			_as->get_incoming_stats()->get(_as, t, changes));
+		_fanouts[tp] = deg.degree(parent) * deg.skew();
+	}
+
+	for (const PatternTermPtr& sub : ptm->getOutgoingSet())
+		gather_fanouts(sub, t, changes);
+}
+
+/**
+ * Estimate the cost of grounding the clause, starting from the term
+ * in it, grounded by gnd: that is, the number of candidate
+ * groundings the search will look at. The first step up from the
+ * term is exact: it is the number of links, of the type of the term
+ * holding it, that gnd appears in. The steps further up, to the
+ * top of the clause, are estimated: each multiplies by the mean
+ * number of links of the next type up that hold a link of the type
+ * below, weighted by how skewed that is (see `gather_fanouts()`).
+ * A step with no recorded fanout multiplies by one. A term that
+ * cannot be grounded has an estimated cost of zero; this is as it
+ * should be, since the search is over almost as soon as it starts.
+ *
+ * For a term that is the clause itself, the cost is one.
+ */
+double InitiateSearchMixin::estimate_cost(const Handle& gnd,
+                                          const PatternTermPtr& term,
+                                          const PatternTermPtr& clause) const
+{
+	double cost = 1.0;
+	bool first = true;
+	Type child = NOTYPE;
+	PatternTermPtr ptm(term);
+	while (ptm != clause)
+	{
+		ptm = ptm->getParent();
+		if (nullptr == ptm or nullptr == ptm->getHandle()) break;
+
+		Type parent = ptm->getHandle()->get_type();
+		if (CHOICE_LINK == parent) continue;
+
+		if (first)
+			cost = gnd->getIncomingSetSizeByType(parent, _as);
+		else
+		{
+			const auto& fan = _fanouts.find({child, parent});
+			if (_fanouts.end() != fan) cost *= fan->second;
+		}
+		first = false;
+		child = parent;
+	}
+	return cost;
+}
+
+/**
+ * Collect the places where a neighbor search could start in the term:
+ * each constant node (or variable with a preset grounding) in it,
+ * paired with its own term. This walks the term just the way that
+ * `find_starter_recursive()` does, skipping the same things.
+ */
+void InitiateSearchMixin::collect_starts(const PatternTermPtr& ptm,
+                    std::vector<std::pair<Handle, PatternTermPtr>>& starts)
+{
+	Type t = ptm->getHandle()->get_type();
+	if (SIGNATURE_LINK == t) return;
+	if (ptm->hasEvaluatable() and not ptm->isIdentical()) return;
+
+	for (const PatternTermPtr& hunt : ptm->getOutgoingSet())
+	{
+		const Handle& h = hunt->getHandle();
+		Type ht = h->get_type();
+		if (not _nameserver.isNode(ht))
+		{
+			collect_starts(hunt, starts);
+			continue;
+		}
+
+		// Starting inside of an IdenticalLink is OK; starting right
+		// below it is not.
+		if (ptm->isIdentical()) continue;
+
+		if (VARIABLE_NODE != ht and GLOB_NODE != ht and SIGN_NODE != ht)
+		{
+			starts.emplace_back(h, hunt);
+			continue;
+		}
+
+		if (VARIABLE_NODE == ht and hunt->isBoundVariable())
+		{
+			const GroundingMap& presets = get_preset_groundings();
+			const auto& pre = presets.find(h);
+			if (presets.end() != pre)
+				starts.emplace_back(pre->second, hunt);
+		}
+	}
+}
+
+/**
+ * Like `find_thinnest()`, but for the cost planner: of all the places
+ * where the search could start, in all of the clauses, pick the one
+ * with the smallest estimated cost. Ties go to the start with the
+ * thinner incoming set.
+ */
+Handle InitiateSearchMixin::find_cheapest(const PatternTermSeq& clauses,
+                                          PatternTermPtr& starter_term,
+                                          PatternTermPtr& bestclause)
+{
+	// The search has to start at every one of the choices of a
+	// ChoiceLink, so there is nothing to pick; leave those to the
+	// legacy planner.
+	for (const PatternTermPtr& ptm: clauses)
+		if (ptm->hasChoice())
+			return find_thinnest(clauses, starter_term, bestclause);
+
+	double cheapest = DBL_MAX;
+	size_t thinnest = SIZE_MAX;
+	bestclause = PatternTerm::UNDEFINED;
+	Handle best_start(Handle::UNDEFINED);
+	starter_term = PatternTerm::UNDEFINED;
+	_start_choices.clear();
+
+	for (const PatternTermPtr& ptm: clauses)
+	{
+		// Cannot start with an evaluatable clause!
+		if (ptm->hasAnyEvaluatable() and not ptm->isIdentical()) continue;
+
+		std::vector<std::pair<Handle, PatternTermPtr>> starts;
+		const Handle& h = ptm->getHandle();
+		Type t = h->get_type();
+		if (_nameserver.isNode(t))
+		{
+			if (VARIABLE_NODE != t and GLOB_NODE != t and SIGN_NODE != t)
+				starts.emplace_back(h, ptm);
+		}
+		else
+			collect_starts(ptm, starts);
+
+		for (const auto& st : starts)
+		{
+			const PatternTermPtr& term = st.second;
+			double cost = estimate_cost(st.first, term, ptm);
+			size_t width = st.first->getIncomingSetSize();
+			if (cost < cheapest or (cost == cheapest and width < thinnest))
+			{
+				cheapest = cost;
+				thinnest = width;
+				bestclause = ptm;
+				best_start = st.first;
+				starter_term = (term == ptm) ? term : term->getParent();
+			}
+		}
+	}
+
+	return best_start;
+}
+
 /* ======================================================== */
 
 const PatternTermSeq& InitiateSearchMixin::get_clause_list(void)
@@ -345,7 +768,9 @@ bool InitiateSearchMixin::setup_neighbor_search(const PatternTermSeq& clauses)
 	// no constants in them at all.  In this case, the search is
 	// performed by looping over all links of the given types.
 	PatternTermPtr bestclause;
-	Handle best_start = find_thinnest(clauses, _starter_term, bestclause);
+	Handle best_start = (COST_PLANNER == _plan_with) ?
+		find_cheapest(clauses, _starter_term, bestclause) :
+		find_thinnest(clauses, _starter_term, bestclause);
 
 	// Cannot find a starting point! This can happen if:
 	// 1) all of the clauses contain nothing but variables,
@@ -361,6 +786,7 @@ bool InitiateSearchMixin::setup_neighbor_search(const PatternTermSeq& clauses)
 		Choice ch;
 		ch.clause = bestclause;
 		ch.start_term = _starter_term;
+		ch.start = best_start;
 
 		// This feels wonky. Is this correct?
 		if (_starter_term->getHandle()->is_link())
@@ -379,6 +805,7 @@ bool InitiateSearchMixin::setup_neighbor_search(const PatternTermSeq& clauses)
 	{
 		// TODO -- weed out duplicates!
 	}
+	_strategy = "neighbor";
 	return true;
 }
 
@@ -392,6 +819,7 @@ bool InitiateSearchMixin::choice_loop(PatternMatchCallback& pmc,
 		_root = ch.clause;
 		_starter_term = ch.start_term;
 		_search_set = ch.search_set;
+		_search_start = ch.start;
 
 		DO_LOG({LAZY_LOG_FINE << "Choice loop start term is:\n"
 		              << (_starter_term->to_short_string("       "));})
@@ -505,8 +933,26 @@ bool InitiateSearchMixin::perform_search(PatternMatchCallback& pmc)
 	_starter_term = PatternTerm::UNDEFINED;
 	_curr_clause = PatternTerm::UNDEFINED;
 	_search_set.clear();
+	_search_start = Handle::UNDEFINED;
 	_start_choices.clear();
 
+	_plan_with = _planner;
+	_fanouts.clear();
+	if (COST_PLANNER == _plan_with)
+	{
+		// Every clause that get_clause_list() may pick a start from:
+		// the mandatory ones, or else the optional (absent) ones.
+		// The always clauses are included as well; they are grounded
+		// the same way.
+		uint64_t changes = IncomingStats::all_changes(_as);
+		for (const PatternTermPtr& clause : _pattern->pmandatory)
+			gather_fanouts(clause, NOTYPE, changes);
+		for (const PatternTermPtr& clause : _pattern->absents)
+			gather_fanouts(clause, NOTYPE, changes);
+		for (const PatternTermPtr& clause : _pattern->always)
+			gather_fanouts(clause, NOTYPE, changes);
+	}
+
 	// Fallback to the legacy mode.
 	if (1 != _pattern->pmandatory.size())
 		return legacy_search(pmc);
@@ -533,6 +979,7 @@ return legacy_search(pmc);
 		_starter_term = PatternTerm::UNDEFINED;
 		_curr_clause = PatternTerm::UNDEFINED;
 		_search_set.clear();
+		_search_start = Handle::UNDEFINED;
 		_start_choices.clear();
 
 		found |= conjoin_search(pmc, {term});
@@ -583,7 +1030,15 @@ bool InitiateSearchMixin::legacy_search(PatternMatchCallback& pmc)
 	DO_LOG({logger().fine("Cannot use node-neighbor search, use no-var search");})
 	if (setup_no_search())
 	{
-		PatternMatchEngine pme(pmc);
+		QueryProfile* prof = QueryProfile::current();
+		if (prof)
+		{
+			_strategy = "no-search";
+			record_search(*prof);
+			if (prof->plan_only) return false;
+		}
+		PMCProfiler profiler(pmc, prof);
+		PatternMatchEngine pme(prof ? profiler : pmc);
 		pme.set_pattern(*_variables, *_pattern);
 		return pme.explore_constant_evaluatables(_pattern->pmandatory);
 	}
@@ -836,6 +1291,7 @@ bool InitiateSearchMixin::setup_deep_type_search(const PatternTermSeq& clauses)
 
 		// We only need enough startng points to get started;
 		// the matcher will crawl the rest of the graph.
+		_strategy = "deep-type";
 		if (0 < _search_set.size()) return true;
 	}
 
@@ -866,6 +1322,7 @@ bool InitiateSearchMixin::setup_deep_type_search(const PatternTermSeq& clauses)
 		_root = root;
 		_starter_term = term_of_handle(var, root);
 		_as->get_handles_by_type(_search_set, t);
+		_strategy = "deep-type";
 		if (0 < _search_set.size()) return true;
 	}
 
@@ -922,6 +1379,7 @@ bool InitiateSearchMixin::setup_link_type_search(const PatternTermSeq& clauses)
 	Type ptype = _starter_term->getHandle()->get_type();
 
 	_as->get_handles_by_type(_search_set, ptype);
+	_strategy = "link-type";
 	return true;
 }
 
@@ -1091,6 +1549,7 @@ bool InitiateSearchMixin::setup_variable_search(const PatternTermSeq& clauses)
 		for (Type ptype : ptypes)
 			_as->get_handles_by_type(_search_set, ptype);
 
+	_strategy = "variable";
 	return true;
 }
 
@@ -1123,12 +1582,15 @@ bool InitiateSearchMixin::search_loop(PatternMatchCallback& pmc,
                                       const std::string dbg_banner)
 {
 	// This is the main entry point into the CPU-cycle sucking part of
-	// the pattern search.  If `USE_THREADED_PATTERN_ENGINE` is defined,
-	// then it runs in parallel. It works, unit-tests pass. But ...
-	// But the overhead is so large, that, for small pattern matches,
-	// the setup of going parallel is far more expensive than the gain
-	// from parallelism. (RandomUTest runs 25x slower! GetStateUTest
-	// runs 33x slower!) So this code is currently disabled.
+	// the pattern search. If the calling thread asked for a parallel
+	// search, then the candidates are spread over a set of worker
+	// threads. But the overhead is large: each worker needs a thread,
+	// an engine, and its own copy of the clause-selection state. For
+	// small pattern matches, the setup of going parallel is far more
+	// expensive than the gain from parallelism. (With an earlier,
+	// OpenMP version, RandomUTest ran 25x slower! GetStateUTest ran
+	// 33x slower!) So the sequential loop is the default, and small
+	// search sets are always searched sequentially.
 	//
 	// If `_search_set` is large, or the if pattern is large/complex,
 	// then the extra cost might be worth it. However, this is NOT
@@ -1136,111 +1598,169 @@ bool InitiateSearchMixin::search_loop(PatternMatchCallback& pmc,
 	// See the benchmark `nano-en.scm` in the opencog/benchmark GitHub
 	// repo, for example.
 	//
-#ifndef USE_THREADED_PATTERN_ENGINE
-	// See explanation below for the `_recursing` flag.
-	_recursing = true;
-#endif
+	// Note also: for multi-component patterns, `PatternLink::satisfy()`
+	// calls this once for each component, one after the other, always
+	// from the calling thread. Searches started by the workers (e.g.
+	// when evaluating virtual clauses) are sequential, as the setting
+	// is thread-local. So worker pools are never nested.
+	//
+	// If the calling thread is profiling its queries, the plan is
+	// recorded first; a query that is only being explained stops
+	// right there.
+	QueryProfile* prof = QueryProfile::current();
+	size_t isrch = 0;
+	if (prof)
+	{
+		isrch = record_search(*prof);
+		if (prof->plan_only) return false;
+	}
+	auto start = std::chrono::steady_clock::now();
+	size_t explored = 0;
+	bool found = false;
 
-	if (_recursing)
+	static const size_t min_candidates_per_worker = 4;
+	size_t nworkers = std::min(_parallel,
+		_search_set.size() / min_candidates_per_worker);
+	if (1 < nworkers)
+		found = parallel_search_loop(pmc, nworkers, prof, explored);
+	else
 	{
 		// Plain-old, olde-fashioned sequential search loop.
-		// This works.
 #ifdef QDEBUG
-		size_t i = 0, hsz = _search_set.size();
+		size_t hsz = _search_set.size();
 #endif
 
-		PatternMatchEngine pme(pmc);
+		PMCProfiler profiler(pmc, prof);
+		PatternMatchEngine pme(prof ? profiler : pmc);
 		pme.set_pattern(*_variables, *_pattern);
 
-		while (0 < _issued_stack.size()) _issued_stack.pop();
-		_issued.clear();
-		_issued.insert(_root);
+		clause_state().reset(_root);
 		for (const Handle& h : _search_set)
 		{
+			check_cancel();
+			explored++;
 			DO_LOG({LAZY_LOG_FINE << dbg_banner
 			             << "\n       Loop candidate ("
-			             << ++i << "/" << hsz << "):\n"
+			             << explored << "/" << hsz << "):\n"
 			             << h->to_string("       ");})
-			bool found = pme.explore_neighborhood(_starter_term,
-			                                      h, _root);
-			if (found) return true;
+			found = pme.explore_neighborhood(_starter_term, h, _root);
+			if (found) break;
 		}
+	}
 
-		return false;
+	if (prof)
+	{
+		std::chrono::duration<double> secs =
+			std::chrono::steady_clock::now() - start;
+		QueryProfile::Search& srch = prof->searches[isrch];
+		srch.explored = explored;
+		srch.seconds = secs.count();
 	}
+	return found;
+}
 
-	// Note also: for multi-component patterns, this entire class
-	// is used recursively in multiple threads. This is because
-	// `PatternLink::satisfy()` is recursive, when there are multiple
-	// components. So: we start here, create multiple threads,
-	// and then pass ourselves into each thread. When there are
-	// components, this gets wrapped in PMCGroundings and then
-	// `PatternLink::satisfy()` is called .. once in each thread!
-	// Which causes a new start-point to be searched for, for each
-	// component which clobbers this structure against itself.  Fail.
-	// The `_recursing` flag prevents this double-threading.
-// #define PM_PARALLEL 1
-#ifdef PM_PARALLEL
-	// Parallel loop. This requires linking to -ltbb to work.
-	_recursing = true;
-
-	_issued_stack.clear();
-	_issued.clear();
-	_issued.insert(_root);
-
-	std::atomic<size_t> nfnd = 0;
-	std::for_each(
-		std::execution::par_unseq,
-		_search_set.begin(),
-		_search_set.end(),
-		[&](auto&& h)
-		{
-			PatternMatchEngine pme(pmc);
-			pme.set_pattern(*_variables, *_pattern);
+/// Add the search that was just set up to the profile.
+size_t InitiateSearchMixin::record_search(QueryProfile& prof) const
+{
+	QueryProfile::Search srch;
+	srch.strategy = _strategy;
+	if (_root) srch.clause = _root->getHandle();
+	if (_starter_term) srch.start_term = _starter_term->getHandle();
+	srch.start = _search_start;
+	srch.candidates = _search_set.size();
+	prof.searches.push_back(srch);
+	return prof.searches.size() - 1;
+}
 
-			if (pme.explore_neighborhood(_starter_term, h, _root)) nfnd++;
-		});
+/**
+ * Explore the candidates in `_search_set` with nworkers threads. Each
+ * worker runs its own PatternMatchEngine, and takes the next unexplored
+ * candidate until there are none left. The callbacks are shared; the
+ * ones that record groundings lock `DECLARE_PE_MUTEX`, and the ones
+ * that keep scratch state keep a copy per worker (see
+ * `in_search_worker()`). The search halts when a worker finds that it
+ * is done, when the search is cancelled, or when a worker throws; the
+ * exception is then re-thrown here.
+ */
+bool InitiateSearchMixin::parallel_search_loop(PatternMatchCallback& pmc,
+                                               size_t nworkers,
+                                               QueryProfile* prof,
+                                               size_t& explored)
+{
+	// The cancel flag is thread-local; hand it to the workers.
+	const std::atomic<bool>* cancel = _cancel_flag;
 
-	_recursing = false;
-	return 0 < nfnd;
+	size_t hsz = _search_set.size();
+	std::atomic<size_t> next(0);
+	std::atomic<bool> found(false);
+	std::atomic<bool> halt(false);
+	std::exception_ptr failure;
+	std::mutex failure_mtx;
+	std::mutex prof_mtx;
+
+	auto worker = [&](void)
+	{
+		_search_worker = this;
 
-#endif
+		// Each worker profiles into its own, merged in at the end.
+		QueryProfile wprof;
+		size_t wexplored = 0;
+		try
+		{
+			PMCProfiler profiler(pmc, &wprof);
+			PatternMatchEngine pme(prof ? profiler : pmc);
+			pme.set_pattern(*_variables, *_pattern);
+			clause_state().reset(_root);
 
-#ifdef USE_THREADED_PATTERN_ENGINE
-	#define OMP_PM_PARALLEL 1
-#endif
-#ifdef OMP_PM_PARALLEL
-	// Parallel loop. This requires OpenMP to work.
-	_recursing = true;
-	_issued_stack.clear();
-	_issued.clear();
-	_issued.insert(_root);
+			while (not halt.load(std::memory_order_relaxed))
+			{
+				if (cancel and cancel->load(std::memory_order_relaxed))
+					break;
 
-#ifdef QDEBUG
-	size_t i = 0;
-#endif
+				size_t j = next.fetch_add(1, std::memory_order_relaxed);
+				if (hsz <= j) break;
 
-	std::atomic<size_t> nfnd = 0;
-	size_t hsz = _search_set.size();
-	#pragma omp parallel for
-	for (size_t j=0; j<hsz; j++)
-	{
-		PatternMatchEngine pme(pmc);
-		pme.set_pattern(*_variables, *_pattern);
+				wexplored++;
+				if (pme.explore_neighborhood(_starter_term,
+				                             _search_set[j], _root))
+				{
+					found = true;
+					halt = true;
+				}
+			}
+		}
+		catch (...)
+		{
+			std::lock_guard<std::mutex> lck(failure_mtx);
+			if (not failure) failure = std::current_exception();
+			halt = true;
+		}
+		_search_worker = nullptr;
 
-		Handle h(_search_set[j]);
-		DO_LOG({LAZY_LOG_FINE << dbg_banner
-		             << "\n       Loop candidate ("
-		             << ++i << "/" << hsz << "):\n"
-		             << h->to_short_string("       ");})
+		std::lock_guard<std::mutex> lck(prof_mtx);
+		explored += wexplored;
+		if (prof) prof->merge(wprof);
+	};
 
-		if (pme.explore_neighborhood(_starter_term, h, _root)) nfnd++;
+	// The worker threads exit at the end of the search, and with
+	// them, their thread-local copies of the callback state.
+	std::vector<std::thread> workers;
+	try
+	{
+		for (size_t i = 0; i < nworkers; i++)
+			workers.emplace_back(worker);
 	}
-	_recursing = false;
-	return 0 < nfnd;
-#endif
+	catch (...)
+	{
+		halt = true;
+		for (std::thread& t : workers) t.join();
+		throw;
+	}
+	for (std::thread& t : workers) t.join();
 
-	return false;
+	if (failure) std::rethrow_exception(failure);
+	check_cancel();
+	return found;
 }
 
 /* ======================================================== */
@@ -25,6 +25,9 @@
 #ifndef _OPENCOG_INITIATE_SEARCH_H
 #define _OPENCOG_INITIATE_SEARCH_H
 
+#include <atomic>
+#include <map>
+
 #include <opencog/util/empty_string.h>
 #include <opencog/atoms/atom_types/types.h>
 #include <opencog/atoms/core/Quotation.h>
@@ -34,6 +37,7 @@
 namespace opencog {
 
 class AtomSpace;
+class QueryProfile;
 
 /**
  * Callback mixin class, used to provide a default atomspace search.
@@ -61,12 +65,67 @@ public:
 
 	std::string to_string(const std::string& indent=empty_string) const;
 
+	/**
+	 * Cooperative cancellation. A thread that is about to run a query
+	 * may install a flag; every search started on that thread checks
+	 * it before exploring each candidate start point, and throws once
+	 * the flag is set (from any thread). Pass nullptr to remove it.
+	 * Returns the previously installed flag, so that installs nest.
+	 */
+	static const std::atomic<bool>* set_cancel_flag(const std::atomic<bool>*);
+	static bool is_cancelled(void);
+
+	/**
+	 * Parallel search. A thread that is about to run a query may ask
+	 * for the candidate start points of its searches to be explored
+	 * by up to nthreads worker threads, each running its own
+	 * PatternMatchEngine. Zero or one means a sequential search, the
+	 * default. Like the cancel flag, this applies to the searches
+	 * started on the calling thread. Returns the previous setting, so
+	 * that settings nest.
+	 */
+	static size_t set_parallel(size_t nthreads);
+	static size_t get_parallel(void);
+
+	/**
+	 * Query planners. The legacy planner starts each search at the
+	 * constant with the smallest incoming set, and then grounds the
+	 * clause with the fewest ungrounded variables, reached from the
+	 * grounding with the smallest incoming set. The cost planner
+	 * estimates, for each possible start and each possible next
+	 * clause, how many candidate groundings it will have to try,
+	 * and picks the cheapest; see `estimate_cost()`. Both find the
+	 * same groundings. Like the cancel flag, this applies to the
+	 * searches started on the calling thread; the default is the
+	 * legacy planner. Returns the previous setting, so that settings
+	 * nest.
+	 */
+	enum SearchPlanner { LEGACY_PLANNER, COST_PLANNER };
+	static SearchPlanner set_planner(SearchPlanner);
+	static SearchPlanner get_planner(void);
+
 protected:
+	static thread_local const std::atomic<bool>* _cancel_flag;
+	static thread_local size_t _parallel;
+	static thread_local SearchPlanner _planner;
+	void check_cancel(void) const;
+
+	// The planner of the current search. The worker threads of a
+	// parallel search use it too, so it cannot be thread-local.
+	SearchPlanner _plan_with;
+
+	// For the cost planner: for each pair of (child, parent) link
+	// types in the pattern, the mean number of links of the parent
+	// type that hold a link of the child type, scaled up by how
+	// skewed the degrees of the child type are. Filled in before the
+	// search starts; only read during the search.
+	std::map<std::pair<Type, Type>, double> _fanouts;
+	void gather_fanouts(const PatternTermPtr&, Type, uint64_t);
+	double estimate_cost(const Handle&, const PatternTermPtr&,
+	                     const PatternTermPtr&) const;
 
 	NameServer& _nameserver;
 
-	bool _recursing;
-
 	PatternTermPtr _root;
 	PatternTermPtr _starter_term;
 	HandleSeq _search_set;
@@ -75,17 +134,28 @@ protected:
 	{
 		PatternTermPtr clause;
 		PatternTermPtr start_term;
+		Handle start;
 		HandleSeq search_set;
 	};
 	PatternTermPtr _curr_clause;
 	std::vector<Choice> _start_choices;
 
+	// The kind of search set up last, and where it starts, for the
+	// QueryProfile.
+	const char* _strategy;
+	Handle _search_start;
+	size_t record_search(QueryProfile&) const;
+
 	virtual Handle find_starter(const PatternTermPtr&,
 	                            size_t&, PatternTermPtr&, size_t&);
 	virtual Handle find_starter_recursive(const PatternTermPtr&,
 	                                      size_t&, PatternTermPtr&, size_t&);
 	virtual Handle find_thinnest(const PatternTermSeq&,
 	                             PatternTermPtr&, PatternTermPtr&);
+	virtual Handle find_cheapest(const PatternTermSeq&,
+	                             PatternTermPtr&, PatternTermPtr&);
+	void collect_starts(const PatternTermPtr&,
+	                    std::vector<std::pair<Handle, PatternTermPtr>>&);
 	virtual void find_rarest(const PatternTermPtr&, PatternTermPtr&,
 	                         size_t&, Quotation quotation=Quotation());
 
@@ -102,6 +172,8 @@ protected:
 	bool legacy_search(PatternMatchCallback&);
 	bool choice_loop(PatternMatchCallback&, const std::string);
 	bool search_loop(PatternMatchCallback&, const std::string);
+	bool parallel_search_loop(PatternMatchCallback&, size_t,
+	                          QueryProfile*, size_t&);
 
 	static PatternTermPtr term_of_handle(const Handle&, const PatternTermPtr&);
 	static PatternTermSeq term_choices_of_handle(const Handle&, const PatternTermPtr&);
@@ -109,14 +181,23 @@ protected:
 	// --------------------------------------------
 	// Methods and state that select the next clause to be grounded.
 	typedef std::set<PatternTermPtr> IssuedSet;
+	typedef std::vector<Choice> ChoiceList;
 
-	// Set of clauses for which a grounding is currently being attempted.
-	IssuedSet _issued;     // stacked on _issued_stack
-	std::stack<IssuedSet> _issued_stack;
+	struct ClauseState
+	{
+		// Set of clauses for which a grounding is currently being attempted.
+		IssuedSet issued;     // stacked on issued_stack
+		std::stack<IssuedSet> issued_stack;
 
-	typedef std::vector<Choice> ChoiceList;
-	ChoiceList _next_choices;
-	std::stack<ChoiceList> _choice_stack;
+		ChoiceList next_choices;
+		std::stack<ChoiceList> choice_stack;
+
+		void reset(const PatternTermPtr&);
+	};
+	ClauseState _clauses;
+
+	// The worker threads of a parallel search each have their own.
+	ClauseState& clause_state(void);
 
 	Handle get_glob_embedding(const GroundingMap&, const Handle&);
 	bool get_next_thinnest_clause(const GroundingMap&, bool, bool);
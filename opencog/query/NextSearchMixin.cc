@@ -21,6 +21,9 @@
  * 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
  */
 
+#include <algorithm>
+#include <cfloat>
+
 #include <opencog/util/oc_assert.h>
 #include <opencog/atomspace/AtomSpace.h>
 #include <opencog/atoms/core/FindUtils.h>
@@ -41,13 +44,15 @@ using namespace opencog;
 
 void InitiateSearchMixin::push(void)
 {
-	_issued_stack.push(_issued);
+	ClauseState& cs = clause_state();
+	cs.issued_stack.push(cs.issued);
 }
 
 void InitiateSearchMixin::pop(void)
 {
-	_issued = _issued_stack.top();
-	_issued_stack.pop();
+	ClauseState& cs = clause_state();
+	cs.issued = cs.issued_stack.top();
+	cs.issued_stack.pop();
 }
 
 /**
@@ -84,29 +89,31 @@ void InitiateSearchMixin::pop(void)
 bool InitiateSearchMixin::get_next_clause(PatternTermPtr& clause,
                                           PatternTermPtr& joint)
 {
-	if (0 == _next_choices.size())
+	ClauseState& cs = clause_state();
+	if (0 == cs.next_choices.size())
 	{
-		if (0 < _choice_stack.size())
+		if (0 < cs.choice_stack.size())
 		{
-			_next_choices = _choice_stack.top();
-			_choice_stack.pop();
+			cs.next_choices = cs.choice_stack.top();
+			cs.choice_stack.pop();
 		}
 		return false;
 	}
 
-	const Choice& ch(_next_choices.back());
+	const Choice& ch(cs.next_choices.back());
 	clause = ch.clause;
 	joint = ch.start_term;
-	_next_choices.pop_back();
+	cs.next_choices.pop_back();
 
-	_issued.insert(clause);
+	cs.issued.insert(clause);
 	return true;
 }
 
 void InitiateSearchMixin::next_connections(const GroundingMap& var_grounding)
 {
-	_choice_stack.push(_next_choices);
-	_next_choices.clear();
+	ClauseState& cs = clause_state();
+	cs.choice_stack.push(cs.next_choices);
+	cs.next_choices.clear();
 
 	// First, try to ground all the mandatory clauses, only.
 	// no virtuals, no black boxes, no absents.
@@ -132,7 +139,7 @@ void InitiateSearchMixin::next_connections(const GroundingMap& var_grounding)
 	// All variables must necessarily be grounded at this point.
 	for (const PatternTermPtr& root : _pattern->always)
 	{
-		if (_issued.end() != _issued.find(root)) continue;
+		if (cs.issued.end() != cs.issued.find(root)) continue;
 		for (const Handle &v : _variables->varset)
 		{
 			if (is_free_in_tree(root->getHandle(), v))
@@ -140,7 +147,7 @@ void InitiateSearchMixin::next_connections(const GroundingMap& var_grounding)
 				Choice ch;
 				ch.clause = root;
 				ch.start_term = term_of_handle(v, root);
-				_next_choices.emplace_back(ch);
+				cs.next_choices.emplace_back(ch);
 				return;
 			}
 		}
@@ -150,7 +157,7 @@ void InitiateSearchMixin::next_connections(const GroundingMap& var_grounding)
 	// Make sure all clauses have been grounded.
 	for (const PatternTermPtr& root : _pattern->pmandatory)
 	{
-		if (_issued.end() == _issued.find(root))
+		if (cs.issued.end() == cs.issued.find(root))
 			throw RuntimeException(TRACE_INFO,
 				"BUG! Still have ungrounded clauses!!");
 	}
@@ -204,6 +211,7 @@ unsigned int InitiateSearchMixin::thickness(const PatternTermPtr& clause,
 Handle InitiateSearchMixin::get_glob_embedding(const GroundingMap& var_grounding,
                                                const Handle& glob)
 {
+	ClauseState& cs = clause_state();
 	// If the glob is in only one clause, there is no connectivity map.
 	if (0 == _pattern->connectivity_map.count(glob)) return glob;
 
@@ -216,7 +224,7 @@ Handle InitiateSearchMixin::get_glob_embedding(const GroundingMap& var_grounding
 	auto clpr = clauses.first;
 	for (; clpr != clauses.second; clpr++)
 	{
-		if (_issued.end() == _issued.find(clpr->second)) break;
+		if (cs.issued.end() == cs.issued.find(clpr->second)) break;
 	}
 
 	// Glob is not in any ungrounded clauses.
@@ -258,6 +266,7 @@ bool InitiateSearchMixin::get_next_thinnest_clause(const GroundingMap& var_groun
                                                    bool search_eval,
                                                    bool search_absents)
 {
+	ClauseState& cs = clause_state();
 	// Make a list of the as-yet ungrounded variables.
 	HandleSet ungrounded_vars;
 
@@ -310,6 +319,46 @@ bool InitiateSearchMixin::get_next_thinnest_clause(const GroundingMap& var_groun
 	// with smallest size of its incoming set. If there are many such
 	// atoms we choose one from clauses with minimal number of ungrounded
 	// yet variables.
+	//
+	// The cost planner instead picks the joint and clause with the
+	// smallest estimated cost (see `estimate_cost()`), and only then
+	// the clause with the fewest ungrounded variables.
+	if (COST_PLANNER == _plan_with)
+	{
+		double cheapest = DBL_MAX;
+		for (const auto& tckvar : thick_vars)
+		{
+			const Handle& pursue = tckvar.second;
+			const Handle& gnd = var_grounding.find(pursue)->second;
+
+			const auto& root_list = _pattern->connectivity_map.equal_range(pursue);
+			for (auto it = root_list.first; it != root_list.second; it++)
+			{
+				const PatternTermPtr& root = it->second;
+				if ((cs.issued.end() != cs.issued.find(root))
+				     or (not search_eval and root->hasAnyEvaluatable())
+				     or (not search_absents and root->isAbsent()))
+					continue;
+
+				double cost = DBL_MAX;
+				for (const PatternTermPtr& stm :
+				     term_choices_of_handle(pursue, root))
+					cost = std::min(cost, estimate_cost(gnd, stm, root));
+
+				unsigned int root_thickness = thickness(root, ungrounded_vars);
+				if (cost < cheapest or
+				    (cost == cheapest and root_thickness < thinnest_clause))
+				{
+					cheapest = cost;
+					thinnest_clause = root_thickness;
+					unsolved_clause = root;
+					joint = pursue;
+					unsolved = true;
+				}
+			}
+		}
+	}
+	else
 	for (const auto& tckvar : thick_vars)
 	{
 		std::size_t pursue_thickness = tckvar.first;
@@ -321,7 +370,7 @@ bool InitiateSearchMixin::get_next_thinnest_clause(const GroundingMap& var_groun
 		for (auto it = root_list.first; it != root_list.second; it++)
 		{
 			const PatternTermPtr& root = it->second;
-			if ((_issued.end() == _issued.find(root))
+			if ((cs.issued.end() == cs.issued.find(root))
 			     and (search_eval or not root->hasAnyEvaluatable())
 			     and (search_absents or not root->isAbsent()))
 			{
@@ -346,7 +395,7 @@ bool InitiateSearchMixin::get_next_thinnest_clause(const GroundingMap& var_groun
 	{
 		for (const PatternTermPtr& root : _pattern->pmandatory)
 		{
-			if (_issued.end() != _issued.find(root)) continue;
+			if (cs.issued.end() != cs.issued.find(root)) continue;
 
 			// Clauses with no variables are (by definition)
 			// evaluatable. So we don't check if they're evaluatable.
@@ -356,7 +405,7 @@ bool InitiateSearchMixin::get_next_thinnest_clause(const GroundingMap& var_groun
 				Choice ch;
 				ch.clause = root;
 				ch.start_term = root;
-				_next_choices.emplace_back(ch);
+				cs.next_choices.emplace_back(ch);
 				return true;
 			}
 		}
@@ -373,11 +422,11 @@ bool InitiateSearchMixin::get_next_thinnest_clause(const GroundingMap& var_groun
 			Choice ch;
 			ch.clause = unsolved_clause;
 			ch.start_term = term_of_handle(joint, alt);
-			_next_choices.emplace_back(ch);
+			cs.next_choices.emplace_back(ch);
 		}
 
 		// Special case.
-		_issued.insert(unsolved_clause);
+		cs.issued.insert(unsolved_clause);
 	}
 	else
 	{
@@ -387,7 +436,7 @@ bool InitiateSearchMixin::get_next_thinnest_clause(const GroundingMap& var_groun
 			Choice ch;
 			ch.clause = unsolved_clause;
 			ch.start_term = stm;
-			_next_choices.emplace_back(ch);
+			cs.next_choices.emplace_back(ch);
 		}
 	}
 	return true;
@@ -25,6 +25,7 @@
 #define _OPENCOG_PATTERN_MATCH_CALLBACK_H
 
 #include <map>
+#include <mutex>
 #include <set>
 #include <opencog/atoms/base/Handle.h>
 #include <opencog/atoms/base/Link.h>
@@ -409,18 +410,43 @@ class PatternMatchCallback
 		 * You get to call this, to perform the actual search.
 		 */
 		virtual bool satisfy(const PatternLinkPtr&) = 0;
+
+		/**
+		 * Groundings that hold before the search starts. Every
+		 * candidate grounding starts out with these, so that the
+		 * variables in it can only be grounded by the given atoms.
+		 * This is how the parameters of a `PreparedQuery` are bound,
+		 * without having to create (and analyze) a new pattern for
+		 * each set of parameter values. Empty by default.
+		 */
+		virtual const GroundingMap& get_preset_groundings(void)
+		{ return _preset_groundings; }
+
+		void set_preset_groundings(const GroundingMap& gm)
+		{ _preset_groundings = gm; }
+
+		/**
+		 * True when called on one of the worker threads of a
+		 * parallel search run by this callback. Callbacks that keep
+		 * scratch state while exploring a candidate grounding use
+		 * this to keep a separate copy of that state per worker.
+		 * See `InitiateSearchMixin::set_parallel()`.
+		 */
+		bool in_search_worker(void) const
+		{ return this == _search_worker; }
+
+	protected:
+		static inline thread_local
+			const PatternMatchCallback* _search_worker = nullptr;
+
+		GroundingMap _preset_groundings;
 };
 
-// See notes in `InitiateSearchMixin.cc` for an explanation of the
-// threading code and its status.
-// #define USE_THREADED_PATTERN_ENGINE
-#ifdef USE_THREADED_PATTERN_ENGINE
-	#define DECLARE_PE_MUTEX std::mutex _mtx;
-	#define LOCK_PE_MUTEX std::lock_guard<std::mutex> lck(_mtx);
-#else
-	#define DECLARE_PE_MUTEX
-	#define LOCK_PE_MUTEX
-#endif // USE_THREADED_PATTERN_ENGINE
+// A parallel search calls the grounding callbacks from several
+// threads at once; callbacks that record groundings lock this.
+// See notes in `InitiateSearchMixin.cc` for the threading code.
+#define DECLARE_PE_MUTEX std::mutex _mtx;
+#define LOCK_PE_MUTEX std::lock_guard<std::mutex> lck(_mtx);
 
 } // namespace opencog
 
@@ -3222,8 +3222,9 @@ void PatternMatchEngine::record_grounding(const PatternTermPtr& ptm,
  */
 void PatternMatchEngine::clear_current_state(void)
 {
-	// Clear all state.
-	var_grounding.clear();
+	// Clear all state. The preset groundings (the parameters of a
+	// prepared query) hold for every candidate.
+	var_grounding = _pmc.get_preset_groundings();
 	clause_grounding.clear();
 
 	depth = 0;
@@ -0,0 +1,129 @@
+/*
+ * PreparedQuery.cc
+ *
+ * Copyright (C) 2026 by The OpenCog Foundation
+ * All Rights Reserved
+ *
+ * This program is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU Affero General Public License v3 as
+ * published by the Free Software Foundation and including the exceptions
+ * at http://opencog.org/wiki/Licenses
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Affero General Public License
+ * along with this program; if not, write to:
+ * Free Software Foundation, Inc.,
+ * 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+ */
+
+#include <algorithm>
+
+#include <opencog/util/exceptions.h>
+#include <opencog/util/oc_assert.h>
+#include <opencog/atoms/core/UnorderedLink.h>
+#include <opencog/atoms/execution/Instantiator.h>
+#include <opencog/atoms/value/UnisetValue.h>
+
+#include "Implicator.h"
+#include "Satisfier.h"
+#include "PreparedQuery.h"
+
+using namespace opencog;
+
+PreparedQuery::PreparedQuery(const Handle& query, const HandleSeq& params) :
+	_query(query)
+{
+	_plp = PatternLinkCast(query);
+	if (nullptr == _plp or
+	    not (query->is_type(QUERY_LINK) or query->is_type(MEET_LINK)))
+		throw InvalidParamException(TRACE_INFO,
+			"Expecting a QueryLink or a MeetLink, got %s",
+			query->to_short_string().c_str());
+
+	// Refer to the parameters by the variables of the query itself;
+	// those are the ones that the pattern analysis knows about.
+	const HandleSeq& varseq = _plp->get_variables().varseq;
+	for (const Handle& param : params)
+	{
+		auto var = std::find_if(varseq.begin(), varseq.end(),
+			[&](const Handle& v) { return *v == *param; });
+		if (varseq.end() == var or VARIABLE_NODE != param->get_type())
+			throw InvalidParamException(TRACE_INFO,
+				"Parameter %s is not a variable of the query",
+				param->to_short_string().c_str());
+
+		if (_params.end() != std::find(_params.begin(), _params.end(), *var))
+			throw InvalidParamException(TRACE_INFO,
+				"Parameter %s is given twice",
+				param->to_short_string().c_str());
+
+		_params.push_back(*var);
+	}
+}
+
+ValuePtr PreparedQuery::execute(AtomSpace* as, const HandleSeq& values) const
+{
+	if (values.size() != _params.size())
+		throw InvalidParamException(TRACE_INFO,
+			"Expecting %zu parameter values, got %zu",
+			_params.size(), values.size());
+
+	const Variables& vars = _plp->get_variables();
+	GroundingMap presets;
+	for (size_t i = 0; i < _params.size(); i++)
+	{
+		if (not vars.is_type(_params[i], values[i]))
+			throw InvalidParamException(TRACE_INFO,
+				"Value %s does not have the type of parameter %s",
+				values[i]->to_short_string().c_str(),
+				_params[i]->to_short_string().c_str());
+
+		// The search walks the incoming set of the values; it has
+		// to be the one in the atomspace being searched.
+		presets.insert({_params[i], as->add_atom(values[i])});
+	}
+
+	// A fresh place for the results; the one on the query atom
+	// belongs to executions of the query atom itself.
+	UnisetValuePtr svp(createUnisetValue());
+	svp->close();
+	ContainerValuePtr cvp(svp);
+
+	if (_query->is_type(QUERY_LINK))
+	{
+		Implicator impl(as, cvp);
+		impl.set_preset_groundings(presets);
+		impl.satisfy(_plp);
+
+		// Same special case for AbsentLinks as in QueryLink::do_execute()
+		const Pattern& pat = _plp->get_pattern();
+		if (0 == cvp->size() and 0 == pat.pmandatory.size()
+		    and 0 < pat.absents.size() and not impl.optionals_present())
+		{
+			Instantiator inst(as);
+			cvp->open();
+			for (const Handle& himp : _plp->get_implicand())
+				cvp->add(inst.instantiate(himp, presets, true));
+			cvp->close();
+		}
+		return cvp;
+	}
+
+	SatisfyingSet sater(as, cvp);
+	sater.set_preset_groundings(presets);
+	sater.satisfy(_plp);
+	OC_ASSERT(cvp->is_closed(), "Unexpected queue state!");
+
+	if (not _query->is_type(GET_LINK))
+		return cvp;
+
+	// Same as GetLink::execute()
+	Handle satset(createUnorderedLink(cvp->to_handle_set(), SET_LINK));
+	return as->add_atom(satset);
+}
+
+/* ===================== END OF FILE ===================== */
@@ -0,0 +1,83 @@
+/*
+ * PreparedQuery.h
+ *
+ * Copyright (C) 2026 by The OpenCog Foundation
+ * All Rights Reserved
+ *
+ * This program is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU Affero General Public License v3 as
+ * published by the Free Software Foundation and including the exceptions
+ * at http://opencog.org/wiki/Licenses
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Affero General Public License
+ * along with this program; if not, write to:
+ * Free Software Foundation, Inc.,
+ * 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+ */
+
+#ifndef _OPENCOG_PREPARED_QUERY_H
+#define _OPENCOG_PREPARED_QUERY_H
+
+#include <opencog/atoms/base/Handle.h>
+#include <opencog/atoms/pattern/PatternLink.h>
+#include <opencog/atomspace/AtomSpace.h>
+
+namespace opencog {
+
+/**
+ * A query that is run over and over, with different values for some
+ * of its variables, the "parameters".
+ *
+ * Every distinct query atom is analyzed when it is created: its
+ * clauses, variables, connected components and term trees are worked
+ * out by PatternLink. Plugging constants into a query shape thus means
+ * a new atom, and a new analysis, for every set of constants. Instead,
+ * a PreparedQuery holds on to the analysis of a query in which the
+ * parameters are variables; executing it grounds the parameters to the
+ * given values up front (see `PatternMatchCallback::get_preset_groundings`)
+ * and then runs the search as usual. The search starts at a parameter
+ * value, if that is the thinnest place to start.
+ *
+ * The query can be a QueryLink (or BindLink), or a MeetLink (or
+ * GetLink). The results are the same as for executing the query with
+ * the parameters replaced by their values; in particular, the
+ * parameters are not part of the groundings reported by a MeetLink.
+ *
+ * A PreparedQuery is not modified by executing it; it can be executed
+ * from several threads at once.
+ */
+class PreparedQuery
+{
+protected:
+	Handle _query;
+	PatternLinkPtr _plp;
+	HandleSeq _params;
+
+public:
+	/// The parameters must be variables declared by the query.
+	PreparedQuery(const Handle& query, const HandleSeq& params);
+
+	const Handle& get_query(void) const { return _query; }
+	const HandleSeq& get_parameters(void) const { return _params; }
+
+	/// Run the query in the given atomspace, with the parameters
+	/// grounded by the values, in the same order. Returns what
+	/// executing the query would return: a SetLink for a GetLink,
+	/// else a container holding the results.
+	ValuePtr execute(AtomSpace*, const HandleSeq& values) const;
+};
+
+typedef std::shared_ptr<PreparedQuery> PreparedQueryPtr;
+
+static inline PreparedQueryPtr createPreparedQuery(const Handle& query,
+                                                   const HandleSeq& params)
+	{ return std::make_shared<PreparedQuery>(query, params); }
+
+} // namespace opencog
+
+#endif // _OPENCOG_PREPARED_QUERY_H
@@ -0,0 +1,249 @@
+/*
+ * QueryProfile.cc
+ *
+ * Copyright (C) 2026 by The OpenCog Foundation
+ * All Rights Reserved
+ *
+ * This program is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU Affero General Public License v3 as
+ * published by the Free Software Foundation and including the exceptions
+ * at http://opencog.org/wiki/Licenses
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Affero General Public License
+ * along with this program; if not, write to:
+ * Free Software Foundation, Inc.,
+ * 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+ */
+
+#include <chrono>
+#include <sstream>
+
+#include <opencog/util/exceptions.h>
+#include <opencog/atoms/execution/Instantiator.h>
+
+#include "InitiateSearchMixin.h"
+#include "QueryProfile.h"
+#include "SatisfyMixin.h"
+#include "TermMatchMixin.h"
+
+using namespace opencog;
+
+/* ======================================================== */
+
+const char* QueryProfile::callback_name(size_t cb)
+{
+	static const char* names[NUM_CALLBACKS] = {
+		"node_match",
+		"variable_match",
+		"scope_match",
+		"link_match",
+		"post_link_match",
+		"fuzzy_match",
+		"clause_match",
+		"optional_clause_match",
+		"always_clause_match",
+		"evaluate_sentence",
+		"propose_grounding",
+	};
+	if (NUM_CALLBACKS <= cb)
+		throw RuntimeException(TRACE_INFO, "No such callback: %zu", cb);
+	return names[cb];
+}
+
+void QueryProfile::Counter::merge(const Counter& other)
+{
+	calls += other.calls;
+	accepted += other.accepted;
+	seconds += other.seconds;
+}
+
+void QueryProfile::merge(const QueryProfile& other)
+{
+	searches.insert(searches.end(),
+	                other.searches.begin(), other.searches.end());
+	for (size_t i = 0; i < NUM_CALLBACKS; i++)
+		callbacks[i].merge(other.callbacks[i]);
+	for (const auto& pr : other.clauses)
+		clauses[pr.first].merge(pr.second);
+	for (const auto& pr : other.evaluations)
+		evaluations[pr.first].merge(pr.second);
+}
+
+/* ======================================================== */
+
+thread_local QueryProfile* QueryProfile::_current = nullptr;
+
+QueryProfile* QueryProfile::set_current(QueryProfile* prof)
+{
+	QueryProfile* prev = _current;
+	_current = prof;
+	return prev;
+}
+
+QueryProfile* QueryProfile::current(void)
+{
+	return _current;
+}
+
+bool QueryProfile::evaluate(PatternMatchCallback& cb, const Handle& eval,
+                            const GroundingMap& gnds)
+{
+	// Whatever the evaluation runs is not part of this query.
+	QueryProfile* prev = set_current(nullptr);
+	auto start = std::chrono::steady_clock::now();
+	bool ok;
+	try
+	{
+		ok = cb.evaluate_sentence(eval, gnds);
+	}
+	catch (...)
+	{
+		set_current(prev);
+		throw;
+	}
+	std::chrono::duration<double> secs =
+		std::chrono::steady_clock::now() - start;
+	set_current(prev);
+
+	callbacks[EVALUATE_SENTENCE].add(ok, secs.count());
+	evaluations[eval].add(ok, secs.count());
+	return ok;
+}
+
+/* ======================================================== */
+
+std::string QueryProfile::to_string(const std::string& indent) const
+{
+	std::stringstream ss;
+	std::string indent_p = indent + oc_to_string_indent;
+	std::string indent_pp = indent_p + oc_to_string_indent;
+
+	if (not plan_only)
+		ss << indent << "seconds = " << seconds << std::endl;
+
+	size_t i = 0;
+	for (const Search& srch : searches)
+	{
+		ss << indent << "search[" << i++ << "]: "
+		   << srch.strategy << std::endl;
+		ss << indent_p << "candidates = " << srch.candidates << std::endl;
+		if (not plan_only)
+			ss << indent_p << "explored = " << srch.explored
+			   << ", seconds = " << srch.seconds << std::endl;
+		if (srch.clause)
+			ss << indent_p << "clause:" << std::endl
+			   << srch.clause->to_short_string(indent_pp) << std::endl;
+		if (srch.start_term)
+			ss << indent_p << "start_term:" << std::endl
+			   << srch.start_term->to_short_string(indent_pp) << std::endl;
+		if (srch.start)
+			ss << indent_p << "start:" << std::endl
+			   << srch.start->to_short_string(indent_pp) << std::endl;
+	}
+	if (plan_only) return ss.str();
+
+	ss << indent << "callbacks:" << std::endl;
+	for (size_t j = 0; j < NUM_CALLBACKS; j++)
+	{
+		if (0 == callbacks[j].calls) continue;
+		ss << indent_p << callback_name(j)
+		   << ": calls = " << callbacks[j].calls
+		   << ", accepted = " << callbacks[j].accepted
+		   << ", seconds = " << callbacks[j].seconds << std::endl;
+	}
+	for (const auto& pr : clauses)
+		ss << indent << "clause: calls = " << pr.second.calls
+		   << ", accepted = " << pr.second.accepted << std::endl
+		   << pr.first->to_short_string(indent_p) << std::endl;
+	for (const auto& pr : evaluations)
+		ss << indent << "evaluation: calls = " << pr.second.calls
+		   << ", true = " << pr.second.accepted
+		   << ", seconds = " << pr.second.seconds << std::endl
+		   << pr.first->to_short_string(indent_p) << std::endl;
+
+	return ss.str();
+}
+
+std::string opencog::oc_to_string(const QueryProfile& prof,
+                                  const std::string& indent)
+{
+	return prof.to_string(indent);
+}
+
+/* ======================================================== */
+
+/// Callback for explain_query(). The searches stop after planning,
+/// so nothing is ever grounded.
+class Planner :
+	public InitiateSearchMixin,
+	public TermMatchMixin,
+	public SatisfyMixin
+{
+	public:
+		Planner(AtomSpace* as) :
+			InitiateSearchMixin(as),
+			TermMatchMixin(as) {}
+
+		virtual bool propose_grounding(const GroundingMap&,
+		                               const GroundingMap&)
+		{ return false; }
+};
+
+QueryProfile opencog::explain_query(AtomSpace* as, const Handle& query)
+{
+	PatternLinkPtr plp(PatternLinkCast(query));
+	if (nullptr == plp)
+		throw InvalidParamException(TRACE_INFO,
+			"Expecting a query (a PatternLink), got %s",
+			query->to_short_string().c_str());
+
+	QueryProfile prof;
+	prof.plan_only = true;
+
+	QueryProfile* prev = QueryProfile::set_current(&prof);
+	try
+	{
+		Planner planner(as);
+		planner.satisfy(plp);
+	}
+	catch (...)
+	{
+		QueryProfile::set_current(prev);
+		throw;
+	}
+	QueryProfile::set_current(prev);
+	return prof;
+}
+
+ValuePtr opencog::profile_query(AtomSpace* as, const Handle& query,
+                                QueryProfile& prof)
+{
+	QueryProfile* prev = QueryProfile::set_current(&prof);
+	auto start = std::chrono::steady_clock::now();
+	ValuePtr vp;
+	try
+	{
+		Instantiator inst(as);
+		vp = inst.execute(query);
+	}
+	catch (...)
+	{
+		QueryProfile::set_current(prev);
+		throw;
+	}
+	std::chrono::duration<double> secs =
+		std::chrono::steady_clock::now() - start;
+	QueryProfile::set_current(prev);
+
+	prof.seconds = secs.count();
+	if (vp and vp->is_atom())
+		return as->add_atom(HandleCast(vp));
+	return vp;
+}
+
+/* ===================== END OF FILE ===================== */
@@ -0,0 +1,147 @@
+/*
+ * QueryProfile.h
+ *
+ * Copyright (C) 2026 by The OpenCog Foundation
+ * All Rights Reserved
+ *
+ * This program is free software; you can redistribute it and/or modify
+ * it under the terms of the GNU Affero General Public License v3 as
+ * published by the Free Software Foundation and including the exceptions
+ * at http://opencog.org/wiki/Licenses
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU Affero General Public License
+ * along with this program; if not, write to:
+ * Free Software Foundation, Inc.,
+ * 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+ */
+
+#ifndef _OPENCOG_QUERY_PROFILE_H
+#define _OPENCOG_QUERY_PROFILE_H
+
+#include <map>
+#include <string>
+#include <vector>
+
+#include <opencog/util/empty_string.h>
+#include <opencog/atoms/base/Handle.h>
+#include <opencog/atomspace/AtomSpace.h>
+#include <opencog/query/PatternMatchCallback.h>
+
+namespace opencog {
+
+/**
+ * What the pattern searches of a query did: the search plans, that
+ * is, where each search started and how many candidates it had, and
+ * how often each of the callbacks was called, and how long it took.
+ *
+ * A thread that is about to run a query installs a profile with
+ * `set_current()`; every search started on that thread records into
+ * it, until it is removed again. This works just like the cancel
+ * flag of `InitiateSearchMixin::set_cancel_flag()`. The searches run
+ * by the evaluatable terms of a query (e.g. by a GroundedPredicateNode
+ * running a query of its own) are not recorded.
+ *
+ * If `plan_only` is set, the searches stop after planning, without
+ * exploring any candidates; this is how `explain_query()` works.
+ */
+class QueryProfile
+{
+public:
+	/// The kinds of callbacks that are counted.
+	enum Callback
+	{
+		NODE_MATCH,
+		VARIABLE_MATCH,
+		SCOPE_MATCH,
+		LINK_MATCH,
+		POST_LINK_MATCH,
+		FUZZY_MATCH,
+		CLAUSE_MATCH,
+		OPTIONAL_CLAUSE_MATCH,
+		ALWAYS_CLAUSE_MATCH,
+		EVALUATE_SENTENCE,
+		PROPOSE_GROUNDING,
+		NUM_CALLBACKS
+	};
+	static const char* callback_name(size_t);
+
+	struct Counter
+	{
+		size_t calls = 0;
+		size_t accepted = 0;   ///< Calls that returned true.
+		double seconds = 0.0;
+
+		void add(bool ok, double secs)
+		{ calls++; if (ok) accepted++; seconds += secs; }
+		void merge(const Counter&);
+	};
+
+	/// The plan of one search, and what came of it.
+	struct Search
+	{
+		/// One of "neighbor", "no-search", "deep-type", "link-type"
+		/// or "variable"; see `InitiateSearchMixin::legacy_search()`.
+		std::string strategy;
+		Handle clause;        ///< The clause the search starts in.
+		Handle start_term;    ///< The term in it that is grounded first.
+		Handle start;         ///< For "neighbor", the thinnest constant.
+		size_t candidates = 0;
+		size_t explored = 0;
+		double seconds = 0.0;
+	};
+
+	bool plan_only = false;
+
+	std::vector<Search> searches;
+	Counter callbacks[NUM_CALLBACKS];
+
+	/// Per clause, the calls to the clause_match callbacks.
+	std::map<Handle, Counter> clauses;
+
+	/// Per evaluatable term, the calls to evaluate_sentence(); the
+	/// accepted calls are those that evaluated to true.
+	std::map<Handle, Counter> evaluations;
+
+	/// Wall-clock time of the whole query; set by `profile_query()`.
+	double seconds = 0.0;
+
+	void merge(const QueryProfile&);
+
+	/// Install the profile for the searches started on the calling
+	/// thread; nullptr removes it. Returns the previous one, so that
+	/// installs nest.
+	static QueryProfile* set_current(QueryProfile*);
+	static QueryProfile* current(void);
+
+	/// Call `cb.evaluate_sentence()`, recording it. The searches
+	/// that the evaluation runs are not recorded.
+	bool evaluate(PatternMatchCallback& cb, const Handle& eval,
+	              const GroundingMap& gnds);
+
+	std::string to_string(const std::string& indent=empty_string) const;
+
+private:
+	static thread_local QueryProfile* _current;
+};
+
+/// The search plans for the query (a PatternLink), found without
+/// running the searches.
+QueryProfile explain_query(AtomSpace*, const Handle& query);
+
+/// Execute the query, recording what its searches did in the profile.
+/// The query result cache (`AtomSpace::set_query_cache()`) is not used.
+ValuePtr profile_query(AtomSpace*, const Handle& query, QueryProfile&);
+
+// Primarily for gdb debugging, see
+// https://wiki.opencog.org/w/Development_standards#Pretty_Print_OpenCog_Objects
+std::string oc_to_string(const QueryProfile& prof,
+                         const std::string& indent=empty_string);
+
+} // namespace opencog
+
+#endif // _OPENCOG_QUERY_PROFILE_H
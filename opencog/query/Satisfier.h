@@ -120,7 +120,13 @@ class SatisfyingSet :
 		virtual void set_pattern(const Variables& vars,
 		                         const Pattern& pat)
 		{
-			_varseq = vars.varseq;
+			// Variables grounded up front (the parameters of a
+			// prepared query) are not part of the results.
+			const GroundingMap& presets = get_preset_groundings();
+			_varseq.clear();
+			for (const Handle& var : vars.varseq)
+				if (presets.end() == presets.find(var))
+					_varseq.push_back(var);
 			ContinuationMixin::set_pattern(vars, pat);
 			setup_marginals();
 		}
@@ -28,6 +28,7 @@
 
 #include <opencog/query/SatisfyMixin.h>
 #include <opencog/query/PatternMatchEngine.h>
+#include <opencog/query/QueryProfile.h>
 #include <opencog/query/TermMatchMixin.h>
 
 using namespace opencog;
@@ -113,6 +114,10 @@ class PMCGroundings : public SatisfyMixin
 		{
 			_cb.set_pattern(vars, pat);
 		}
+		const GroundingMap& get_preset_groundings(void)
+		{
+			return _cb.get_preset_groundings();
+		}
 
 		bool start_search(void)
 		{
@@ -240,7 +245,9 @@ bool SatisfyMixin::cartesian_product(
 			// in the Arg atoms. So, we ground the args, and pass that
 			// to the callback.
 
-			bool match = evaluate_sentence(virt, var_gnds);
+			QueryProfile* prof = QueryProfile::current();
+			bool match = prof ? prof->evaluate(*this, virt, var_gnds)
+			                  : evaluate_sentence(virt, var_gnds);
 
 			if (not match) return false;
 		}
@@ -452,6 +459,7 @@ bool SatisfyMixin::satisfy(const PatternLinkPtr& form)
 	GroundingMapSeqSeq comp_term_gnds;
 	GroundingMapSeqSeq comp_var_gnds;
 	const HandleSeq& comp_patterns = jit->get_component_patterns();
+	QueryProfile* prof = QueryProfile::current();
 
 	for (size_t i = 0; i < num_comps; i++)
 	{
@@ -470,6 +478,10 @@ bool SatisfyMixin::satisfy(const PatternLinkPtr& form)
 		PMCGroundings gcb(*this);
 		gcb.satisfy(clp);
 
+		// When only planning the searches (see QueryProfile), there
+		// are no groundings; plan all of the components anyway.
+		if (prof and prof->plan_only) continue;
+
 		// Special handling for disconnected pure absents --
 		// Returns false to end the search if this disconnected
 		// pure absent is found.
@@ -497,6 +509,7 @@ bool SatisfyMixin::satisfy(const PatternLinkPtr& form)
 	// The pattern was clobbered by the individual component searches.
 	// We need to reset it.
 	set_pattern(vars, pat);
+	if (prof and prof->plan_only) return false;
 
 	// ---------------------------------------------------
 	// OK we've grounded all the components.
@@ -72,7 +72,7 @@ Set set_intersection(const Set& s1, const Set& s2)
 TermMatchMixin::TermMatchMixin(AtomSpace* as) :
 	_nameserver(nameserver())
 {
-	_temp_aspace = grab_transient_atomspace(as);
+	_scratch.temp_aspace = grab_transient_atomspace(as);
 
 	_connectives.insert(SEQUENTIAL_AND_LINK);
 	_connectives.insert(SEQUENTIAL_OR_LINK);
@@ -81,18 +81,25 @@ TermMatchMixin::TermMatchMixin(AtomSpace* as) :
 	_connectives.insert(NOT_LINK);
 
 	_as = as;
-	_pat_bound_vars = nullptr;
-	_gnd_bound_vars = nullptr;
 }
 
-TermMatchMixin::~TermMatchMixin()
+TermMatchMixin::Scratch::~Scratch()
 {
 	// If we have a transient atomspace, release it.
-	if (_temp_aspace)
-	{
-		release_transient_atomspace(_temp_aspace);
-		_temp_aspace = nullptr;
-	}
+	if (temp_aspace)
+		release_transient_atomspace(temp_aspace);
+}
+
+TermMatchMixin::Scratch& TermMatchMixin::scratch(void)
+{
+	if (not in_search_worker()) return _scratch;
+
+	// The workers exit at the end of the search, and release their
+	// transient atomspace then.
+	static thread_local Scratch worker_scratch;
+	if (nullptr == worker_scratch.temp_aspace)
+		worker_scratch.temp_aspace = grab_transient_atomspace(_as);
+	return worker_scratch;
 }
 
 /* ======================================================== */
@@ -140,12 +147,13 @@ bool TermMatchMixin::variable_match(const Handle& npat_h,
 bool TermMatchMixin::scope_match(const Handle& npat_h,
                                  const Handle& nsoln_h)
 {
+	Scratch& sc = scratch();
 	// If there are scoped vars, then accept anything that is
 	// alpha-equivalent. (i.e. equivalent after alpha-conversion)
-	if (_pat_bound_vars and _pat_bound_vars->varset_contains(npat_h))
+	if (sc.pat_bound_vars and sc.pat_bound_vars->varset_contains(npat_h))
 	{
-		bool aok = _pat_bound_vars->is_alpha_convertible(npat_h,
-		                  nsoln_h, *_gnd_bound_vars);
+		bool aok = sc.pat_bound_vars->is_alpha_convertible(npat_h,
+		                  nsoln_h, *sc.gnd_bound_vars);
 		return aok;
 	}
 
@@ -198,24 +206,25 @@ bool TermMatchMixin::link_match(const PatternTermPtr& ptm,
 		// scoped links. The correct fix would be to push these onto a
 		// stack, and then alter scope_match() to walk the stack,
 		// verifying alpha-convertability.
-		OC_ASSERT(nullptr == _pat_bound_vars,
+		Scratch& sc = scratch();
+		OC_ASSERT(nullptr == sc.pat_bound_vars,
 			"Not implemented! Need to implement a stack, here.");
-		_pat_bound_vars = & ScopeLinkCast(lpat)->get_variables();
-		_gnd_bound_vars = & ScopeLinkCast(lsoln)->get_variables();
+		sc.pat_bound_vars = & ScopeLinkCast(lpat)->get_variables();
+		sc.gnd_bound_vars = & ScopeLinkCast(lsoln)->get_variables();
 
 		// This is interesting: the ground term need only satisfy
 		// the pattern typing requirements.  We do not ask for equality:
-		//     if (not _pat_bound_vars->is_equal(*_gnd_bound_vars))
+		//     if (not sc.pat_bound_vars->is_equal(*sc.gnd_bound_vars))
 		// because that prevents searches for narrowly-typed grounds
 		// (as is done in the ForwardChainerUTest, see bug #934)
 		// Alternately, a single variable can match an entire
 		// VariableList (per bug #2070).
-		if (not (*_pat_bound_vars == *_gnd_bound_vars)
-		      and not _pat_bound_vars->is_type(VARIABLE_LIST)
-		      and not _pat_bound_vars->is_type(_gnd_bound_vars->varseq))
+		if (not (*sc.pat_bound_vars == *sc.gnd_bound_vars)
+		      and not sc.pat_bound_vars->is_type(VARIABLE_LIST)
+		      and not sc.pat_bound_vars->is_type(sc.gnd_bound_vars->varseq))
 		{
-			_pat_bound_vars = nullptr;
-			_gnd_bound_vars = nullptr;
+			sc.pat_bound_vars = nullptr;
+			sc.gnd_bound_vars = nullptr;
 			return false;
 		}
 		return true;
@@ -228,11 +237,12 @@ bool TermMatchMixin::link_match(const PatternTermPtr& ptm,
 bool TermMatchMixin::post_link_match(const Handle& lpat,
                                      const Handle& lgnd)
 {
+	Scratch& sc = scratch();
 	Type pattype = lpat->get_type();
-	if (_pat_bound_vars and _nameserver.isA(pattype, SCOPE_LINK))
+	if (sc.pat_bound_vars and _nameserver.isA(pattype, SCOPE_LINK))
 	{
-		_pat_bound_vars = nullptr;
-		_gnd_bound_vars = nullptr;
+		sc.pat_bound_vars = nullptr;
+		sc.gnd_bound_vars = nullptr;
 	}
 
 	// The StateLink has a single, unique closed-term value (or possibly
@@ -251,11 +261,12 @@ bool TermMatchMixin::post_link_match(const Handle& lpat,
 void TermMatchMixin::post_link_mismatch(const Handle& lpat,
                                         const Handle& lgnd)
 {
+	Scratch& sc = scratch();
 	Type pattype = lpat->get_type();
-	if (_pat_bound_vars and _nameserver.isA(pattype, SCOPE_LINK))
+	if (sc.pat_bound_vars and _nameserver.isA(pattype, SCOPE_LINK))
 	{
-		_pat_bound_vars = nullptr;
-		_gnd_bound_vars = nullptr;
+		sc.pat_bound_vars = nullptr;
+		sc.gnd_bound_vars = nullptr;
 	}
 }
 
@@ -417,8 +428,9 @@ bool TermMatchMixin::clause_match(const Handle& ptrn,
 		// which seems reasonable, except that everything else in the
 		// default callback ignores the TV on EvaluationLinks. So this
 		// is kind-of schizophrenic here.  Not sure what else to do.
-		_temp_aspace->clear();
-		bool crispy = EvaluationLink::crisp_eval_scratch(_as, grnd, _temp_aspace);
+		AtomSpace* tas = scratch().temp_aspace;
+		tas->clear();
+		bool crispy = EvaluationLink::crisp_eval_scratch(_as, grnd, tas);
 
 		DO_LOG({LAZY_LOG_FINE << "Clause_match evaluation yielded: "
 		                      << crispy << std::endl;})
@@ -576,10 +588,11 @@ bool TermMatchMixin::eval_term(const Handle& virt,
 		return crisp_truth_from_tv(tvp);
 	}
 
-	_temp_aspace->clear();
+	AtomSpace* tas = scratch().temp_aspace;
+	tas->clear();
 	try
 	{
-		bool crispy = EvaluationLink::crisp_eval_scratch(_as, gvirt, _temp_aspace, true);
+		bool crispy = EvaluationLink::crisp_eval_scratch(_as, gvirt, tas, true);
 		DO_LOG({LAZY_LOG_FINE << "Eval_term evaluation yielded crisp-tv="
 		                      << crispy << std::endl;})
 		return crispy;
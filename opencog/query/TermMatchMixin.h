@@ -25,6 +25,8 @@
 #ifndef _OPENCOG_TERM_MATCH_MIXIN_H
 #define _OPENCOG_TERM_MATCH_MIXIN_H
 
+#include <atomic>
+
 #include <opencog/atoms/atom_types/types.h>
 #include <opencog/atoms/core/Quotation.h>
 #include <opencog/atomspace/AtomSpace.h>
@@ -54,7 +56,6 @@ class TermMatchMixin : public virtual PatternMatchCallback
 {
 	public:
 		TermMatchMixin(AtomSpace*);
-		~TermMatchMixin();
 
 		virtual bool node_match(const Handle&, const Handle&);
 		virtual bool variable_match(const Handle&, const Handle&);
@@ -108,21 +109,33 @@ class TermMatchMixin : public virtual PatternMatchCallback
 		                    const GroundingMap&, const HandleSet&,
 		                    Quotation quotation=Quotation());
 
-		// Variables that should be ignored, because they are bound
-		// (scoped) in the current context (i.e. appear in a ScopeLink
-		// that is being matched.)
-		const Variables* _pat_bound_vars;
-		const Variables* _gnd_bound_vars;
-
-		// Temp atomspace used for test-groundings of virtual links.
-		AtomSpace* _temp_aspace;
+		// Scratch state, used while exploring a candidate grounding.
+		// The worker threads of a parallel search each have their own.
+		struct Scratch
+		{
+			// Variables that should be ignored, because they are bound
+			// (scoped) in the current context (i.e. appear in a ScopeLink
+			// that is being matched.)
+			const Variables* pat_bound_vars = nullptr;
+			const Variables* gnd_bound_vars = nullptr;
+
+			// Temp atomspace used for test-groundings of virtual links.
+			AtomSpace* temp_aspace = nullptr;
+
+			Scratch(void) = default;
+			Scratch(const Scratch&) = delete;
+			Scratch& operator=(const Scratch&) = delete;
+			~Scratch();
+		};
+		Scratch _scratch;
+		Scratch& scratch(void);
 
 		// Crisp-logic evaluation of evaluatable terms
 		TypeSet _connectives;
 		bool eval_term(const Handle& pat, const GroundingMap& gnds);
 		bool eval_sentence(const Handle& pat, const GroundingMap& gnds);
 
-		bool _optionals_present = false;
+		std::atomic<bool> _optionals_present{false};
 		AtomSpace* _as;
 };
 
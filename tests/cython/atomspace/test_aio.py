@@ -0,0 +1,94 @@
+import unittest
+import asyncio
+import threading
+
+from opencog.atomspace import AtomSpace, CancelToken
+from opencog.type_constructors import *
+from opencog.utilities import initialize_opencog, finalize_opencog
+from opencog import aio
+
+import __main__
+
+entered = threading.Event()
+release = threading.Event()
+calls = []
+
+def block_search(atom):
+    calls.append(atom)
+    entered.set()
+    release.wait(5)
+    return TruthValue(1, 1)
+
+def stop_search(atom):
+    calls.append(atom)
+    __main__.active_token.cancel()
+    return TruthValue(1, 1)
+
+
+class AioTest(unittest.TestCase):
+
+    def setUp(self):
+        self.space = AtomSpace()
+        initialize_opencog(self.space)
+        for i in range(10):
+            InheritanceLink(ConceptNode("item" + str(i)), ConceptNode("thing"))
+        # Other test modules bind the same names in __main__.
+        __main__.block_search = block_search
+        __main__.stop_search = stop_search
+        entered.clear()
+        release.clear()
+        del calls[:]
+
+    def tearDown(self):
+        aio.shutdown()
+        finalize_opencog()
+        del self.space
+
+    def query(self, pred):
+        return GetLink(
+            TypedVariableLink(VariableNode("X"), TypeNode("ConceptNode")),
+            AndLink(
+                PresentLink(InheritanceLink(VariableNode("X"),
+                                            ConceptNode("thing"))),
+                EvaluationLink(GroundedPredicateNode("py:" + pred),
+                               VariableNode("X"))))
+
+    def test_aexecute(self):
+        query = GetLink(InheritanceLink(VariableNode("X"),
+                                        ConceptNode("thing")))
+        result = asyncio.run(aio.aexecute(self.space, query))
+        self.assertEqual(10, len(result.out))
+
+    def test_cancel_token(self):
+        token = CancelToken()
+        __main__.active_token = token
+        with token:
+            with self.assertRaises(RuntimeError):
+                self.space.execute(self.query("stop_search"))
+        self.assertTrue(token.cancelled)
+        self.assertEqual(1, len(calls))
+
+        # Outside of the block, the token no longer applies.
+        del calls[:]
+        self.space.execute(self.query("stop_search"))
+        self.assertEqual(10, len(calls))
+
+    def test_cancel_task(self):
+        async def run():
+            loop = asyncio.get_running_loop()
+            task = asyncio.ensure_future(
+                aio.aexecute(self.space, self.query("block_search")))
+            self.assertTrue(await loop.run_in_executor(None, entered.wait, 5))
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        release.set()
+        # Wait for the worker; the search must have stopped early.
+        aio.shutdown(wait=True)
+        self.assertEqual(1, len(calls))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,9 @@
 from unittest import TestCase
+import array
 
 import opencog.atomspace
-from opencog.atomspace import Atom
+from opencog.atomspace import Atom, HandleArray, Builder, DeferredAtom
+from opencog.atomspace import enable_atom_cache, clear_atom_cache, atom_cache_stats
 from opencog.atomspace import types, is_a, get_type, get_type_name, create_child_atomspace
 
 from opencog.type_constructors import *
@@ -95,6 +97,94 @@ class AtomSpaceTest(TestCase):
             caught = True
         self.assertEquals(caught, True)
 
+    def test_add_nodes(self):
+        names = ["node" + str(i) for i in range(100)]
+        atoms = self.space.add_nodes(types.ConceptNode, names)
+        self.assertEqual(len(atoms), 100)
+        self.assertEqual(atoms[7], ConceptNode("node7"))
+        self.assertEqual(self.space.size(), 100)
+
+        # Duplicates resolve to the same atom; bytes are accepted too.
+        handles = self.space.add_nodes(types.ConceptNode,
+                [b"node3", "node3", "other"], returns="handles")
+        self.assertTrue(isinstance(handles, HandleArray))
+        self.assertEqual(len(handles), 3)
+        self.assertEqual(handles[0], handles[1])
+        self.assertEqual(handles[-1], ConceptNode("other"))
+        self.assertEqual(self.space.size(), 101)
+
+        self.assertEqual(None,
+            self.space.add_nodes(types.ConceptNode, ["a", "b"], returns=None))
+        self.assertEqual(self.space.size(), 103)
+
+        self.assertRaises(ValueError, self.space.add_nodes,
+                types.ConceptNode, ["x"], returns="wrappers")
+
+    def test_add_links(self):
+        a = ConceptNode("a")
+        b = ConceptNode("b")
+        c = ConceptNode("c")
+        links = self.space.add_links(types.ListLink, [[a, b], (b, c), [c]])
+        self.assertEqual(links[0], ListLink(a, b))
+        self.assertEqual(links[1], ListLink(b, c))
+        self.assertEqual(links[2], ListLink(c))
+
+        # Columnar input, mixing a HandleArray and a list.
+        heads = self.space.add_nodes(types.ConceptNode, ["a", "b"],
+                                     returns="handles")
+        edges = self.space.add_links(types.ListLink, [heads, [c, c]],
+                                     columnar=True, returns="handles")
+        self.assertEqual(edges.to_list(), [ListLink(a, c), ListLink(b, c)])
+        self.assertEqual(edges[0:1].to_list(), [ListLink(a, c)])
+
+        self.assertRaises(ValueError, self.space.add_links, types.ListLink,
+                [[a, b], [c]], columnar=True)
+        self.assertRaises(TypeError, self.space.add_links, types.ListLink,
+                [[a, "b"]])
+
+    def test_builder(self):
+        other = AtomSpace()
+        b = Builder(other)
+        cat = b.Concept("cat")
+        link = b.InheritanceLink(cat, b.ConceptNode("animal"),
+                                 tv=TruthValue(0.5, 0.5))
+        self.assertEqual(cat.type, types.ConceptNode)
+        self.assertEqual(link.out[0], cat)
+        self.assertAlmostEqual(link.mean, 0.5)
+        self.assertIs(b.atomspace, other)
+        self.assertEqual(other.size(), 3)
+        # Nothing was added to the default atomspace.
+        self.assertEqual(self.space.size(), 0)
+        self.assertEqual(b.add_node(types.NumberNode, [1, 2]).name,
+                         NumberNode([1, 2]).name)
+        self.assertRaises(AttributeError, getattr, b, "NoSuchLink")
+        self.assertRaises(TypeError, b.List, cat, "dog")
+
+    def test_builder_defer(self):
+        b = Builder(self.space)
+        with b.defer():
+            dog = b.Concept("dog")
+            link = b.Inheritance(dog, b.Concept("animal"))
+            self.assertTrue(isinstance(link, DeferredAtom))
+            self.assertEqual(b.pending, 3)
+            self.assertEqual(self.space.size(), 0)
+            self.assertRaises(RuntimeError, getattr, link, "atom")
+        self.assertEqual(b.pending, 0)
+        self.assertEqual(self.space.size(), 3)
+        self.assertEqual(link.atom, InheritanceLink(ConceptNode("dog"),
+                                                    ConceptNode("animal")))
+        # Atoms of earlier batches can be used in later ones.
+        b.List(dog, link)
+        self.assertEqual(self.space.size(), 4)
+
+        # An exception discards the queue.
+        with self.assertRaises(ZeroDivisionError):
+            with b.defer():
+                b.Concept("lost")
+                1 / 0
+        self.assertEqual(self.space.size(), 4)
+        self.assertEqual(b.pending, 0)
+
     def test_is_valid(self):
         a1 = Node("test1")
         # check with Atom object
@@ -125,6 +215,67 @@ class AtomSpaceTest(TestCase):
         self.assertEqual(new_tv.mean, 0.75)
         self.assertAlmostEqual(new_tv.confidence, 0.9, places=4)
 
+    def test_mean_confidence(self):
+        atom = Node("atom with tv").truth_value(0.25, 0.5)
+        self.assertEqual(atom.mean, 0.25)
+        self.assertAlmostEqual(atom.confidence, 0.5, places=4)
+        self.assertEqual(atom.mean, atom.tv.mean)
+        self.assertEqual(atom.confidence, atom.tv.confidence)
+
+    def test_bulk_truthvalues(self):
+        atoms = self.space.add_nodes(types.ConceptNode,
+                                     ["tv%d" % i for i in range(10)])
+        means = array.array('d', [i / 10.0 for i in range(10)])
+        confs = array.array('d', [1.0 - i / 10.0 for i in range(10)])
+        self.space.set_truthvalues(atoms, means, confs)
+        for i, atom in enumerate(atoms):
+            self.assertEqual(atom.mean, means[i])
+            self.assertAlmostEqual(atom.confidence, confs[i], places=4)
+
+        got_means, got_confs = self.space.get_truthvalues(atoms)
+        self.assertEqual(list(got_means), list(means))
+        for got, conf in zip(got_confs, confs):
+            self.assertAlmostEqual(got, conf, places=4)
+
+        # Plain lists and HandleArrays work too.
+        handles = self.space.add_nodes(types.ConceptNode, ["tv1", "tv2"],
+                                       returns="handles")
+        self.space.set_truthvalues(handles, [0.5, 0.5], [0.9, 0.9])
+        self.assertEqual(list(self.space.get_truthvalues(handles)[0]),
+                         [0.5, 0.5])
+        self.assertEqual(len(self.space.get_truthvalues([])[0]), 0)
+
+        self.assertRaises(ValueError, self.space.set_truthvalues,
+                          atoms, means, [1.0])
+
+    def test_bulk_values(self):
+        key = PredicateNode("counts")
+        atoms = self.space.add_nodes(types.ConceptNode,
+                                     ["val%d" % i for i in range(4)])
+        rows = [[i, 2.0 * i, 3.0 * i] for i in range(4)]
+        self.space.set_values(atoms, key, rows)
+        self.assertEqual(atoms[2].get_value(key), FloatValue([2, 4, 6]))
+
+        mat = self.space.get_values(atoms, key)
+        self.assertEqual(tuple(mat.shape), (4, 3))
+        self.assertEqual(mat.tolist(), rows)
+
+        # A dense matrix can be written straight back.
+        self.space.set_values(atoms[::-1], key, mat)
+        self.assertEqual(atoms[0].get_value(key), FloatValue([3, 6, 9]))
+
+        # Ragged rows, or other kinds of Values, give back a list.
+        self.space.set_values(atoms[:2], key, [[1.0], [1.0, 2.0]])
+        vals = self.space.get_values(atoms[:2], key)
+        self.assertEqual(vals, [FloatValue([1]), FloatValue([1, 2])])
+        atoms[3].set_value(key, StringValue("foo"))
+        vals = self.space.get_values(atoms[2:] + [Node("no value")], key)
+        self.assertEqual(vals, [FloatValue([1, 2, 3]),
+                                StringValue("foo"), None])
+
+        self.assertRaises(ValueError, self.space.set_values,
+                          atoms, key, rows[:2])
+
     def test_get_by_type(self):
         a1 = Node("test1")
         a2 = ConceptNode("test2")
@@ -151,6 +302,61 @@ class AtomSpaceTest(TestCase):
         result = self.space.get_atoms_by_type(types.AnchorNode, subtype=False)
         self.assertEqual(len(result), 0)
 
+    def test_get_by_type_count_limit(self):
+        self.space.add_nodes(types.ConceptNode,
+                             ["c" + str(i) for i in range(20)])
+        PredicateNode("p")
+
+        self.assertEqual(self.space.get_atoms_by_type(types.Node,
+                         count_only=True), 21)
+        self.assertEqual(self.space.get_atoms_by_type(types.ConceptNode,
+                         count_only=True, limit=5), 5)
+
+        result = self.space.get_atoms_by_type(types.Node, limit=7)
+        self.assertEqual(len(result), 7)
+        self.assertEqual(self.space.get_atoms_by_type(types.Node, limit=0), [])
+
+        with self.assertRaises(ValueError):
+            self.space.get_atoms_by_type(types.Node, limit=-1)
+        with self.assertRaises(ValueError):
+            self.space.get_atoms_by_type(types.Node, count_only=True,
+                                         limit=-1)
+        with self.assertRaises(ValueError):
+            self.space.iter_atoms_by_type(types.Node, limit=-1)
+
+    def test_iter_atoms_by_type(self):
+        a1 = ConceptNode("test1")
+        a2 = PredicateNode("test2")
+        l1 = InheritanceLink(a1, a2)
+
+        result = list(self.space.iter_atoms_by_type(types.Node))
+        self.assertEqual(len(result), 2)
+        self.assertTrue(a1 in result)
+        self.assertTrue(a2 in result)
+
+        result = list(self.space.iter_atoms_by_type(types.Node,
+                                                    subtype=False))
+        self.assertEqual(result, [])
+
+        result = list(self.space.iter_atoms_by_type(types.Atom, limit=1))
+        self.assertEqual(len(result), 1)
+
+        # Iterating over the atomspace visits every atom once.
+        self.assertEqual(sorted(self.space), sorted([a1, a2, l1]))
+
+        # Types not yet reached by the iterator see new insertions;
+        # the type reached first is a snapshot.
+        it = self.space.iter_atoms_by_type(types.Node)
+        first = next(it)
+        ConceptNode("test3")
+        PredicateNode("test4")
+        rest = list(it)
+        seen = set([first] + rest)
+        self.assertEqual(set([a1, a2]), seen & set([a1, a2]))
+        late = set([ConceptNode("test3"), PredicateNode("test4")]) & seen
+        self.assertEqual(1, len(late))
+        self.assertNotEqual(first.type, list(late)[0].type)
+
     def test_incoming_by_type(self):
         a1 = Node("test1")
         a2 = ConceptNode("test2")
@@ -169,6 +375,35 @@ class AtomSpaceTest(TestCase):
         result = a3.incoming_by_type(types.InheritanceLink)
         self.assertTrue(l1 not in result)
 
+    def test_incoming_size(self):
+        hub = PredicateNode("hub")
+        self.assertEqual(hub.incoming_size, 0)
+        self.assertEqual(list(hub.iter_incoming()), [])
+
+        words = [ConceptNode("w%d" % i) for i in range(5)]
+        evals = [EvaluationLink(hub, ListLink(w)) for w in words]
+        inhs = [InheritanceLink(w, hub) for w in words[:3]]
+        self.assertEqual(hub.incoming_size, 8)
+        self.assertEqual(hub.incoming_size_by_type(types.EvaluationLink), 5)
+        self.assertEqual(hub.incoming_size_by_type(types.InheritanceLink), 3)
+        self.assertEqual(hub.incoming_size_by_type(types.ListLink), 0)
+
+        self.assertEqual(set(hub.iter_incoming()), set(evals + inhs))
+        self.assertEqual(set(hub.iter_incoming(types.InheritanceLink)),
+                         set(inhs))
+        self.assertEqual(len(list(hub.iter_incoming(limit=6))), 6)
+        self.assertEqual(list(hub.iter_incoming(limit=0)), [])
+        with self.assertRaises(ValueError):
+            hub.iter_incoming(limit=-1)
+        with self.assertRaises(ValueError):
+            hub.iter_incoming(types.ConceptNode)
+
+        # All of the incoming set is of the one type.
+        self.assertEqual(list(ListLink(words[0]).iter_incoming(
+                              types.EvaluationLink)), [evals[0]])
+        self.assertEqual(list(ListLink(words[0]).iter_incoming(
+                              types.EvaluationLink, limit=0)), [])
+
     def test_remove(self):
         a1 = Node("test1")
         a2 = ConceptNode("test2")
@@ -302,6 +537,30 @@ class AtomTest(TestCase):
         self.assertTrue(test2 in b.get_atoms_by_type(types.ConceptNode))
         self.assertTrue(test2 not in self.space.get_atoms_by_type(types.ConceptNode))
 
+    def test_atom_cache(self):
+        enable_atom_cache()
+        clear_atom_cache()
+        try:
+            a = ConceptNode("cached")
+            self.assertTrue(a is ConceptNode("cached"))
+            l = ListLink(a, ConceptNode("other"))
+            self.assertTrue(l.out[0] is a)
+            self.assertTrue(l in a.incoming)
+            self.assertTrue(a.incoming[0] is l)
+
+            stats = atom_cache_stats()
+            self.assertTrue(stats["enabled"])
+            self.assertTrue(stats["hits"] >= 3)
+            self.assertTrue(stats["misses"] >= 3)
+
+            # The cache does not keep wrappers alive.
+            size = stats["size"]
+            del a, l
+            self.assertTrue(atom_cache_stats()["size"] < size)
+        finally:
+            enable_atom_cache(False)
+        self.assertFalse(ConceptNode("cached") is ConceptNode("cached"))
+
     def test_strings(self):
         # set up a link and atoms
         tv = TruthValue(0.5, 0.8)
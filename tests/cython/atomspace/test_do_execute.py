@@ -1,5 +1,7 @@
+import sys
 import unittest
 import threading
+import time
 
 from opencog.atomspace import create_child_atomspace
 from opencog.type_constructors import *
@@ -73,6 +75,47 @@ class DoExecuteTest(unittest.TestCase):
         self.assertTrue(different_as.is_node_in_atomspace(types.ConceptNode, "test-1"))
         self.assertFalse(different_as.is_node_in_atomspace(types.ConceptNode, "test-2"))
 
+    def test_execute_releases_gil(self):
+        """A long query in one thread must not stall other threads."""
+        nodes = self.atomspace.add_nodes(types.ConceptNode,
+                    ["n" + str(i) for i in range(40)], returns="handles")
+        self.atomspace.add_links(types.ListLink,
+                    [[a, b] for a in nodes for b in nodes], returns=None)
+        query = GetLink(
+            AndLink(
+                PresentLink(ListLink(VariableNode("$x"), VariableNode("$y"))),
+                PresentLink(ListLink(VariableNode("$y"), VariableNode("$z"))),
+                PresentLink(ListLink(VariableNode("$z"), VariableNode("$x")))))
+
+        # Each worker records when it was inside execute(). The switch
+        # interval is raised, so that a thread holding the GIL is not
+        # made to drop it; a worker can then only get to run while the
+        # other one is inside execute() if execute() released it.
+        intervals = []
+        barrier = threading.Barrier(2)
+        def run_query(execute):
+            barrier.wait()
+            start = time.monotonic()
+            execute(query)
+            intervals.append((start, time.monotonic()))
+
+        workers = [
+            threading.Thread(target=run_query, args=(self.atomspace.execute,)),
+            threading.Thread(target=run_query, args=(lambda q: q.execute(),))]
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1000)
+        try:
+            for w in workers:
+                w.start()
+            for w in workers:
+                w.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        self.assertEqual(len(intervals), 2)
+        (start1, end1), (start2, end2) = intervals
+        self.assertLess(max(start1, start2), min(end1, end2))
+
 
 def push_default(atomspace):
     push_default_atomspace(atomspace)
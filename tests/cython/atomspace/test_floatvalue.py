@@ -1,3 +1,4 @@
+import array
 import unittest
 
 from opencog.type_constructors import *
@@ -41,6 +42,40 @@ class FloatValueTest(unittest.TestCase):
         value = FloatValue([1.0, 2.0, 3.0])
         self.assertEqual([1.0, 2.0, 3.0], value.to_list())
 
+    def test_buffer_view(self):
+        value = FloatValue([1.0, 2.0, 3.0])
+        view = memoryview(value)
+        self.assertTrue(view.readonly)
+        self.assertEqual(view.format, 'd')
+        self.assertEqual(view.shape, (3,))
+        self.assertEqual(view.tolist(), [1.0, 2.0, 3.0])
+
+    def test_create_from_buffer(self):
+        value = FloatValue(array.array('d', [1.5, 2.5, 3.5]))
+        self.assertEqual(FloatValue([1.5, 2.5, 3.5]), value)
+
+        # Round trip through another FloatValue's buffer.
+        self.assertEqual(value, FloatValue(memoryview(value)))
+        self.assertEqual(FloatValue([]), FloatValue(array.array('d')))
+
+        # Only float64 is accepted.
+        self.assertRaises(ValueError, FloatValue, array.array('f', [1.0]))
+
+    def test_as_array(self):
+        try:
+            import numpy
+        except ImportError:
+            raise unittest.SkipTest("NumPy not installed")
+        value = FloatValue([1.0, 2.0, 3.0])
+        arr = value.as_array()
+        self.assertEqual(arr.dtype, numpy.float64)
+        self.assertFalse(arr.flags.writeable)
+        self.assertEqual(list(arr), [1.0, 2.0, 3.0])
+
+        vec = numpy.linspace(0.0, 1.0, 768)
+        self.assertEqual(FloatValue(vec).to_list(), list(vec))
+        self.assertEqual(FloatValue(vec[::2]).to_list(), list(vec[::2]))
+
     def test_str(self):
         value = FloatValue(1.234)
         self.assertEqual('(FloatValue 1.234)', str(value))
@@ -0,0 +1,106 @@
+import unittest
+import threading
+
+from opencog.atomspace import AtomSpace
+from opencog.type_constructors import *
+from opencog.utilities import initialize_opencog, finalize_opencog
+
+import __main__
+
+calls = []
+lock = threading.Lock()
+
+def count_calls(atom):
+    with lock:
+        calls.append(atom)
+    return TruthValue(1, 1)
+
+__main__.count_calls = count_calls
+
+
+class IterQueryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.space = AtomSpace()
+        initialize_opencog(self.space)
+        for i in range(100):
+            InheritanceLink(ConceptNode("item" + str(i)), ConceptNode("thing"))
+        del calls[:]
+
+    def tearDown(self):
+        finalize_opencog()
+        del self.space
+
+    def body(self, pred=None):
+        clauses = [PresentLink(InheritanceLink(VariableNode("X"),
+                                               ConceptNode("thing")))]
+        if pred is not None:
+            clauses.append(EvaluationLink(GroundedPredicateNode("py:" + pred),
+                                          VariableNode("X")))
+        return AndLink(*clauses)
+
+    def sorted(self, atoms):
+        return sorted(atoms, key=str)
+
+    def test_get(self):
+        query = GetLink(VariableNode("X"), self.body())
+        expect = self.sorted(self.space.execute(query).out)
+        self.assertEqual(100, len(expect))
+        self.assertEqual(expect, self.sorted(self.space.iter_query(query)))
+        self.assertEqual(expect,
+            self.sorted(self.space.iter_query(query, batch_size=7)))
+        self.assertEqual(expect,
+            self.sorted(self.space.iter_query(query, parallel=4)))
+
+    def test_query(self):
+        query = QueryLink(VariableNode("X"), self.body(),
+                          ListLink(VariableNode("X"), ConceptNode("found")))
+        results = list(self.space.iter_query(query, batch_size=10))
+        self.assertEqual(100, len(results))
+        self.assertEqual(self.sorted(self.space.execute(query).to_list()),
+                         self.sorted(results))
+
+    def test_duplicates(self):
+        # Every item is found through both of the choices; each must
+        # still come out once, as it does from execute().
+        for i in range(100):
+            MemberLink(ConceptNode("item" + str(i)), ConceptNode("set"))
+        query = GetLink(
+            TypedVariableLink(VariableNode("X"), TypeNode("ConceptNode")),
+            ChoiceLink(
+                InheritanceLink(VariableNode("X"), ConceptNode("thing")),
+                MemberLink(VariableNode("X"), ConceptNode("set"))))
+        expect = self.sorted(self.space.execute(query).out)
+        self.assertEqual(100, len(expect))
+        self.assertEqual(expect, self.sorted(self.space.iter_query(query)))
+        self.assertEqual(expect,
+            self.sorted(self.space.iter_query(query, parallel=4)))
+
+    def test_stop_early(self):
+        query = GetLink(VariableNode("X"), self.body("count_calls"))
+        results = self.space.iter_query(query, batch_size=5)
+        first = [next(results) for _ in range(3)]
+        self.assertEqual(3, len(set(first)))
+        results.close()
+
+        # The search was held back by the full channel, then cancelled.
+        self.assertLess(len(calls), 20)
+
+        # Breaking out of the loop does the same.
+        del calls[:]
+        for result in self.space.iter_query(query, batch_size=5):
+            break
+        self.assertLess(len(calls), 20)
+
+    def test_errors(self):
+        query = GetLink(VariableNode("X"), self.body("no_such_function"))
+        with self.assertRaises(RuntimeError):
+            list(self.space.iter_query(query))
+        with self.assertRaises(TypeError):
+            self.space.iter_query(ConceptNode("thing"))
+        with self.assertRaises(ValueError):
+            self.space.iter_query(query, batch_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,7 @@
 import unittest
 
 from opencog.atomspace import (types, decl_type, type_decl_context, AtomSpace,
-        get_type_name)
+        Atom, get_type_name)
 from opencog.utilities import add_node, add_link, push_default_atomspace, pop_default_atomspace
 from opencog.type_constructors import *
 
@@ -41,5 +41,50 @@ class NameserverTest(unittest.TestCase):
         res = self._get_atoms_by_type(types.SomeLink)
         self.assertEqual(res.out, [ link ])
 
+    def test_decl_wrapper_class(self):
+        # Values of freshly declared types get the wrapper class
+        # of their nearest ancestor.
+        node = SomeNode("wrapped")
+        self.assertTrue(isinstance(node, Atom))
+        self.assertEqual(node.type, types.SomeNode)
+        self.assertTrue(isinstance(ConceptNode("plain"), Atom))
+        self.assertEqual(type(FloatValue(1.0)).__name__, "FloatValue")
+
+    def test_decl_ctor(self):
+        # Constructors for freshly declared types are found by name.
+        import opencog.type_constructors as tc
+        self.assertEqual(tc.SomeNode("x").type, types.SomeNode)
+        self.assertIn("SomeLink", tc.__all__)
+
+class LazyTypesTest(unittest.TestCase):
+
+    def test_types(self):
+        from opencog.atomspace import typedict
+        self.assertEqual(types.ConceptNode, typedict["ConceptNode"])
+        self.assertEqual(types.SomeNode, typedict["SomeNode"])
+        self.assertEqual(types.NO_TYPE, typedict["NO_TYPE"])
+
+        # Star imports still get it.
+        scope = {}
+        exec("from opencog.atomspace import *", scope)
+        self.assertIs(typedict, scope["typedict"])
+        self.assertEqual(get_type_name(types.ListLink), "ListLink")
+        self.assertIn("ConceptNode", dir(types))
+        with self.assertRaises(AttributeError):
+            types.NoSuchTypeNode
+
+    def test_ctors(self):
+        import opencog.type_constructors as tc
+        self.assertIs(tc.Concept, tc.Concept)
+        self.assertEqual(tc.ConceptNode.__name__, "ConceptNode")
+        self.assertIn("ListLink", tc.__all__)
+        self.assertIn("List", dir(tc))
+        # Types that are neither Nodes nor Links keep their
+        # constructors, as before.
+        self.assertIn("Frame", tc.__all__)
+        self.assertIn("Valuation", tc.__all__)
+        with self.assertRaises(AttributeError):
+            tc.NoSuchTypeNode
+
 if __name__ == '__main__':
     unittest.main()
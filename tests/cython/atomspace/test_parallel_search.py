@@ -0,0 +1,106 @@
+import unittest
+import threading
+
+from opencog.atomspace import AtomSpace, CancelToken, parallel_search
+from opencog.type_constructors import *
+from opencog.utilities import initialize_opencog, finalize_opencog
+
+import __main__
+
+calls = []
+lock = threading.Lock()
+
+def record(atom):
+    with lock:
+        calls.append(atom)
+    return TruthValue(1, 1)
+
+def stop_search(atom):
+    with lock:
+        calls.append(atom)
+    __main__.active_token.cancel()
+    return TruthValue(1, 1)
+
+
+class ParallelSearchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.space = AtomSpace()
+        initialize_opencog(self.space)
+        for i in range(200):
+            item = ConceptNode("item" + str(i))
+            InheritanceLink(item, ConceptNode("thing"))
+            if i % 2 == 0:
+                MemberLink(item, ConceptNode("even"))
+        # Other test modules bind the same names in __main__.
+        __main__.record = record
+        __main__.stop_search = stop_search
+        del calls[:]
+
+    def tearDown(self):
+        finalize_opencog()
+        del self.space
+
+    def query(self, pred=None):
+        clauses = [PresentLink(InheritanceLink(VariableNode("X"),
+                                               ConceptNode("thing"))),
+                   PresentLink(MemberLink(VariableNode("X"),
+                                          ConceptNode("even")))]
+        if pred is not None:
+            clauses.append(EvaluationLink(GroundedPredicateNode("py:" + pred),
+                                          VariableNode("X")))
+        return GetLink(
+            TypedVariableLink(VariableNode("X"), TypeNode("ConceptNode")),
+            AndLink(*clauses))
+
+    def test_same_results(self):
+        query = self.query()
+        expect = set(self.space.execute(query).out)
+        self.assertEqual(100, len(expect))
+        self.assertEqual(expect, set(self.space.execute(query, parallel=4).out))
+        self.assertEqual(expect, set(self.space.execute(query, parallel=True).out))
+        with parallel_search(4):
+            self.assertEqual(expect, set(self.space.execute(query).out))
+            # Per-query setting wins over the block.
+            self.assertEqual(expect, set(self.space.execute(query, parallel=0).out))
+
+    def test_rewrite(self):
+        query = QueryLink(
+            TypedVariableLink(VariableNode("X"), TypeNode("ConceptNode")),
+            AndLink(PresentLink(InheritanceLink(VariableNode("X"),
+                                                ConceptNode("thing"))),
+                    PresentLink(MemberLink(VariableNode("X"),
+                                           ConceptNode("even")))),
+            ListLink(VariableNode("X"), ConceptNode("found")))
+        expect = set(self.space.execute(query).to_list())
+        self.assertEqual(100, len(expect))
+        self.assertEqual(expect,
+                         set(self.space.execute(query, parallel=4).to_list()))
+
+    def test_callbacks(self):
+        result = self.space.execute(self.query("record"), parallel=4)
+        self.assertEqual(100, len(result.out))
+        self.assertEqual(100, len(calls))
+        self.assertEqual(set(result.out), set(calls))
+
+    def test_exception(self):
+        with self.assertRaises(RuntimeError):
+            self.space.execute(self.query("no_such_function"), parallel=4)
+
+    def test_cancel(self):
+        token = CancelToken()
+        __main__.active_token = token
+        with token:
+            with self.assertRaises(RuntimeError):
+                self.space.execute(self.query("stop_search"), parallel=4)
+        self.assertTrue(token.cancelled)
+        # Each worker finishes at most the candidate it is on.
+        self.assertLessEqual(len(calls), 4)
+
+    def test_bad_setting(self):
+        with self.assertRaises(ValueError):
+            self.space.execute(self.query(), parallel=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+import pickle
+
+from opencog.atomspace import AtomSpace, types
+from opencog.atomspace import values_to_bytes, values_from_bytes
+from opencog.type_constructors import *
+from opencog.utilities import push_default_atomspace, pop_default_atomspace
+
+
+class PickleTest(unittest.TestCase):
+
+    def setUp(self):
+        self.space = AtomSpace()
+        push_default_atomspace(self.space)
+
+    def tearDown(self):
+        pop_default_atomspace()
+
+    def roundtrip(self, value):
+        return pickle.loads(pickle.dumps(value))
+
+    def test_atoms(self):
+        link = InheritanceLink(ConceptNode("cat"), ConceptNode("animal"))
+        other = AtomSpace()
+        data = pickle.dumps(link)
+
+        # Unpickling adds the atoms to the default atomspace.
+        push_default_atomspace(other)
+        try:
+            copy = pickle.loads(data)
+        finally:
+            pop_default_atomspace()
+        self.assertEqual(copy, link)
+        self.assertEqual(other.size(), 3)
+
+    def test_atom_values(self):
+        key = PredicateNode("weights")
+        a = ConceptNode("a")
+        a.set_value(key, FloatValue([1, 2, 3]))
+        a.tv = TruthValue(0.5, 0.25)
+        other = AtomSpace()
+        data = pickle.dumps(a)
+
+        # The Values of the pickled Atom come along.
+        push_default_atomspace(other)
+        try:
+            copy = pickle.loads(data)
+        finally:
+            pop_default_atomspace()
+        self.assertEqual(copy, a)
+        self.assertEqual(copy.get_value(key), FloatValue([1, 2, 3]))
+        self.assertAlmostEqual(copy.tv.mean, 0.5)
+        self.assertAlmostEqual(copy.tv.confidence, 0.25)
+        self.assertTrue(other.is_node_in_atomspace(types.ConceptNode, "a"))
+
+    def test_values(self):
+        for value in [FloatValue([1.5, -2.0, 1e300]),
+                      StringValue(["a", "", "été"]),
+                      BoolValue([True, False, True]),
+                      TruthValue(0.25, 0.75),
+                      LinkValue([ConceptNode("x"), FloatValue(3.0)])]:
+            copy = self.roundtrip(value)
+            self.assertEqual(type(copy), type(value))
+            self.assertEqual(copy.type, value.type)
+            self.assertEqual(copy, value)
+
+    def test_values_to_bytes(self):
+        a = ConceptNode("a")
+        vals = [a, ListLink(a, a), FloatValue([1, 2])]
+        data = values_to_bytes(vals)
+        self.assertEqual(values_from_bytes(data, self.space), vals)
+        self.assertRaises(RuntimeError, values_from_bytes, data[:-3])
+        self.assertRaises(RuntimeError, values_from_bytes, b"junk")
+
+    def test_atomspace(self):
+        key = PredicateNode("weights")
+        a = ConceptNode("a")
+        a.set_value(key, FloatValue([1, 2, 3]))
+        a.tv = TruthValue(0.5, 0.5)
+        b = ListLink(a, ConceptNode("b"))
+
+        copy = AtomSpace.from_bytes(self.space.to_bytes())
+        self.assertEqual(copy.size(), self.space.size())
+        ca = copy.add_node(types.ConceptNode, "a")
+        self.assertEqual(ca.get_value(key), FloatValue([1, 2, 3]))
+        self.assertAlmostEqual(ca.tv.mean, 0.5)
+
+        copy = self.roundtrip(self.space)
+        self.assertEqual(copy.size(), self.space.size())
+
+        # Just some of the atoms; the outgoing set comes along.
+        part = AtomSpace.from_bytes(self.space.to_bytes([b], values=False))
+        self.assertEqual(part.size(), 3)
+        self.assertAlmostEqual(part.add_node(types.ConceptNode, "a").tv.confidence, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
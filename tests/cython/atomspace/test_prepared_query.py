@@ -0,0 +1,73 @@
+import unittest
+
+from opencog.atomspace import AtomSpace, PreparedQuery
+from opencog.type_constructors import *
+from opencog.utilities import initialize_opencog, finalize_opencog
+
+
+class PreparedQueryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.space = AtomSpace()
+        initialize_opencog(self.space)
+        for kind in ["animal", "plant"]:
+            for i in range(10):
+                InheritanceLink(ConceptNode(kind + str(i)), ConceptNode(kind))
+
+    def tearDown(self):
+        finalize_opencog()
+        del self.space
+
+    def get_query(self):
+        return GetLink(
+            VariableList(VariableNode("who"),
+                         TypedVariableLink(VariableNode("what"),
+                                           TypeNode("ConceptNode"))),
+            InheritanceLink(VariableNode("who"), VariableNode("what")))
+
+    def test_get(self):
+        who_is_a = self.space.prepare(self.get_query(), VariableNode("what"))
+        self.assertIsInstance(who_is_a, PreparedQuery)
+        for kind in ["animal", "plant"]:
+            expect = GetLink(VariableNode("who"),
+                             InheritanceLink(VariableNode("who"),
+                                             ConceptNode(kind)))
+            result = who_is_a(ConceptNode(kind))
+            self.assertEqual(10, len(result.out))
+            self.assertEqual(set(self.space.execute(expect).out),
+                             set(result.out))
+        self.assertEqual(0, len(who_is_a(ConceptNode("rock")).out))
+        self.assertEqual(10, len(who_is_a.execute(ConceptNode("plant"),
+                                                  parallel=2).out))
+
+    def test_query(self):
+        query = QueryLink(
+            VariableList(VariableNode("who"), VariableNode("what")),
+            PresentLink(InheritanceLink(VariableNode("who"),
+                                        VariableNode("what"))),
+            ListLink(VariableNode("who"), VariableNode("what")))
+        kind_of = self.space.prepare(query, VariableNode("who"))
+        result = kind_of(ConceptNode("plant3")).to_list()
+        self.assertEqual([ListLink(ConceptNode("plant3"), ConceptNode("plant"))],
+                         result)
+
+    def test_errors(self):
+        # Not a variable of the query.
+        with self.assertRaises(RuntimeError):
+            self.space.prepare(self.get_query(), VariableNode("where"))
+        with self.assertRaises(RuntimeError):
+            self.space.prepare(ConceptNode("animal"))
+
+        who_is_a = self.space.prepare(self.get_query(), VariableNode("what"))
+        # Wrong number of values.
+        with self.assertRaises(RuntimeError):
+            who_is_a()
+        # Wrong type of value.
+        with self.assertRaises(RuntimeError):
+            who_is_a(PredicateNode("animal"))
+        with self.assertRaises(TypeError):
+            who_is_a("animal")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+import unittest
+
+from opencog.atomspace import AtomSpace, create_child_atomspace, types
+from opencog.type_constructors import *
+from opencog.utilities import initialize_opencog, finalize_opencog
+
+import __main__
+
+def always(atom):
+    return TruthValue(1, 1)
+
+__main__.always = always
+
+
+class QueryCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.space = AtomSpace()
+        initialize_opencog(self.space)
+        for i in range(10):
+            InheritanceLink(ConceptNode("animal" + str(i)), ConceptNode("animal"))
+
+    def tearDown(self):
+        finalize_opencog()
+        del self.space
+
+    def animals(self, kind="animal"):
+        return GetLink(VariableNode("x"),
+                       InheritanceLink(VariableNode("x"), ConceptNode(kind)))
+
+    def test_off(self):
+        self.assertIsNone(self.space.query_cache_stats())
+        self.assertEqual(10, len(self.space.execute(self.animals()).out))
+        self.assertIsNone(self.space.query_cache_stats())
+
+    def test_hit(self):
+        self.space.set_query_cache(8)
+        first = self.space.execute(self.animals())
+        again = self.space.execute(self.animals())
+        self.assertEqual(first, again)
+        stats = self.space.query_cache_stats()
+        self.assertEqual(1, stats["hits"])
+        self.assertEqual(1, stats["misses"])
+        self.assertEqual(1, stats["size"])
+        self.assertEqual(8, stats["capacity"])
+        self.assertEqual(0.5, stats["hit_rate"])
+
+    def test_two_atomspaces(self):
+        # The query atom holds the results of its last run, wherever
+        # it ran; the cached results must not change with them.
+        self.space.set_query_cache(8)
+        query = MeetLink(VariableNode("x"),
+                         InheritanceLink(VariableNode("x"),
+                                         ConceptNode("animal")))
+        self.assertEqual(10, len(self.space.execute(query).to_list()))
+
+        child = create_child_atomspace(self.space)
+        child.add_link(types.InheritanceLink,
+                       [child.add_node(types.ConceptNode, "animal10"),
+                        child.add_node(types.ConceptNode, "animal")])
+        self.assertEqual(11, len(child.execute(query).to_list()))
+
+        self.assertEqual(10, len(self.space.execute(query).to_list()))
+        self.assertEqual(1, self.space.query_cache_stats()["hits"])
+
+        # Draining what a hit returned leaves the cache alone.
+        self.assertEqual(10, len(self.space.execute(query).to_list()))
+        self.assertEqual(10, len(self.space.execute(query).to_list()))
+        self.assertEqual(3, self.space.query_cache_stats()["hits"])
+
+    def test_rewrite_removed(self):
+        # The types of the rewritten atoms are not watched; a hit must
+        # still hand back atoms that are in the AtomSpace.
+        self.space.set_query_cache(8)
+        query = QueryLink(VariableNode("x"),
+                          InheritanceLink(VariableNode("x"),
+                                          ConceptNode("animal")),
+                          ListLink(VariableNode("x"), ConceptNode("found")))
+        results = self.space.execute(query).to_list()
+        self.assertEqual(10, len(results))
+
+        gone = results[0]
+        self.assertTrue(self.space.remove(gone))
+        self.assertFalse(gone in self.space)
+
+        results = self.space.execute(query).to_list()
+        self.assertEqual(1, self.space.query_cache_stats()["hits"])
+        self.assertEqual(10, len(results))
+        self.assertTrue(gone in self.space)
+        for result in results:
+            self.assertTrue(result in self.space)
+
+    def test_invalidate(self):
+        self.space.set_query_cache(8)
+        self.assertEqual(10, len(self.space.execute(self.animals()).out))
+
+        # Unrelated types leave the entry alone.
+        EvaluationLink(PredicateNode("eats"), ListLink(ConceptNode("animal1")))
+        self.assertEqual(10, len(self.space.execute(self.animals()).out))
+        self.assertEqual(1, self.space.query_cache_stats()["hits"])
+
+        InheritanceLink(ConceptNode("animal10"), ConceptNode("animal"))
+        self.assertEqual(11, len(self.space.execute(self.animals()).out))
+        stats = self.space.query_cache_stats()
+        self.assertEqual(1, stats["hits"])
+        self.assertEqual(1, stats["stale"])
+
+        self.space.remove(InheritanceLink(ConceptNode("animal10"),
+                                          ConceptNode("animal")))
+        self.assertEqual(10, len(self.space.execute(self.animals()).out))
+        self.assertEqual(2, self.space.query_cache_stats()["stale"])
+
+    def test_evict(self):
+        self.space.set_query_cache(1)
+        self.space.execute(self.animals())
+        self.space.execute(self.animals("plant"))
+        self.space.execute(self.animals())
+        stats = self.space.query_cache_stats()
+        self.assertEqual(0, stats["hits"])
+        self.assertEqual(2, stats["evictions"])
+        self.assertEqual(1, stats["size"])
+
+        self.space.clear_query_cache()
+        self.assertEqual(0, self.space.query_cache_stats()["size"])
+
+        self.space.set_query_cache(0)
+        self.assertIsNone(self.space.query_cache_stats())
+
+    def test_not_cached(self):
+        self.space.set_query_cache(8)
+        query = GetLink(VariableNode("x"),
+            AndLink(
+                InheritanceLink(VariableNode("x"), ConceptNode("animal")),
+                EvaluationLink(GroundedPredicateNode("py: always"),
+                               ListLink(VariableNode("x")))))
+        self.space.execute(query)
+        self.space.execute(query)
+        stats = self.space.query_cache_stats()
+        self.assertEqual(0, stats["hits"] + stats["misses"])
+        self.assertEqual(0, stats["size"])
+
+
+if __name__ == '__main__':
+    unittest.main()
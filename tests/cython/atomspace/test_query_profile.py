@@ -0,0 +1,104 @@
+import unittest
+
+from opencog.atomspace import AtomSpace
+from opencog.type_constructors import *
+from opencog.utilities import initialize_opencog, finalize_opencog
+
+import __main__
+
+calls = []
+
+def low_number(atom):
+    calls.append(atom)
+    if int(atom.name[len("animal"):]) < 5:
+        return TruthValue(1, 1)
+    return TruthValue(0, 1)
+
+__main__.low_number = low_number
+
+
+class QueryProfileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.space = AtomSpace()
+        initialize_opencog(self.space)
+        for i in range(10):
+            InheritanceLink(ConceptNode("animal" + str(i)), ConceptNode("animal"))
+        self.eats = EvaluationLink(PredicateNode("eats"),
+                                   ListLink(ConceptNode("animal0"),
+                                            ConceptNode("grass")))
+        del calls[:]
+
+    def tearDown(self):
+        finalize_opencog()
+        del self.space
+
+    def grass_eaters(self):
+        return GetLink(VariableNode("x"),
+            AndLink(
+                InheritanceLink(VariableNode("x"), ConceptNode("animal")),
+                EvaluationLink(PredicateNode("eats"),
+                               ListLink(VariableNode("x"),
+                                        ConceptNode("grass")))))
+
+    def test_explain(self):
+        plan = self.space.explain(self.grass_eaters())
+        self.assertEqual(1, len(plan))
+        search = plan[0]
+        self.assertEqual("neighbor", search["strategy"])
+        self.assertEqual(ConceptNode("grass"), search["start"])
+        # The ListLinks holding grass; one is in the query itself.
+        self.assertEqual(2, search["candidates"])
+        self.assertEqual(EvaluationLink(PredicateNode("eats"),
+                                        ListLink(VariableNode("x"),
+                                                 ConceptNode("grass"))),
+                         search["clause"])
+        self.assertNotIn("explored", search)
+
+        # Nothing but variables: start with all links of the type. These
+        # include the InheritanceLinks of both queries: 10 + 2.
+        plan = self.space.explain(GetLink(
+            VariableList(VariableNode("x"), VariableNode("y")),
+            InheritanceLink(VariableNode("x"), VariableNode("y"))))
+        self.assertEqual("link-type", plan[0]["strategy"])
+        self.assertIsNone(plan[0]["start"])
+        self.assertEqual(12, plan[0]["candidates"])
+
+        with self.assertRaises(RuntimeError):
+            self.space.explain(ConceptNode("animal"))
+
+    def test_profile(self):
+        prof = self.space.profile(self.grass_eaters())
+        self.assertEqual([ConceptNode("animal0")], prof["result"].out)
+        self.assertEqual(1, len(prof["searches"]))
+        self.assertEqual(2, prof["searches"][0]["explored"])
+        self.assertLessEqual(0.0, prof["seconds"])
+
+        self.assertEqual(1, prof["callbacks"]["propose_grounding"]["calls"])
+        self.assertLess(0, prof["callbacks"]["node_match"]["calls"])
+        self.assertLess(0, prof["callbacks"]["clause_match"]["accepted"])
+        clause = InheritanceLink(VariableNode("x"), ConceptNode("animal"))
+        self.assertEqual(1, prof["clauses"][clause]["accepted"])
+        self.assertEqual({}, prof["evaluations"])
+
+    def test_evaluations(self):
+        low = EvaluationLink(GroundedPredicateNode("py: low_number"),
+                             ListLink(VariableNode("x")))
+        query = GetLink(VariableNode("x"),
+            AndLink(InheritanceLink(VariableNode("x"), ConceptNode("animal")),
+                    low))
+
+        # Explaining does not run anything.
+        self.space.explain(query)
+        self.assertEqual([], calls)
+
+        prof = self.space.profile(query)
+        self.assertEqual(5, len(prof["result"].out))
+        self.assertEqual(10, len(calls))
+        self.assertEqual(10, prof["evaluations"][low]["calls"])
+        self.assertEqual(5, prof["evaluations"][low]["accepted"])
+        self.assertEqual(10, prof["callbacks"]["evaluate_sentence"]["calls"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+
+from opencog.atomspace import AtomSpace, search_planner
+from opencog.type_constructors import *
+from opencog.utilities import initialize_opencog, finalize_opencog
+
+
+class SearchPlannerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.space = AtomSpace()
+        initialize_opencog(self.space)
+        # "likes" is in fewer links than "pizza", but "pizza" is in
+        # only one ListLink; the rest are InheritanceLinks.
+        for i in range(10):
+            EvaluationLink(PredicateNode("likes"),
+                           ListLink(ConceptNode("person" + str(i)),
+                                    ConceptNode("salad")))
+        EvaluationLink(PredicateNode("likes"),
+                       ListLink(ConceptNode("person10"),
+                                ConceptNode("pizza")))
+        for i in range(20):
+            InheritanceLink(ConceptNode("pizza"),
+                            ConceptNode("food" + str(i)))
+        for i in range(0, 11, 2):
+            InheritanceLink(ConceptNode("person" + str(i)),
+                            ConceptNode("adult"))
+
+    def tearDown(self):
+        finalize_opencog()
+        del self.space
+
+    def likes(self, food):
+        return EvaluationLink(PredicateNode("likes"),
+                              ListLink(VariableNode("x"), ConceptNode(food)))
+
+    def test_start(self):
+        query = GetLink(VariableNode("x"), self.likes("pizza"))
+
+        plan = self.space.explain(query)
+        self.assertEqual(PredicateNode("likes"), plan[0]["start"])
+        # Ten links, the answer, and the query itself.
+        self.assertEqual(12, plan[0]["candidates"])
+
+        with search_planner("cost"):
+            plan = self.space.explain(query)
+        self.assertEqual(ConceptNode("pizza"), plan[0]["start"])
+        self.assertEqual(2, plan[0]["candidates"])
+
+        # Back to the default.
+        plan = self.space.explain(query)
+        self.assertEqual(PredicateNode("likes"), plan[0]["start"])
+
+    def test_same_results(self):
+        queries = [
+            GetLink(VariableNode("x"), self.likes("pizza")),
+            GetLink(VariableNode("x"),
+                AndLink(self.likes("salad"),
+                        InheritanceLink(VariableNode("x"),
+                                        ConceptNode("adult")))),
+            GetLink(VariableList(VariableNode("x"), VariableNode("y"),
+                                 VariableNode("z")),
+                AndLink(
+                    EvaluationLink(PredicateNode("likes"),
+                                   ListLink(VariableNode("x"),
+                                            VariableNode("y"))),
+                    InheritanceLink(VariableNode("y"), VariableNode("z")),
+                    InheritanceLink(VariableNode("x"),
+                                    ConceptNode("adult")))),
+        ]
+        for query in queries:
+            legacy = set(self.space.execute(query).out)
+            with search_planner("cost"):
+                cost = set(self.space.execute(query).out)
+                parallel = set(self.space.execute(query, parallel=4).out)
+            self.assertTrue(legacy)
+            self.assertEqual(legacy, cost)
+            self.assertEqual(legacy, parallel)
+
+    def test_nesting(self):
+        query = GetLink(VariableNode("x"), self.likes("pizza"))
+        with search_planner("cost"):
+            with search_planner("legacy"):
+                plan = self.space.explain(query)
+                self.assertEqual(PredicateNode("likes"), plan[0]["start"])
+            plan = self.space.explain(query)
+            self.assertEqual(ConceptNode("pizza"), plan[0]["start"])
+
+        with self.assertRaises(ValueError):
+            with search_planner("fastest"):
+                pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -146,6 +146,36 @@ class BindlinkTest(unittest.TestCase):
             )
         self.assertEquals(result, list_link)
 
+    def test_execute_batch(self):
+        test_functions.batch_calls = 0
+        result = ExecutionOutputLink(
+                    GroundedSchemaNode("py-batch: test_functions.add_links"),
+                    ListLink(
+                        ListLink(ConceptNode("one"), ConceptNode("two")),
+                        ConceptNode("three")
+                    )
+                ).execute()
+        self.assertEqual(test_functions.batch_calls, 1)
+        self.assertEqual(result.to_list(),
+                         [ListLink(ConceptNode("one"), ConceptNode("two")),
+                          ListLink(ConceptNode("three"))])
+
+        # Query results are passed as a single batch.
+        result = ExecutionOutputLink(
+                    GroundedSchemaNode("py-batch: test_functions.add_links"),
+                    self.getlink_atom
+                ).execute()
+        self.assertEqual(test_functions.batch_calls, 2)
+        self.assertEqual(set(result.to_list()),
+                         {ListLink(ConceptNode("Frog")),
+                          ListLink(ConceptNode("Zebra")),
+                          ListLink(ConceptNode("Deer"))})
+
+    def test_predicate_batch(self):
+        # A batch of results is not a TruthValue.
+        with self.assertRaises(RuntimeError):
+            GroundedPredicateNode("py-batch: test_functions.add_links")
+
     def test_evaluate_atom(self):
         result = evaluate_atom(self.atomspace,
                 EvaluationLink(
@@ -158,6 +188,24 @@ class BindlinkTest(unittest.TestCase):
             )
         self.assertEquals(result, TruthValue(0.6, 0.234))
 
+    def test_rebound_function(self):
+        evaluation = EvaluationLink(
+                GroundedPredicateNode("py: test_functions.bogus_tv"),
+                ListLink(ConceptNode("one"), ConceptNode("two")))
+        self.assertEqual(evaluate_atom(self.atomspace, evaluation),
+                         TruthValue(0.6, 0.234))
+
+        # The cached lookup must not outlive the binding.
+        bogus_tv = test_functions.bogus_tv
+        test_functions.bogus_tv = lambda one, two: TruthValue(0.3, 0.5)
+        try:
+            self.assertEqual(evaluate_atom(self.atomspace, evaluation),
+                             TruthValue(0.3, 0.5))
+        finally:
+            test_functions.bogus_tv = bogus_tv
+        self.assertEqual(evaluate_atom(self.atomspace, evaluation),
+                         TruthValue(0.6, 0.234))
+
     def test_execute_atom_no_return_value(self):
         result = PutLink(DeleteLink(VariableNode("X")),
                         ConceptNode("deleteme")).execute()
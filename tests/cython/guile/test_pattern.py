@@ -4,7 +4,10 @@ from opencog.atomspace import AtomSpace, Atom
 from opencog.type_constructors import TruthValue
 from opencog.atomspace import types, is_a, get_type, get_type_name
 from opencog.scheme import scheme_eval, scheme_eval_h
+from opencog.scheme import scheme_compile, scheme_eval_many, scheme_eval_py
+from opencog.scheme import scheme_pool_configure, scheme_pool_stats
 import os
+import threading
 
 
 # We are poking atoms into this from the scm files, so we want
@@ -96,6 +99,108 @@ class SchemeTest(TestCase):
         self.assertTrue(a2)
         self.assertEquals(a2, again)
 
+    def test_e_compiled(self):
+        compiled = scheme_compile('(ConceptNode "compiled")')
+        a1 = compiled(self.space)
+        self.assertEqual(a1, self.space.add_node(types.ConceptNode, "compiled"))
+        self.assertEqual(a1, compiled(self.space))
+
+        # With parameters; and against a different atomspace.
+        inh = scheme_compile('(Inheritance x y)', ["x", "y"])
+        other = AtomSpace()
+        cat = other.add_node(types.ConceptNode, "cat")
+        animal = other.add_node(types.ConceptNode, "animal")
+        link = inh(other, cat, animal)
+        self.assertEqual(link.type, types.InheritanceLink)
+        self.assertEqual(link.out, [cat, animal])
+        self.assertTrue(other.is_link_in_atomspace(types.InheritanceLink,
+                                                   [cat, animal]))
+        self.assertRaises(TypeError, inh, other, cat)
+        self.assertRaises(RuntimeError, scheme_compile, '(Concept "x"')
+
+    def test_f_eval_many(self):
+        results = scheme_eval_many(self.space,
+            ['(ConceptNode "many-1")', '(ConceptNode "many-2")'])
+        self.assertEqual(results,
+            [self.space.add_node(types.ConceptNode, "many-1"),
+             self.space.add_node(types.ConceptNode, "many-2")])
+        self.assertRaises(RuntimeError, scheme_eval_many, self.space,
+            ['(ConceptNode "many-3")', '(no-such-function)'])
+        # Incomplete input is an error, too.
+        self.assertRaises(RuntimeError, scheme_eval_many, self.space,
+            ['(ConceptNode "many-4")', '(ConceptNode "many-5"'])
+
+    def test_g_eval_py(self):
+        self.assertEqual(scheme_eval_py(self.space, "(+ 2 2)"), 4)
+        self.assertEqual(scheme_eval_py(self.space, "(expt 2 100)"), 2 ** 100)
+        self.assertEqual(scheme_eval_py(self.space, "(/ 1 4)"), 0.25)
+        self.assertEqual(scheme_eval_py(self.space, "#t"), True)
+        self.assertEqual(scheme_eval_py(self.space, '"foo"'), "foo")
+        self.assertEqual(scheme_eval_py(self.space, "'bar"), "bar")
+        self.assertEqual(scheme_eval_py(self.space, "'()"), [])
+        self.assertEqual(scheme_eval_py(self.space,
+            "(list 1 2.5 (vector 3 \"x\") (cons 4 5))"),
+            [1, 2.5, [3, "x"], (4, 5)])
+        self.assertIsNone(scheme_eval_py(self.space, "(if #f #f)"))
+
+        atom = scheme_eval_py(self.space, '(list (ConceptNode "py") (FloatValue 1 2))')
+        self.assertEqual(atom[0], self.space.add_node(types.ConceptNode, "py"))
+        self.assertEqual(atom[1].to_list(), [1, 2])
+        self.assertRaises(RuntimeError, scheme_eval_py, self.space, "(no-such-function)")
+
+    def test_h_pool(self):
+        scheme_pool_configure(2, ["(opencog)"])
+        try:
+            self.assertEqual(len(scheme_pool_stats()), 2)
+
+            def work(n):
+                for i in range(20):
+                    scheme_eval_h(self.space,
+                        '(ConceptNode "pooled-{0}-{1}")'.format(n, i))
+
+            threads = [threading.Thread(target=work, args=(n,))
+                       for n in range(4)]
+            for t in threads: t.start()
+            for t in threads: t.join()
+
+            stats = scheme_pool_stats()
+            self.assertEqual(sum(st["calls"] for st in stats), 80)
+            self.assertFalse(any(st["in_use"] for st in stats))
+            self.assertTrue(self.space.add_node(types.ConceptNode, "pooled-3-19"))
+        finally:
+            scheme_pool_configure(0)
+        self.assertEqual(scheme_pool_stats(), [])
+        self.assertRaises(RuntimeError, scheme_pool_configure, 1,
+                          ["no-such-file.scm"])
+
+    def test_i_pool_warm(self):
+        # Each pooled evaluator gets the init, and the modules; not
+        # just the first one created.
+        scheme_pool_configure(2, ["(opencog exec)"])
+        try:
+            barrier = threading.Barrier(2)
+            results = []
+
+            def work():
+                barrier.wait()
+                # Long enough for both calls to hold an evaluator.
+                results.append(scheme_eval_h(self.space,
+                    '(begin (usleep 300000)'
+                    '  (if (cog-atomspace? cog-initial-as)'
+                    '    (cog-execute! (PlusLink (NumberNode 1) (NumberNode 2)))'
+                    '    (ConceptNode "cold")))'))
+
+            threads = [threading.Thread(target=work) for _ in range(2)]
+            for t in threads: t.start()
+            for t in threads: t.join()
+
+            self.assertEqual([st["calls"] for st in scheme_pool_stats()],
+                             [1, 1])
+            self.assertEqual(len(results), 2)
+            for result in results:
+                self.assertEqual(result.type, types.NumberNode)
+        finally:
+            scheme_pool_configure(0)
 
     # Run the pattern-matcher/unifier/query-engine.
     def test_unifier(self):
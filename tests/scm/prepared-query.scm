@@ -0,0 +1,52 @@
+;
+; prepared-query.scm -- Unit test for cog-prepare-query
+;
+(use-modules (opencog))
+(use-modules (opencog exec))
+(use-modules (opencog test-runner))
+
+; ---------------------------------------------------------------------
+(opencog-test-runner)
+(define tname "prepared_query")
+(test-begin tname)
+
+(Inheritance (Concept "cat") (Concept "animal"))
+(Inheritance (Concept "dog") (Concept "animal"))
+(Inheritance (Concept "oak") (Concept "plant"))
+
+(define who-is-a (cog-prepare-query
+	(Get
+		(VariableList
+			(Variable "$who")
+			(TypedVariable (Variable "$what") (Type "ConceptNode")))
+		(Inheritance (Variable "$who") (Variable "$what")))
+	(Variable "$what")))
+
+; The same prepared query, grounded two different ways.
+(test-assert "animals"
+	(equal? (who-is-a (Concept "animal"))
+		(Set (Concept "cat") (Concept "dog"))))
+(test-assert "plants"
+	(equal? (who-is-a (Concept "plant")) (Set (Concept "oak"))))
+(test-assert "rocks"
+	(equal? (who-is-a (Concept "rock")) (Set)))
+
+; ----------
+; A rewrite, with the parameter in it.
+(define kind-of (cog-prepare-query
+	(Query
+		(VariableList (Variable "$who") (Variable "$what"))
+		(Present (Inheritance (Variable "$who") (Variable "$what")))
+		(List (Variable "$who") (Variable "$what")))
+	(Variable "$who")))
+
+(test-assert "cat"
+	(equal? (cog-value->list (kind-of (Concept "cat")))
+		(list (List (Concept "cat") (Concept "animal")))))
+(test-assert "oak"
+	(equal? (cog-value->list (kind-of (Concept "oak")))
+		(list (List (Concept "oak") (Concept "plant")))))
+
+(test-end tname)
+
+(opencog-test-end)